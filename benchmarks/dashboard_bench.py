@@ -0,0 +1,243 @@
+# Benchmark end-to-end halaman Adventure Works dan IMDB pada data sintetis
+# (lihat benchmarks/synthetic.py). Setiap halaman diukur per tahap:
+#   load      - extract SQLite -> SalesStore / Arrow dataset IMDB
+#   filter    - seleksi baris untuk filter sidebar
+#   aggregate - KPI dan agregat chart
+#   figures   - build_charts / build_figures (termasuk agregasinya sendiri)
+#   serialize - fig.to_json() semua figure (ukuran payload ikut dicatat)
+# Hasil ditulis sebagai JSON supaya bisa dibandingkan antar versi:
+#
+#   python benchmarks/dashboard_bench.py --rows 10000 100000 1000000 --output results.json
+#   python benchmarks/dashboard_bench.py --rows 10000 100000 --compare results.json
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic import ensure_datasets, COUNTRIES  # noqa: E402
+
+PAGES = ["adventure_works", "imdb"]
+
+
+def configure_secrets(db_url, mode):
+    # page.db membaca konfigurasi dari st.secrets saat import; arahkan ke file sementara
+    from streamlit import config
+    path = os.path.join(tempfile.mkdtemp(prefix="dashboard_bench_"), "secrets.toml")
+    with open(path, "w") as f:
+        f.write(
+            'DB_HOST = "benchmark"\nDB_DATABASE = "benchmark"\nDB_USER = "benchmark"\nDB_PASS = "benchmark"\n'
+            f'DB_URL = "{db_url}"\nDB_MODE = "{mode}"\nREFRESH_INTERVAL = 0\nSNAPSHOT_DIR = ""\n'
+        )
+    config.set_option("secrets.files", [path])
+
+
+def timed(func, repeat):
+    timings, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def record(results, page, mode, rows, stage, timings, **extra):
+    results.append({
+        "page": page,
+        "mode": mode,
+        "rows": rows,
+        "stage": stage,
+        "repeat": len(timings),
+        "best_s": min(timings),
+        "median_s": statistics.median(timings),
+        "extra": extra,
+    })
+    print(f"{page:<16} {mode:<9} {rows:>11,} {stage:<10} {min(timings) * 1000:>12.1f} ms  {extra or ''}")
+
+
+def serialize(figures):
+    return {name: fig.to_json() for name, fig in figures.items()}
+
+
+def bench_adventure_works(db_path, rows, mode, repeat, results):
+    from sqlalchemy import create_engine
+    db_url = f"sqlite:///{db_path}"
+    configure_secrets(db_url, mode)
+
+    import page.db as db
+    from page.cube import cube_charts
+    from page.filters import select_positions
+    from page.aggregate import aggregate_customers
+    from page.queries import extract_query, customer_names_query, distinct_values, query_charts
+    from page.refresh import SalesStore
+
+    # Modul page.db di-import sekali; engine/store diganti per dataset
+    db.DB_MODE = mode
+    db.engine = create_engine(db_url)
+    db.query = extract_query(db.engine)
+
+    def load_store():
+        store = SalesStore(db.engine, db.query, 0, customer_names_query(db.engine), None, db.LOAD_CHUNKSIZE)
+        store.load()
+        return store
+
+    if mode == "pushdown":
+        timings, (years, countries) = timed(lambda: distinct_values(db.engine), repeat)
+        record(results, "adventure_works", mode, rows, "load", timings)
+        years, countries = years[:2], countries[:3]
+        df = cube = index = None
+        timings, _ = timed(lambda: query_charts(db.engine, years, countries), repeat)
+        record(results, "adventure_works", mode, rows, "aggregate", timings)
+    else:
+        # Load mahal untuk data besar, jadi hanya diukur sekali
+        timings, db.store = timed(load_store, 1)
+        df, cube, index = db.store.snapshot()
+        record(results, "adventure_works", mode, rows, "load", timings,
+               bytes_per_row=round(float(df.memory_usage(deep=True).sum()) / max(len(df), 1), 1))
+
+        years = sorted(df["Year"].dropna().unique().tolist())[:2]
+        countries = COUNTRIES[:3]
+        selections = {"Year": years, "SalesTerritoryCountry": countries}
+        timings, positions = timed(lambda: select_positions(index, selections), repeat)
+        record(results, "adventure_works", mode, rows, "filter", timings, selected=int(len(positions)))
+
+        codes = index["codes"]["CustomerKey"]
+        timings, _ = timed(lambda: (cube_charts(cube, years, countries),
+                                    aggregate_customers(df, codes, positions, db.store.customers)), repeat)
+        record(results, "adventure_works", mode, rows, "aggregate", timings)
+
+    timings, (_, figures) = timed(lambda: db.build_charts(df, cube, index, years, countries), repeat)
+    record(results, "adventure_works", mode, rows, "figures", timings)
+
+    timings, specs = timed(lambda: serialize(figures), repeat)
+    record(results, "adventure_works", mode, rows, "serialize", timings,
+           payload_bytes=sum(len(spec) for spec in specs.values()))
+
+
+def bench_imdb(dataset_path, rows, repeat, results):
+    cwd = os.getcwd()
+    os.chdir(ROOT)  # page.imdb membaca ./data/imdb.arrow saat import
+    try:
+        import page.imdb as imdb
+        import page.movies as movie_data
+    finally:
+        os.chdir(cwd)
+
+    def load():
+        movies = movie_data.load_movies(dataset_path)
+        return movies, movie_data.build_movie_index(movies)
+
+    timings, (movies, index) = timed(load, 1)
+    record(results, "imdb", "extract", rows, "load", timings)
+
+    years = movies["Year"].to_numpy()
+    min_year, max_year = int(np.percentile(years, 25)), int(np.percentile(years, 75))
+    ratings = movies["Rating"].unique().tolist()
+    timings, filtered = timed(lambda: movie_data.select_movies(movies, index, min_year, max_year, ratings), repeat)
+    record(results, "imdb", "extract", rows, "filter", timings, selected=len(filtered))
+
+    timings, _ = timed(lambda: imdb.aggregate_movies(filtered), repeat)
+    record(results, "imdb", "extract", rows, "aggregate", timings)
+
+    timings, (_, figures) = timed(lambda: imdb.build_figures(filtered), repeat)
+    record(results, "imdb", "extract", rows, "figures", timings)
+
+    timings, specs = timed(lambda: serialize(figures), repeat)
+    record(results, "imdb", "extract", rows, "serialize", timings,
+           payload_bytes=sum(len(spec) for spec in specs.values()))
+
+
+def environment():
+    import pandas as pd
+    import plotly
+    import streamlit
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "plotly": plotly.__version__,
+        "streamlit": streamlit.__version__,
+    }
+
+
+def compare(results, baseline_path, threshold, min_seconds):
+    # Regresi: tahap yang lebih lambat dari baseline x threshold (tahap < min_seconds diabaikan)
+    with open(baseline_path) as f:
+        baseline = {(r["page"], r["mode"], r["rows"], r["stage"]): r for r in json.load(f)["results"]}
+    regressions = []
+    print(f"\n{'page':<16} {'mode':<9} {'rows':>11} {'stage':<10} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for result in results:
+        key = (result["page"], result["mode"], result["rows"], result["stage"])
+        if key not in baseline:
+            continue
+        before, after = baseline[key]["best_s"], result["best_s"]
+        ratio = after / before if before else float("inf")
+        flag = ""
+        if ratio > threshold and max(before, after) >= min_seconds:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key[0]:<16} {key[1]:<9} {key[2]:>11,} {key[3]:<10} {before * 1000:>12.1f} {after * 1000:>12.1f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard pages on synthetic data")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--pages", nargs="+", choices=PAGES, default=PAGES)
+    parser.add_argument("--mode", choices=["extract", "pushdown"], default="extract",
+                        help="DB_MODE halaman Adventure Works")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data", default=os.path.join(ROOT, "benchmarks", "data"),
+                        help="folder dataset sintetis (dipakai ulang antar run)")
+    parser.add_argument("--output", help="tulis hasil JSON ke file ini (default: stdout)")
+    parser.add_argument("--compare", help="hasil JSON sebelumnya sebagai baseline")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--min-seconds", type=float, default=0.05)
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'page':<16} {'mode':<9} {'rows':>11} {'stage':<10} {'best':>15}")
+    for rows in args.rows:
+        aw_path, imdb_path = ensure_datasets(args.data, rows, args.seed, args.pages)
+        if "adventure_works" in args.pages:
+            bench_adventure_works(aw_path, rows, args.mode, args.repeat, results)
+        if "imdb" in args.pages:
+            bench_imdb(imdb_path, rows, args.repeat, results)
+
+    report = {"environment": environment(), "seed": args.seed, "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Hasil ditulis ke {args.output}")
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold, args.min_seconds)
+        if regressions:
+            print(f"{len(regressions)} tahap lebih lambat dari {args.threshold}x baseline")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
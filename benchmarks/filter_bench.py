@@ -0,0 +1,84 @@
+# Membandingkan latency filter_df lama (df.query dari string) dengan bitmap index
+# di page.filters pada data sintetis berbentuk extract Adventure Works.
+#
+#   python benchmarks/filter_bench.py --rows 1000000 10000000
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page.filters import build_index, take_rows  # noqa: E402
+
+YEARS = [2010, 2011, 2012, 2013, 2014]
+COUNTRIES = ["Australia", "Canada", "France", "Germany", "United Kingdom", "United States"]
+GENDERS = ["M", "F"]
+CATEGORIES = ["Bikes", "Accessories", "Clothing"]
+
+
+def make_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "Year": rng.choice(YEARS, rows),
+        "SalesTerritoryCountry": rng.choice(COUNTRIES, rows).astype(object),
+        "Gender": rng.choice(GENDERS, rows).astype(object),
+        "EnglishProductCategoryName": rng.choice(CATEGORIES, rows).astype(object),
+        "SalesAmount": rng.uniform(2, 3500, rows),
+        "OrderQuantity": np.ones(rows, dtype=np.int64),
+    })
+
+
+def filter_df_query(df, year_list=None, country_list=None, gender_list=None, category_list=None):
+    # Implementasi filter_df sebelum bitmap index
+    query_str = " & ".join([
+        f"Year == {year_list}" if year_list is not None else '',
+        f"SalesTerritoryCountry == {country_list}" if country_list is not None else '',
+        f"Gender == {gender_list}" if gender_list is not None else '',
+        f"EnglishProductCategoryName == {category_list}" if category_list is not None else ''
+    ]).strip(' & ')
+    return df.query(query_str)
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+SCENARIOS = {
+    "all years + countries": (YEARS, COUNTRIES),
+    "2 years, 3 countries": ([2012, 2013], ["Canada", "France", "Germany"]),
+    "1 year, 1 country": ([2013], ["Australia"]),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark filter_df: df.query vs bitmap index")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>11} {'scenario':<24} {'df.query ms':>12} {'index ms':>10} {'speedup':>8}")
+    for rows in args.rows:
+        df = make_frame(rows)
+        start = time.perf_counter()
+        index = build_index(df)
+        build_ms = (time.perf_counter() - start) * 1000
+        print(f"{rows:>11,} {'(index build)':<24} {'':>12} {build_ms:>10.1f}")
+        for name, (years, countries) in SCENARIOS.items():
+            query_time, expected = best_of(lambda: filter_df_query(df, years, countries), args.repeat)
+            index_time, result = best_of(
+                lambda: take_rows(df, index, {"Year": years, "SalesTerritoryCountry": countries}), args.repeat)
+            assert result.index.equals(expected.index)
+            print(f"{rows:>11,} {name:<24} {query_time * 1000:>12.1f} {index_time * 1000:>10.1f} {query_time / index_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
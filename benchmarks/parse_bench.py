@@ -0,0 +1,96 @@
+# Throughput parser halaman IMDb pada halaman yang sudah tersimpan: parser
+# BeautifulSoup lama (scraper.parse), fallback lxml dan ekstraksi terstruktur
+# (__NEXT_DATA__ / JSON-LD) di scraper.extract. Hasil tiap parser dibandingkan
+# dengan parser lama supaya perbedaan field langsung terlihat.
+#
+#   python benchmarks/parse_bench.py                          # semua halaman di data/http_cache
+#   python benchmarks/parse_bench.py --pages fixtures/ --repeat 5 --output parse.json
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper import extract, parse  # noqa: E402
+
+BASE_URL = "https://www.imdb.com/chart/top/"
+
+
+def load_pages(pages_dir, cache_dir):
+    # Folder berisi *.html, atau objek di cache scraper (scrape_imdb.py --cache-dir)
+    if pages_dir:
+        paths = sorted(glob.glob(os.path.join(pages_dir, "**", "*.html"), recursive=True))
+    else:
+        paths = sorted(glob.glob(os.path.join(cache_dir, "objects", "*", "*")))
+    pages = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        if extract.has_detail_data(html):
+            pages.append(("detail", html))
+        elif "chartTitles" in html or "cli-title-metadata-item" in html or '"ItemList"' in html:
+            pages.append(("chart", html))
+    return pages
+
+
+def parsers():
+    chart = {"beautifulsoup": lambda html: parse.parse_chart(html, BASE_URL),
+             "structured": lambda html: extract.extract_chart(html, BASE_URL)}
+    detail = {"beautifulsoup": parse.parse_detail, "structured": extract.extract_detail}
+    if extract.lxml_html is not None:
+        chart["lxml"] = lambda html: extract.chart_from_lxml(html, BASE_URL)
+        detail["lxml"] = extract.detail_from_lxml
+    return {"chart": chart, "detail": detail}
+
+
+def comparable(kind, result):
+    # URL chart berbeda query string antar sumber; bandingkan field datanya saja
+    if kind == "chart":
+        return [{key: movie[key] for key in ("Name", "Year", "Durasi(Menit)", "Rating")} for movie in result]
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parser halaman IMDb")
+    parser.add_argument("--pages", help="folder halaman .html tersimpan")
+    parser.add_argument("--cache-dir", default="data/http_cache", help="cache scrape_imdb.py (default jika --pages kosong)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="tulis hasil JSON ke file ini")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages, args.cache_dir)
+    if not pages:
+        sys.exit("Tidak ada halaman chart/detail IMDb yang ditemukan")
+
+    results = []
+    print(f"{'kind':<7} {'parser':<14} {'pages':>6} {'MB':>7} {'best s':>8} {'pages/s':>9} {'match':>7}")
+    for kind, candidates in parsers().items():
+        htmls = [html for page_kind, html in pages if page_kind == kind]
+        if not htmls:
+            continue
+        megabytes = sum(len(html.encode("utf-8")) for html in htmls) / 1e6
+        reference = [comparable(kind, candidates["beautifulsoup"](html)) for html in htmls]
+        for name, func in candidates.items():
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                output = [func(html) for html in htmls]
+                timings.append(time.perf_counter() - start)
+            best = min(timings)
+            matches = sum(comparable(kind, result) == expected for result, expected in zip(output, reference))
+            results.append({"kind": kind, "parser": name, "pages": len(htmls), "megabytes": round(megabytes, 3),
+                            "best_s": best, "pages_per_s": len(htmls) / best, "matches": matches})
+            print(f"{kind:<7} {name:<14} {len(htmls):>6} {megabytes:>7.1f} {best:>8.3f} {len(htmls) / best:>9.0f} "
+                  f"{matches:>3}/{len(htmls):<3}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"lxml": extract.lxml_html is not None, "results": results}, f, indent=2)
+        print(f"Hasil ditulis ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
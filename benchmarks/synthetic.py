@@ -0,0 +1,227 @@
+# Generator data sintetis untuk benchmark dashboard:
+#   - database SQLite berbentuk Adventure Works (factinternetsales + dimensi yang di-join
+#     oleh query extract di page.queries), sebagai stand-in lokal MySQL
+#   - dataset Arrow IMDB berbentuk data/imdb.arrow (schema scraper.dataset)
+#   - dump TSV title.basics / title.ratings dengan layout datasets.imdbws.com
+#     untuk ingest_imdb.py (--tsv)
+#
+#   python benchmarks/synthetic.py --rows 10000 1000000 --out benchmarks/data
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scraper.dataset import write_dataset  # noqa: E402
+
+COUNTRIES = ["Australia", "Canada", "France", "Germany", "United Kingdom", "United States"]
+CATEGORIES = ["Bikes", "Accessories", "Clothing"]
+SUBCATEGORIES = 37
+PRODUCTS = 606
+INCOMES = [10000, 20000, 30000, 40000, 60000, 70000, 80000, 90000, 100000, 110000, 120000, 130000, 150000, 160000, 170000]
+FIRST_DATE = np.datetime64("2010-12-29")
+DAYS = 1300
+ROWS_PER_ORDER = 3
+
+RATINGS = ["R", "PG", "PG-13", "G", "Not Rated", "Approved", "Passed"]
+COLORS = ["Color", "Black and White", "Color (Technicolor)", "Color (Eastmancolor)"]
+SOUND_MIXES = ["Dolby Digital", "Mono", "DTS", "Dolby", "Stereo", "Dolby Atmos"]
+ASPECT_RATIOS = ["1.85 : 1", "2.39 : 1", "1.37 : 1", "2.35 : 1", "1.66 : 1", "2.20 : 1"]
+
+IMDB_COLUMNS = ['Name', 'Year', 'Durasi(Menit)', 'Rating', 'Budget', 'Gross_US', 'Opening_Week',
+                'Open_Week_Date', 'Gross_World', 'Color', 'Sound_Mix', 'Aspect_Ratio']
+
+_SCHEMA = """
+DROP TABLE IF EXISTS factinternetsales;
+DROP TABLE IF EXISTS dimsalesterritory;
+DROP TABLE IF EXISTS dimcustomer;
+DROP TABLE IF EXISTS dimproduct;
+DROP TABLE IF EXISTS dimproductsubcategory;
+DROP TABLE IF EXISTS dimproductcategory;
+CREATE TABLE dimsalesterritory(SalesTerritoryKey INTEGER PRIMARY KEY, SalesTerritoryCountry TEXT);
+CREATE TABLE dimcustomer(CustomerKey INTEGER PRIMARY KEY, FirstName TEXT, LastName TEXT, Gender TEXT, YearlyIncome REAL);
+CREATE TABLE dimproductcategory(ProductCategoryKey INTEGER PRIMARY KEY, EnglishProductCategoryName TEXT);
+CREATE TABLE dimproductsubcategory(ProductSubcategoryKey INTEGER PRIMARY KEY, ProductCategoryKey INTEGER);
+CREATE TABLE dimproduct(ProductKey INTEGER PRIMARY KEY, ProductSubcategoryKey INTEGER);
+CREATE TABLE factinternetsales(
+    SalesOrderNumber TEXT, SalesOrderLineNumber INTEGER, OrderDate TEXT, ProductKey INTEGER,
+    CustomerKey INTEGER, SalesTerritoryKey INTEGER, SalesAmount REAL, OrderQuantity INTEGER, TotalProductCost REAL
+);
+"""
+
+
+def customers_for(rows):
+    # Jumlah customer tumbuh sublinear terhadap baris fakta (AW asli: ~18k customer / 60k baris)
+    return int(min(max(rows // 3, 100), 500_000))
+
+
+def make_adventure_works(path, rows, seed=0, batch=500_000):
+    rng = np.random.default_rng(seed)
+    customers = customers_for(rows)
+    if os.path.exists(path):
+        os.remove(path)
+    connection = sqlite3.connect(path)
+    connection.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + _SCHEMA)
+
+    connection.executemany("INSERT INTO dimsalesterritory VALUES (?, ?)",
+                           [(key, country) for key, country in enumerate(COUNTRIES, start=1)])
+    connection.executemany("INSERT INTO dimproductcategory VALUES (?, ?)",
+                           [(key, category) for key, category in enumerate(CATEGORIES, start=1)])
+    connection.executemany("INSERT INTO dimproductsubcategory VALUES (?, ?)",
+                           [(key, key % len(CATEGORIES) + 1) for key in range(1, SUBCATEGORIES + 1)])
+    # Beberapa produk tanpa subkategori, seperti di AW asli (menghasilkan kategori NULL)
+    connection.executemany("INSERT INTO dimproduct VALUES (?, ?)",
+                           [(key, key % SUBCATEGORIES + 1 if key % 50 else None) for key in range(1, PRODUCTS + 1)])
+
+    genders = rng.choice(["M", "F"], customers)
+    incomes = rng.choice(INCOMES, customers).astype(float)
+    connection.executemany("INSERT INTO dimcustomer VALUES (?, ?, ?, ?, ?)", (
+        (key, f"First{key}", f"Last{key}", str(gender), float(income))
+        for key, gender, income in zip(range(1, customers + 1), genders, incomes)
+    ))
+
+    # Order diurutkan menurut tanggal supaya watermark refresh sama seperti data asli
+    for start in range(0, rows, batch):
+        stop = min(start + batch, rows)
+        n = stop - start
+        positions = np.arange(start, stop)
+        dates = (FIRST_DATE + (positions * DAYS // max(rows, 1)).astype("timedelta64[D]")).astype(str)
+        orders = 43697 + positions // ROWS_PER_ORDER
+        lines = positions % ROWS_PER_ORDER + 1
+        products = rng.integers(1, PRODUCTS + 1, n)
+        customer_keys = rng.integers(1, customers + 1, n)
+        territories = rng.integers(1, len(COUNTRIES) + 1, n)
+        quantities = np.ones(n, dtype=np.int64)
+        amounts = np.round(rng.lognormal(4.5, 1.6, n).clip(2.29, 3578.27), 4)
+        costs = np.round(amounts * rng.uniform(0.35, 0.65, n), 4)
+        connection.executemany("INSERT INTO factinternetsales VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", zip(
+            (f"SO{order}" for order in orders.tolist()),
+            lines.tolist(),
+            (f"{date} 00:00:00" for date in dates.tolist()),
+            products.tolist(),
+            customer_keys.tolist(),
+            territories.tolist(),
+            amounts.tolist(),
+            quantities.tolist(),
+            costs.tolist(),
+        ))
+    connection.commit()
+    connection.close()
+    return path
+
+
+def make_imdb_frame(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    years = rng.integers(1920, 2024, rows)
+    budget = (rng.lognormal(16, 1.2, rows)).astype(np.int64)
+    gross_us = (budget * rng.lognormal(0.3, 0.9, rows)).astype(np.int64)
+    gross_world = gross_us + (gross_us * rng.uniform(0, 2.5, rows)).astype(np.int64)
+    opening = (gross_us * rng.uniform(0.01, 0.4, rows)).astype(np.int64)
+    open_dates = (np.datetime64("1920-01-01") + rng.integers(0, 37000, rows).astype("timedelta64[D]")).astype(str)
+
+    def optional(values):
+        # Kolom spesifikasi teknis kosong untuk sebagian film, seperti hasil scraping
+        picked = rng.choice(values, rows).astype(object)
+        picked[rng.random(rows) < 0.3] = None
+        return picked
+
+    return pd.DataFrame({
+        "Name": [f"Synthetic Movie {i}" for i in range(rows)],
+        "Year": years,
+        "Durasi(Menit)": rng.integers(70, 230, rows),
+        "Rating": rng.choice(RATINGS, rows),
+        "Budget": budget,
+        "Gross_US": gross_us,
+        "Opening_Week": opening,
+        "Open_Week_Date": np.char.add(open_dates, " 00:00:00"),
+        "Gross_World": gross_world,
+        "Color": optional(COLORS),
+        "Sound_Mix": optional(SOUND_MIXES),
+        "Aspect_Ratio": optional(ASPECT_RATIOS),
+    }, columns=IMDB_COLUMNS)
+
+
+def make_imdb_dataset(path, rows, seed=0):
+    # Tanpa filter outlier supaya jumlah baris sama dengan --rows
+    write_dataset(make_imdb_frame(rows, seed), path, limits={})
+    return path
+
+
+def make_imdb_tsvs(out_dir, rows, seed=0):
+    # Layout sama dengan dump IMDb: tab, \N untuk kosong, genre dipisah koma, gzip
+    rng = np.random.default_rng(seed)
+    tconsts = np.char.add("tt", np.char.zfill(np.arange(1, rows + 1).astype(str), 7))
+    title_types = rng.choice(["movie", "short", "tvEpisode", "tvSeries", "video"], rows, p=[0.3, 0.15, 0.4, 0.1, 0.05])
+    years = rng.integers(1894, 2026, rows).astype(str).astype(object)
+    years[rng.random(rows) < 0.05] = "\\N"
+    runtimes = rng.integers(1, 240, rows).astype(str).astype(object)
+    runtimes[rng.random(rows) < 0.3] = "\\N"
+    genres = np.array(["Drama", "Comedy", "Documentary", "Action,Crime,Drama", "Horror,Thriller", "\\N"])
+    basics = pd.DataFrame({
+        "tconst": tconsts,
+        "titleType": title_types,
+        "primaryTitle": [f"Synthetic Title {i}" for i in range(rows)],
+        "originalTitle": [f"Synthetic Title {i}" for i in range(rows)],
+        "isAdult": "0",
+        "startYear": years,
+        "endYear": "\\N",
+        "runtimeMinutes": runtimes,
+        "genres": rng.choice(genres, rows),
+    })
+    # Sekitar seperempat judul punya rating, seperti dump aslinya
+    rated = np.sort(rng.choice(rows, rows // 4, replace=False))
+    ratings = pd.DataFrame({
+        "tconst": tconsts[rated],
+        "averageRating": np.round(np.clip(rng.normal(6.8, 1.3, len(rated)), 1, 10), 1),
+        "numVotes": rng.pareto(1.2, len(rated)).astype(np.int64) * 5 + 5,
+    })
+    basics_path = os.path.join(out_dir, f"title.basics_{rows}_{seed}.tsv.gz")
+    ratings_path = os.path.join(out_dir, f"title.ratings_{rows}_{seed}.tsv.gz")
+    for frame, path in [(basics, basics_path), (ratings, ratings_path)]:
+        if not os.path.exists(path):
+            frame.to_csv(path + ".tmp", sep="\t", index=False, quoting=csv.QUOTE_NONE, compression="gzip")
+            os.replace(path + ".tmp", path)
+    return basics_path, ratings_path
+
+
+def dataset_paths(out_dir, rows, seed=0):
+    return (os.path.join(out_dir, f"adventure_works_{rows}_{seed}.db"),
+            os.path.join(out_dir, f"imdb_{rows}_{seed}.arrow"))
+
+
+def ensure_datasets(out_dir, rows, seed=0, pages=("adventure_works", "imdb")):
+    # Dataset dipakai ulang antar run selama jumlah baris dan seed sama
+    os.makedirs(out_dir, exist_ok=True)
+    aw_path, imdb_path = dataset_paths(out_dir, rows, seed)
+    if "adventure_works" in pages and not os.path.exists(aw_path):
+        print(f"Generating {aw_path} ...")
+        make_adventure_works(aw_path + ".tmp", rows, seed)
+        os.replace(aw_path + ".tmp", aw_path)
+    if "imdb" in pages and not os.path.exists(imdb_path):
+        print(f"Generating {imdb_path} ...")
+        make_imdb_dataset(imdb_path, rows, seed)
+    return aw_path, imdb_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic Adventure Works / IMDB datasets")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+    parser.add_argument("--tsv", action="store_true", help="buat dump TSV IMDb (title.basics/title.ratings)")
+    args = parser.parse_args()
+    for rows in args.rows:
+        if args.tsv:
+            os.makedirs(args.out, exist_ok=True)
+            print(make_imdb_tsvs(args.out, rows, args.seed))
+        else:
+            print(ensure_datasets(args.out, rows, args.seed))
+
+
+if __name__ == "__main__":
+    main()
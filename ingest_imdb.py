@@ -0,0 +1,36 @@
+# Ingest dump IMDb (title.basics.tsv.gz + title.ratings.tsv.gz dari
+# https://datasets.imdbws.com/) ke data/imdb_catalogue.arrow untuk halaman
+# IMDB Catalogue (lihat scraper/catalogue.py).
+#
+#   python ingest_imdb.py title.basics.tsv.gz title.ratings.tsv.gz
+#   python ingest_imdb.py basics.tsv.gz ratings.tsv.gz --title-types movie tvMovie --min-votes 100
+import argparse
+import time
+
+from scraper.catalogue import CATALOGUE_FILE, CHUNKSIZE, TITLE_TYPES, ingest_catalogue
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest dump TSV IMDb ke store Arrow")
+    parser.add_argument("basics", help="title.basics.tsv(.gz)")
+    parser.add_argument("ratings", help="title.ratings.tsv(.gz)")
+    parser.add_argument("--out", default=CATALOGUE_FILE)
+    parser.add_argument("--title-types", nargs="+", default=["movie"], choices=TITLE_TYPES + ["all"],
+                        help="titleType yang disimpan (default: movie)")
+    parser.add_argument("--min-votes", type=int, default=0, help="buang judul dengan vote lebih sedikit")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE, help="baris title.basics per chunk")
+    args = parser.parse_args()
+
+    title_types = None if "all" in args.title_types else args.title_types
+    start = time.perf_counter()
+
+    def progress(read, written):
+        print(f"{read:,} baris dibaca, {written:,} disimpan ({time.perf_counter() - start:.1f} detik)")
+
+    read, written = ingest_catalogue(args.basics, args.ratings, args.out, title_types, args.min_votes,
+                                     args.chunksize, progress)
+    print(f"Ditulis: {args.out} ({written:,} dari {read:,} judul) dalam {time.perf_counter() - start:.1f} detik")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import streamlit as st
 import sys
-import page as pg
+import importlib
+
+from page import profiling
 
 sys.path.append('dashboard')
 
@@ -8,11 +10,35 @@ st.set_page_config(page_title="Data Visualization Dashboard")
 
 st.sidebar.title(':bar_chart: Data Visualization Dashboard')
 st.sidebar.header("Jose Bagus Ramadhan (21082010206)")
-page = st.sidebar.radio("Go to", ["Adventure Works", "IMDB"])
+page = st.sidebar.radio("Go to", ["Adventure Works", "IMDB", "IMDB Catalogue"])
 
+# Halaman didaftarkan sebagai (modul, fungsi) dan baru di-import saat pertama kali dibuka,
+# sehingga data layer halaman lain (mis. koneksi database) tidak ikut dimuat.
+# Setelah itu modul tetap tersimpan di sys.modules.
 functions = {
-    "Adventure Works": pg.show_db,
-    "IMDB": pg.show_imdb,
+    "Adventure Works": ("page.db", "show_db"),
+    "IMDB": ("page.imdb", "show_imdb"),
+    "IMDB Catalogue": ("page.catalogue", "show_catalogue"),
 }
 
-functions[page]()
\ No newline at end of file
+module_name, function_name = functions[page]
+try:
+    module = importlib.import_module(module_name)
+except Exception as e:
+    st.error(f"Halaman {page} tidak dapat dimuat: {e}")
+    st.stop()
+
+# Instrumentasi per tahap hanya aktif jika DASHBOARD_PROFILE=1 atau ?debug=1
+if not profiling.enabled():
+    getattr(module, function_name)()
+else:
+    profiling.begin_rerun(page)
+    try:
+        with profiling.stage(function_name):
+            if st.session_state.get('profile_capture'):
+                profiling.run_with_cprofile(getattr(module, function_name))
+            else:
+                getattr(module, function_name)()
+    finally:
+        profile = profiling.end_rerun()
+    profiling.show_profile_panel(profile)
@@ -1,2 +1 @@
-from page.db import show_db
-from page.imdb import show_imdb
\ No newline at end of file
+# Modul halaman (page.db, page.imdb) di-import secara lazy oleh main.py
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+# Agregasi satu lintasan untuk semua KPI dan chart halaman Adventure Works.
+# Kunci grup difaktorisasi sekali menjadi kode integer, lalu setiap measure yang
+# dibutuhkan dijumlahkan dengan np.bincount per dimensi. Hasilnya satu "bundle"
+# yang dibaca oleh KPI box, chart 1-5 dan expander analisis.
+
+# Measure yang benar-benar dipakai per dimensi
+DIMENSION_MEASURES = {
+    "SalesTerritoryCountry": ["SalesAmount", "TotalProductCost"],
+    "Month": ["OrderQuantity"],
+    "EnglishProductCategoryName": ["OrderQuantity", "OrderCount"],
+    "Gender": ["OrderQuantity"],
+}
+
+
+def group_codes(series):
+    # Categorical sudah membawa kode; kolom lain difaktorisasi (terurut seperti groupby)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, labels = pd.factorize(series, sort=True)
+    return codes, labels
+
+
+def sum_by_codes(codes, n_groups, values=None):
+    valid = codes >= 0
+    weights = None if values is None else np.asarray(values, dtype=np.float64)[valid]
+    return np.bincount(codes[valid], weights=weights, minlength=n_groups)
+
+
+def _grouped(cells, dimension, measures, counts):
+    codes, labels = group_codes(cells[dimension])
+    columns = {measure: sum_by_codes(codes, len(labels), cells[measure].to_numpy()) for measure in measures}
+    # Hanya grup yang muncul di seleksi (setara groupby observed=True)
+    present = sum_by_codes(codes, len(labels), counts) > 0
+    frame = pd.DataFrame(columns, index=pd.Index(np.asarray(labels), name=dimension))[present]
+    if "OrderQuantity" in frame.columns:
+        frame["OrderQuantity"] = frame["OrderQuantity"].round().astype(np.int64)
+    if "OrderCount" in frame.columns:
+        frame["OrderCount"] = frame["OrderCount"].round().astype(np.int64)
+    return frame
+
+
+def aggregate_cells(cells):
+    # cells: potongan rollup cube (punya kolom OrderCount) atau baris mentah
+    if "OrderCount" not in cells.columns:
+        cells = cells.assign(OrderCount=cells["SalesAmount"].notna().astype(np.int64))
+    counts = cells["OrderCount"].to_numpy()
+
+    grouped = {dimension: _grouped(cells, dimension, measures, counts) for dimension, measures in DIMENSION_MEASURES.items()}
+
+    total_sales = int(counts.sum())
+    total_sales_amount = float(cells["SalesAmount"].to_numpy(dtype=np.float64).sum())
+    average_sales = total_sales_amount / total_sales if total_sales else float("nan")
+    category = grouped["EnglishProductCategoryName"]
+    top_category = category["OrderCount"].idxmax() if not category.empty else None
+
+    month = grouped["Month"].reset_index()
+    return {
+        "kpis": (total_sales, total_sales_amount, average_sales, top_category),
+        "country": grouped["SalesTerritoryCountry"],
+        "month": month[["Month", "OrderQuantity"]],
+        "category": category[["OrderQuantity"]],
+        "gender": grouped["Gender"],
+    }
+
+
+def aggregate_customers(df, customer_codes, positions=None, names=None):
+    # Total SalesAmount dan rata-rata YearlyIncome per customer untuk chart 5.
+    # customer_codes = (kode, label) hasil faktorisasi CustomerKey saat load.
+    codes, labels = customer_codes
+    sales = df["SalesAmount"].to_numpy(dtype=np.float64)
+    income = df["YearlyIncome"].to_numpy(dtype=np.float64)
+    if positions is not None:
+        codes, sales, income = codes[positions], sales[positions], income[positions]
+
+    n_groups = len(labels)
+    lines = sum_by_codes(codes, n_groups)
+    sales_total = sum_by_codes(codes, n_groups, np.nan_to_num(sales))
+    has_income = ~np.isnan(income)
+    income_total = sum_by_codes(np.where(has_income, codes, -1), n_groups, np.nan_to_num(income))
+    income_lines = sum_by_codes(np.where(has_income, codes, -1), n_groups)
+
+    present = lines > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        yearly_income = income_total / income_lines
+    keys = np.asarray(labels)[present]
+    chart = pd.DataFrame({
+        "CustomerKey": keys,
+        "SalesAmount": sales_total[present],
+        "YearlyIncome": yearly_income[present],
+    })
+    if names is not None:
+        chart.insert(0, "Customer", names.reindex(keys).to_numpy())
+    return chart
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+# Histogram yang dihitung di server: bin edges ditentukan sekali per dataset (seragam,
+# dari min/max seluruh data) sehingga batang tetap sebanding saat filter berubah, dan
+# yang dikirim ke browser hanya satu baris per bin, bukan nilai mentah per film.
+
+HISTOGRAM_BINS = 20
+
+
+def bin_edges(values, bins=HISTOGRAM_BINS, upper_quantile=1.0):
+    # upper_quantile < 1 memotong ekor panjang (mis. runtime ribuan menit) dari rentang bin
+    values = np.asarray(values, dtype=np.float64)
+    values = values[np.isfinite(values)]
+    low, high = (values.min(), np.quantile(values, upper_quantile)) if len(values) else (0.0, 1.0)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+def bin_counts(values, edges):
+    # Edges seragam: indeks bin dihitung langsung (tanpa binary search), nilai di edge
+    # terakhir masuk ke bin terakhir. Pembulatan float bisa menggeser nilai yang tepat
+    # di edge satu bin, jadi dikoreksi terhadap edges seperti np.histogram
+    values = np.asarray(values, dtype=np.float64)
+    values = values[(values >= edges[0]) & (values <= edges[-1])]
+    bins = len(edges) - 1
+    positions = ((values - edges[0]) * (bins / (edges[-1] - edges[0]))).astype(np.intp)
+    positions = np.minimum(positions, bins - 1)
+    positions[values < edges[positions]] -= 1
+    positions[(values >= edges[positions + 1]) & (positions != bins - 1)] += 1
+    return np.bincount(positions, minlength=bins)
+
+
+def histogram_frame(values, edges):
+    counts = bin_counts(values, edges)
+    total = counts.sum()
+    return pd.DataFrame({
+        "Start": edges[:-1],
+        "End": edges[1:],
+        "Center": (edges[:-1] + edges[1:]) / 2,
+        "Count": counts,
+        "Percentage": counts / total * 100 if total else np.zeros(len(counts)),
+    })
+
+
+def histogram_figure(values, edges, title, label):
+    # Satu batang per bin (persentase), lebar dan rentang sumbu x tetap mengikuti edges
+    bins = histogram_frame(values, edges)
+    fig = px.bar(bins, x='Center', y='Percentage', title=title,
+                 hover_data={'Center': False, 'Start': ':.3s', 'End': ':.3s', 'Count': True, 'Percentage': ':.2f'})
+    fig.update_layout(
+        xaxis_title=label,
+        yaxis_title='Percentage',
+        xaxis_range=[edges[0], edges[-1]],
+        bargap=0,
+        showlegend=False
+    )
+    fig.update_traces(marker_color='#1f77b4', width=edges[1] - edges[0])
+    return fig
@@ -0,0 +1,153 @@
+import os
+
+import numpy as np
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+
+from page.figcache import figure_cache, make_key, file_version, show_cache_stats
+from page.table import paged_table, frame_pager
+from page.profiling import stage
+from page.movies import MARK_LIMIT, TOP_N, build_movie_index, select_movies, short_names
+from page.lod import density_trace
+from page.binning import histogram_figure
+from page.registry import registry, show_memory_stats
+from scraper.catalogue import CATALOGUE_FILE, RATING_BANDS
+from scraper.dataset import read_dataset
+
+# Halaman katalog lengkap dari dump IMDb (ingest_imdb.py), bisa jutaan judul.
+# Semua chart dibangun dari agregat, bin, atau TOP_N judul sehingga payload tidak
+# bergantung pada jumlah baris; scatter diganti grid kepadatan di atas MARK_LIMIT.
+
+CATALOGUE_PATH = os.getenv("IMDB_CATALOGUE", CATALOGUE_FILE)
+DENSITY_BINS = 60
+
+# Satu salinan per proses di registry dataset bersama, seperti halaman IMDB
+titles, title_index, DATA_VERSION = None, None, None
+if os.path.exists(CATALOGUE_PATH):
+    DATA_VERSION = file_version(CATALOGUE_PATH)
+    titles = registry.get("imdb_catalogue", lambda: read_dataset(CATALOGUE_PATH))
+    title_index = registry.get("imdb_catalogue_index",
+                               lambda: build_movie_index(titles, ["Durasi(Menit)"], upper_quantile=0.995))
+
+@stage("table")
+def home():
+    paged_table("Table Data IMDB Catalogue", "imdb_catalogue_table", lambda: frame_pager(titles))
+
+def filter_data():
+    st.sidebar.header('Filter Data')
+    years = list(np.unique(title_index['years']))
+    min_year = st.sidebar.selectbox('Min Year', options=[None] + years, index=0)
+    max_year = st.sidebar.selectbox('Max Year', options=[None] + years[::-1], index=0)
+    rating_data = st.sidebar.multiselect("Pilih Rating:", options=RATING_BANDS, default=RATING_BANDS)
+
+    selection = {'min_year': min_year, 'max_year': max_year, 'ratings': list(rating_data)}
+    with stage("filter", rows_in=len(titles)) as timing:
+        filtered = select(selection)
+        timing.rows_out = len(filtered)
+    registry.track("catalogue filtered", filtered)
+    st.divider()
+    return filtered, selection
+
+def select(selection):
+    return select_movies(registry.view("imdb_catalogue"), title_index, selection['min_year'], selection['max_year'],
+                         selection['ratings'])
+
+@stage("aggregate")
+def aggregate_titles(filtered):
+    per_year = filtered.groupby('Year').agg(
+        Total=('tconst', 'size'),
+        Average_Rating=('Average_Rating', 'mean'),
+    ).reset_index()
+    bands = filtered['Rating'].value_counts().rename_axis('Rating').reset_index(name='Total')
+    rated = filtered[filtered['Num_Votes'] > 0]
+    data = {
+        'total': len(filtered),
+        'rated': len(rated),
+        'average_rating': rated['Average_Rating'].mean() if len(rated) else None,
+        'busiest_year': per_year.loc[per_year['Total'].idxmax(), 'Year'] if len(per_year) else None,
+    }
+    return per_year, bands, rated, data
+
+@stage("build_figures")
+def build_figures(filtered):
+    figures = {}
+    per_year, bands, rated, data = aggregate_titles(filtered)
+
+    figures['titles_year'] = px.line(per_year, x='Year', y='Total', title='Jumlah Judul per Tahun',
+                                     hover_data={'Average_Rating': ':.2f'})
+    figures['rating_composition'] = px.pie(bands, values='Total', names='Rating', title='Rating Composition')
+    figures['runtime_distribution'] = histogram_figure(filtered['Durasi(Menit)'], title_index['edges']['Durasi(Menit)'],
+                                                       'Runtime Distribution', 'Durasi (Menit)')
+
+    top = rated.nlargest(TOP_N, 'Num_Votes')
+    top = top.assign(Short_Name=short_names(top['Name']))
+    fig = px.bar(top, x='Short_Name', y='Num_Votes', color='Average_Rating', hover_data=['Name', 'Year'],
+                 title=f'Top {len(top)} Judul dengan Vote Terbanyak',
+                 labels={'Short_Name': 'Judul', 'Num_Votes': 'Jumlah Vote', 'Average_Rating': 'Rating'})
+    fig.update_layout(xaxis_tickangle=-45)
+    figures['top_votes'] = fig
+
+    if len(rated) <= MARK_LIMIT:
+        fig = px.scatter(rated, x='Average_Rating', y='Num_Votes', hover_data=['Name', 'Year'], log_y=True,
+                         title='Rating vs Jumlah Vote',
+                         labels={'Average_Rating': 'Rating IMDb', 'Num_Votes': 'Jumlah Vote'})
+    else:
+        # Vote sangat miring, jadi kepadatan dihitung pada log10(vote)
+        fig = go.Figure(density_trace(rated['Average_Rating'], np.log10(rated['Num_Votes']), DENSITY_BINS, name='Judul'))
+        fig.update_layout(title='Rating vs Jumlah Vote (kepadatan judul)',
+                          xaxis_title='Rating IMDb', yaxis_title='log10(Jumlah Vote)')
+    figures['relationship'] = fig
+    return data, figures
+
+@st.fragment
+@stage("render overview")
+def overview(data, figures):
+    st.header('Overview Katalog IMDB')
+    st.write(f"{data['total']:,} judul terpilih, {data['rated']:,} di antaranya memiliki rating.")
+    if data['average_rating'] is not None:
+        st.write(f"Rata-rata rating IMDb adalah {data['average_rating']:.2f}; "
+                 f"tahun dengan judul terbanyak adalah **{data['busiest_year']}**.")
+    tab1, tab2 = st.tabs(['Per Tahun', 'Rating'])
+    with tab1:
+        st.plotly_chart(figures['titles_year'])
+    with tab2:
+        st.plotly_chart(figures['rating_composition'])
+
+@st.fragment
+@stage("render distribution")
+def distribution(data, figures):
+    st.header('Distribution Katalog IMDB')
+    tab1, tab2 = st.tabs(['Runtime', 'Top Vote'])
+    with tab1:
+        st.plotly_chart(figures['runtime_distribution'])
+    with tab2:
+        st.plotly_chart(figures['top_votes'])
+
+@st.fragment
+@stage("render relationship")
+def relationship(data, figures):
+    st.header('Relationship Katalog IMDB')
+    st.plotly_chart(figures['relationship'])
+
+def cache_key(selection):
+    return make_key("catalogue", version=DATA_VERSION, **selection)
+
+def show_catalogue():
+    st.title('IMDB Catalogue Dashboard')
+    if titles is None:
+        st.info(f"{CATALOGUE_PATH} belum ada. Jalankan `python ingest_imdb.py title.basics.tsv.gz title.ratings.tsv.gz` "
+                "dengan dump dari https://datasets.imdbws.com/.")
+        return
+    filtered, selection = filter_data()
+    home()
+
+    key = cache_key(selection)
+    with stage("figure_cache"):
+        data, figures = figure_cache.get_or_build(key, lambda: build_figures(filtered))
+    show_cache_stats()
+    show_memory_stats()
+
+    overview(data, figures)
+    distribution(data, figures)
+    relationship(data, figures)
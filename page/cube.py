@@ -0,0 +1,49 @@
+import pandas as pd
+
+from page.aggregate import aggregate_cells
+
+# Dimensi dan measure yang dipakai oleh KPI dan chart 1-4 di halaman Adventure Works
+DIMENSIONS = ["Year", "Month", "SalesTerritoryCountry", "EnglishProductCategoryName", "Gender"]
+MEASURES = ["SalesAmount", "TotalProductCost", "OrderQuantity"]
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+
+
+def build_cube(df):
+    # Rollup sekali per load: jumlah measure per kombinasi dimensi.
+    # OrderCount mengikuti KPI "Total Sales" (count baris SalesAmount).
+    aggs = {measure: (measure, "sum") for measure in MEASURES}
+    aggs["OrderCount"] = ("SalesAmount", "count")
+    cube = df.groupby(DIMENSIONS, dropna=False, observed=True, sort=False).agg(**aggs).reset_index()
+    # Measure di cube selalu lebar (int64/float64) walaupun extract sudah di-downcast
+    return cube.astype({"OrderQuantity": "int64", "OrderCount": "int64", "SalesAmount": "float64", "TotalProductCost": "float64"})
+
+
+def slice_cube(cube, year_list=None, country_list=None):
+    mask = pd.Series(True, index=cube.index)
+    if year_list is not None:
+        mask &= cube["Year"].isin(year_list)
+    if country_list is not None:
+        mask &= cube["SalesTerritoryCountry"].isin(country_list)
+    return cube[mask]
+
+
+def cube_charts(cube, year_list=None, country_list=None):
+    # Bentuk hasil sama dengan query_charts() di page.queries
+    return aggregate_cells(slice_cube(cube, year_list, country_list))
+
+
+def merge_cube(cube, delta):
+    # Menambahkan cube dari baris baru ke cube yang sudah ada tanpa membaca ulang seluruh data
+    if delta.empty:
+        return cube
+    cube, delta = cube.copy(deep=False), delta.copy(deep=False)
+    for column in DIMENSIONS:
+        # Samakan kategori agar kolom categorical tidak menjadi object setelah concat
+        if isinstance(cube[column].dtype, pd.CategoricalDtype) and isinstance(delta[column].dtype, pd.CategoricalDtype):
+            categories = cube[column].cat.categories.union(delta[column].cat.categories, sort=False)
+            cube[column] = cube[column].cat.set_categories(categories)
+            delta[column] = delta[column].cat.set_categories(categories)
+    combined = pd.concat([cube, delta], ignore_index=True)
+    aggs = {measure: (measure, "sum") for measure in MEASURES + ["OrderCount"]}
+    return combined.groupby(DIMENSIONS, dropna=False, observed=True, sort=False).agg(**aggs).reset_index()
@@ -5,6 +5,19 @@ import plotly.express as px
 import plotly.graph_objects as go
 from dotenv import load_dotenv
 import os
+import time
+
+from page.cube import cube_charts, MONTHS
+from page.queries import query_charts, distinct_values, source_version, extract_query, customer_names_query
+from page.refresh import SalesStore
+from page.filters import select_positions
+from page.aggregate import aggregate_customers
+from page.lod import density_trace
+from page.figcache import figure_cache, make_key, show_cache_stats
+from page.table import paged_table, frame_pager, query_pager
+from page.schema import with_customer_names
+from page.profiling import stage
+from page.registry import registry, view, show_memory_stats
 
 load_dotenv()
 
@@ -14,9 +27,24 @@ DB_PORT = 3306
 DB_DATABASE = st.secrets['DB_DATABASE']
 DB_USER = st.secrets['DB_USER']
 DB_PASS = st.secrets['DB_PASS']
+# "extract" menarik seluruh join ke pandas, "pushdown" menjalankan agregat di MySQL
+DB_MODE = st.secrets.get('DB_MODE', 'extract')
+# Interval refresh otomatis extract dalam detik (0 = hanya refresh manual); di mode
+# pushdown interval cek versi data warehouse (0 = dicek setiap rerun)
+REFRESH_INTERVAL = int(st.secrets.get('REFRESH_INTERVAL', 600))
+# Folder snapshot Arrow lokal untuk cold start cepat dan mode offline ("" = nonaktif)
+SNAPSHOT_DIR = st.secrets.get('SNAPSHOT_DIR', 'data/snapshot')
+# Jumlah baris per chunk saat extract di-stream dari server-side cursor
+LOAD_CHUNKSIZE = int(st.secrets.get('LOAD_CHUNKSIZE', 50000))
+# Level-of-detail scatter Yearly Income vs Sales Amount: di atas batas titik ini
+# scatter diganti grid kepadatan ("density", payload tetap) atau "webgl" (scattergl)
+SCATTER_MAX_POINTS = int(st.secrets.get('SCATTER_MAX_POINTS', 5000))
+SCATTER_LOD = st.secrets.get('SCATTER_LOD', 'density')
+SCATTER_BINS = int(st.secrets.get('SCATTER_BINS', 60))
 
 # Create the database connection string
-db_url = f'mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_DATABASE}'
+# DB_URL (opsional) mengganti URL MySQL, mis. sqlite:///aw.db untuk stand-in lokal/benchmark
+db_url = st.secrets.get('DB_URL', f'mysql+pymysql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_DATABASE}')
 
 # Create the engine
 engine = create_engine(db_url)
@@ -28,90 +56,27 @@ try:
 except Exception as e:
     print(f"Database connection failed: {str(e)}")
 
-# Query the database using SQLAlchemy
-query = """
-SELECT
-    fis.SalesOrderNumber,
-    YEAR(fis.OrderDate) AS 'Year',
-    MONTHNAME(fis.OrderDate) AS 'Month',
-    fis.SalesAmount,
-    fis.OrderQuantity,
-    fis.TotalProductCost,
-    CONCAT(dc.FirstName, ' ', dc.LastName) AS 'Customer',
-    dc.Gender,
-    dc.YearlyIncome,
-    dst.SalesTerritoryCountry,
-    dpc.EnglishProductCategoryName
-FROM factinternetsales fis
-LEFT JOIN dimsalesterritory dst 
-    ON fis.SalesTerritoryKey = dst.SalesTerritoryKey
-LEFT JOIN dimcustomer dc
-    ON fis.CustomerKey = dc.CustomerKey
-LEFT JOIN dimproduct dp
-    ON fis.ProductKey = dp.ProductKey
-LEFT JOIN dimproductsubcategory dps
-    ON dp.ProductSubcategoryKey = dps.ProductSubcategoryKey
-LEFT JOIN dimproductcategory dpc
-    ON dps.ProductCategoryKey = dpc.ProductCategoryKey;
-"""
-df = pd.read_sql(query, engine)
-
-def home():
-    with st.expander("Table Data Adventure Works"):
-        showData = st.multiselect('Filter Kolom: ', df.columns, default=df.columns.tolist())
-        st.write(df[showData])
-
-def filter_df(df, year_list=None, country_list=None, gender_list=None, category_list=None):
-    query_str = " & ".join([
-        f"Year == {year_list}" if year_list is not None else '',
-        f"SalesTerritoryCountry == {country_list}" if country_list is not None else '',
-        f"Gender == {gender_list}" if gender_list is not None else '',
-        f"EnglishProductCategoryName == {category_list}" if category_list is not None else ''
-    ]).strip(' & ')
-    
-    return df.query(query_str)
-
-def show_db():
-    st.title('Adventure Works Data Visualization Dashboard')
-    home()
-
-    years = df["Year"].unique().tolist()
-    countries = df["SalesTerritoryCountry"].unique().tolist()
-
-    # ---- SIDEBAR ----
-    st.sidebar.header("Filtering")
-
-    year = st.sidebar.multiselect(
-        "Select the year",
-        options=years,
-        default=years
-    )
-
-    country = st.sidebar.multiselect(
-        "Select the country",
-        options=countries,
-        default=countries
-    )
-
-    # Menentukan nilai default jika tidak ada pilihan
-    if year:
-        year_list = year
+# Query extract dan kamus nama customer, mengikuti dialek engine
+query = extract_query(engine)
+customer_query = customer_names_query(engine)
+
+# Extract dan rollup cube disimpan di store; refresh berikutnya hanya mengambil
+# baris setelah watermark OrderDate/SalesOrderNumber/SalesOrderLineNumber terakhir
+# Extract pertama dimuat saat halaman dibuka (lihat load_progressive), bukan saat import
+store = SalesStore(engine, query, REFRESH_INTERVAL, customer_query, SNAPSHOT_DIR, LOAD_CHUNKSIZE)
+
+@stage("table")
+def home(df=None):
+    # Tabel berhalaman: hanya jendela baris yang terlihat yang diserialisasi, dan
+    # pada mode pushdown sort/LIMIT/OFFSET dijalankan di database
+    if df is not None:
+        pager = lambda: frame_pager(df, lambda window: with_customer_names(window, store.customers))
     else:
-        year_list = years
-
-    if country:
-        country_list = country
-    else:
-        country_list = countries
-
-    df_selection = filter_df(df, year_list, country_list)
-
-    # TOP KPI's
-    total_sales = df_selection["SalesAmount"].count()
-    total_sales_amount = df_selection["SalesAmount"].sum()
-    average_sales = df_selection["SalesAmount"].mean()
-    top_category = df_selection["EnglishProductCategoryName"].mode()
+        pager = lambda: query_pager(engine, query)
+    paged_table("Table Data Adventure Works", "adventure_works_table", pager)
 
+@stage("kpi_html")
+def kpi_boxes(total_sales, total_sales_amount, average_sales, top_category):
     # Define the CSS for the custom styling
     st.markdown("""
         <style>
@@ -193,16 +158,15 @@ def show_db():
         <div class="dashboard-box box4">
             <p class="logo">🏆</p>
             <p class="title">Top Category: </p>
-            <p>{top_category[0]}</p>
+            <p>{top_category}</p>
         </div>
         '''
         st.markdown(text, unsafe_allow_html=True)
 
-    # ---- TOTAL SALES AMOUNT vs TOTAL COST BY COUNTRY ----
-    chart1 = df_selection.groupby("SalesTerritoryCountry").sum()[["SalesAmount", "TotalProductCost"]]
-
-    # Membuat column histogram dengan Plotly Express
-    fig_chart1 = px.histogram(
+@stage("country_chart")
+def country_chart(chart1):
+    # chart1 sudah diagregasi per negara, cukup digambar sebagai bar (tanpa binning)
+    fig_chart1 = px.bar(
         chart1,
         x=chart1.index,
         y=["SalesAmount", "TotalProductCost"],
@@ -235,10 +199,131 @@ def show_db():
         opacity=0.9,
         hovertemplate='Country: %{x}<br>Amount: %{y}',
     )
+    return fig_chart1
+
+@stage("customer_chart")
+def customer_chart(chart5):
+    min_val = chart5['SalesAmount'].min()
+    max_val = chart5['SalesAmount'].max()
+
+    chart5['color'] = 'mid'
+    chart5.loc[chart5['SalesAmount'] == min_val, 'color'] = 'min'
+    chart5.loc[chart5['SalesAmount'] == max_val, 'color'] = 'max'
+
+    # Di atas SCATTER_MAX_POINTS customer, scatter diganti mode level-of-detail
+    if len(chart5) > SCATTER_MAX_POINTS:
+        return customer_chart_lod(chart5)
+
+    fig_chart5 = px.scatter(
+        chart5,
+        x='YearlyIncome',
+        y='SalesAmount',
+        color='color',
+        size='SalesAmount',
+        title="<b>Yearly Income vs Sales Amount</b>",
+        template='plotly_dark',
+        labels={'YearlyIncome': 'Yearly Income', 'SalesAmount': 'Sales Amount'},
+        color_discrete_map={'min': '#1f77b4', 'mid': '#ff7f0e', 'max': '#d62728'},
+        size_max=50,
+        hover_data={'Customer': True},
+        width=800,
+        height=600
+    )
+
+    fig_chart5.update_layout(
+        xaxis_title='Yearly Income',
+        yaxis_title='Sales Amount',
+        title={'x': 0.5, 'xanchor': 'center'},
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+
+    fig_chart5.update_traces(
+        hovertemplate='<b>Yearly Income:</b> %{x}<br><b>Sales Amount:</b> %{y}<br'
+    )
+    return fig_chart5
+
+def customer_chart_lod(chart5):
+    # Customer min/max tetap ditampilkan sebagai marker individual
+    extremes = chart5[chart5['color'] != 'mid']
+    colors = {'min': '#1f77b4', 'max': '#d62728'}
+
+    if SCATTER_LOD == 'webgl':
+        # Scattergl tanpa ukuran dan hover per titik; payload tetap sebanding jumlah customer
+        mid = chart5[chart5['color'] == 'mid']
+        fig_chart5 = go.Figure(go.Scattergl(
+            x=mid['YearlyIncome'],
+            y=mid['SalesAmount'],
+            mode='markers',
+            name='mid',
+            marker=dict(color='#ff7f0e', size=4, opacity=0.5),
+            hoverinfo='skip',
+        ))
+    else:
+        # Grid kepadatan 2D yang dihitung di server; payload hanya bergantung jumlah bin
+        fig_chart5 = go.Figure(density_trace(chart5['YearlyIncome'], chart5['SalesAmount'], SCATTER_BINS, name='Customers'))
+
+    for label, group in extremes.groupby('color'):
+        fig_chart5.add_trace(go.Scatter(
+            x=group['YearlyIncome'],
+            y=group['SalesAmount'],
+            mode='markers',
+            name=label,
+            marker=dict(color=colors[label], size=14, line=dict(color='white', width=1)),
+            customdata=group[['Customer']] if 'Customer' in group.columns else None,
+            hovertemplate='<b>Customer:</b> %{customdata[0]}<br><b>Yearly Income:</b> %{x}<br><b>Sales Amount:</b> %{y}<extra></extra>',
+        ))
+
+    fig_chart5.update_layout(
+        title={'text': "<b>Yearly Income vs Sales Amount</b>", 'x': 0.5, 'xanchor': 'center'},
+        template='plotly_dark',
+        xaxis_title='Yearly Income',
+        yaxis_title='Sales Amount',
+        width=800,
+        height=600,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig_chart5
+
+def load_progressive():
+    # KPI dan chart negara ditampilkan dari cube berjalan selama extract di-stream
+    placeholder = st.empty()
+    last_render = [0.0]
+
+    def on_chunk(cube, rows):
+        if time.monotonic() - last_render[0] < 1:
+            return
+        last_render[0] = time.monotonic()
+        charts = cube_charts(cube)
+        with placeholder.container():
+            st.caption(f"Memuat data... {rows:,} baris")
+            kpi_boxes(*charts["kpis"])
+            st.plotly_chart(country_chart(charts["country"]), use_container_width=True, key=f"loading_chart_{rows}")
+
+    try:
+        with stage("sql_extract") as timing:
+            store.load(on_chunk=on_chunk)
+            timing.rows_out = None if store.df is None else len(store.df)
+    finally:
+        placeholder.empty()
+
+@stage("build_charts")
+def build_charts(df, cube, index, year_list, country_list):
+    with stage("aggregate", rows_in=None if df is None else len(df)):
+        if DB_MODE == 'pushdown':
+            charts = query_charts(engine, year_list, country_list)
+        else:
+            # Satu bundle agregat dari rollup cube untuk KPI, chart 1-4 dan expander analisis
+            charts = cube_charts(cube, year_list, country_list)
+
+    # ---- TOTAL SALES AMOUNT vs TOTAL COST BY COUNTRY ----
+    chart1 = charts["country"]
+    fig_chart1 = country_chart(chart1)
 
     # ---- TOTAL OF SALES BY MONTH ----
-    chart2 = df_selection.groupby("Month", as_index=False).sum()[["Month", "OrderQuantity"]]
-    chart2["Month"] = pd.Categorical(chart2["Month"], ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"])
+    chart2 = charts["month"].copy()
+    chart2["Month"] = pd.Categorical(chart2["Month"], MONTHS)
     chart2.sort_values("Month", inplace=True, ascending=False)
 
     # Custom color palette with three different shades of red
@@ -286,7 +371,7 @@ def show_db():
     )
 
     # ---- SALES BY CATEGORY ----
-    chart3 = df_selection.groupby("EnglishProductCategoryName").sum()[["OrderQuantity"]]
+    chart3 = charts["category"]
 
     # Membuat pie chart dengan Plotly Express
     fig_chart3 = px.pie(
@@ -328,7 +413,7 @@ def show_db():
     )
 
     # ---- SALES BY GENDER ----
-    chart4 = df_selection.groupby("Gender").sum()[["OrderQuantity"]]
+    chart4 = charts["gender"]
 
     # Create a pie chart with Plotly Express
     fig_chart4 = px.pie(
@@ -362,46 +447,61 @@ def show_db():
     )
 
     # Bubble plot SalesMouth vs EnglishPromotionName
-    chart5 = df_selection.groupby('Customer').agg({'SalesAmount': 'sum','YearlyIncome': 'mean',}).reset_index()
-    
-    min_val = chart5['SalesAmount'].min()
-    max_val = chart5['SalesAmount'].max()
-
-    chart5['color'] = 'mid'
-    chart5.loc[chart5['SalesAmount'] == min_val, 'color'] = 'min'
-    chart5.loc[chart5['SalesAmount'] == max_val, 'color'] = 'max'
-
-    fig_chart5 = px.scatter(
-        chart5,
-        x='YearlyIncome',
-        y='SalesAmount',
-        color='color',
-        size='SalesAmount',
-        title="<b>Yearly Income vs Sales Amount</b>",
-        template='plotly_dark',
-        labels={'YearlyIncome': 'Yearly Income', 'SalesAmount': 'Sales Amount'},
-        color_discrete_map={'min': '#1f77b4', 'mid': '#ff7f0e', 'max': '#d62728'},
-        size_max=50,
-        hover_data={'Customer': True},
-        width=800,
-        height=600
-    )
-
-    fig_chart5.update_layout(
-        xaxis_title='Yearly Income',
-        yaxis_title='Sales Amount',
-        title={'x': 0.5, 'xanchor': 'center'},
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-    )
-
-    fig_chart5.update_traces(
-        hovertemplate='<b>Yearly Income:</b> %{x}<br><b>Sales Amount:</b> %{y}<br'
-    )
-
-    # ---- PLACING CHARTS ON MAIN PAGE ----
-    st.plotly_chart(fig_chart1, use_container_width=True)
-    with st.expander("Analisis Total Sales Amount vs Total Cost by Country", expanded=False):
+    # Chart 5 butuh level customer: pada mode extract dijumlahkan dari posisi baris
+    # hasil bitmap index dengan kode CustomerKey yang sudah difaktorisasi saat load
+    if DB_MODE == 'pushdown':
+        chart5 = charts["customer"]
+    else:
+        with stage("filter", rows_in=len(df)) as timing:
+            positions = select_positions(index, {"Year": year_list, "SalesTerritoryCountry": country_list})
+            timing.rows_out = len(df) if positions is None else len(positions)
+        with stage("aggregate_customers", rows_in=timing.rows_out) as timing:
+            chart5 = aggregate_customers(df, index["codes"]["CustomerKey"], positions, store.customers)
+            timing.rows_out = len(chart5)
+
+    fig_chart5 = customer_chart(chart5)
+    # Agregat customer (plus kolom warna) adalah satu-satunya frame besar milik sesi ini
+    registry.track("adventure_works customers", chart5)
+
+    # Hanya data kecil yang dibutuhkan KPI dan expander ikut disimpan di cache
+    data = {"kpis": charts["kpis"], "country": chart1, "gender": chart4}
+    figures = {"chart1": fig_chart1, "chart2": fig_chart2, "chart3": fig_chart3, "chart4": fig_chart4, "chart5": fig_chart5}
+    return data, figures
+
+# Versi data pushdown terakhir; dicek ulang ke warehouse paling sering sekali per REFRESH_INTERVAL.
+# Opsi filter (distinct tahun/negara) disimpan per versi itu, tidak di-query setiap rerun
+pushdown_state = {"version": None, "checked_at": None, "options": None, "options_version": None}
+
+def pushdown_version():
+    now = time.monotonic()
+    if pushdown_state["checked_at"] is None or now - pushdown_state["checked_at"] >= REFRESH_INTERVAL:
+        pushdown_state["version"] = source_version(engine)
+        pushdown_state["checked_at"] = now
+    return pushdown_state["version"]
+
+def pushdown_options():
+    version = pushdown_version()
+    if pushdown_state["options"] is None or pushdown_state["options_version"] != version:
+        pushdown_state["options"] = distinct_values(engine)
+        pushdown_state["options_version"] = version
+    return pushdown_state["options"]
+
+def cache_key(year_list, country_list):
+    # Figure dan data KPI di-cache per kombinasi filter (LRU, dibagi antar sesi dan,
+    # lewat folder cache di disk, antar proses serta prewarm.py)
+    if DB_MODE == 'pushdown':
+        data_version = pushdown_version()
+    else:
+        data_version = store.data_version()
+    return make_key("adventure_works", mode=DB_MODE, version=data_version, years=year_list, countries=country_list)
+
+@st.fragment
+def country_section(chart1, fig_chart1):
+    with stage("render chart1"):
+        st.plotly_chart(fig_chart1, use_container_width=True)
+    with st.expander("Analisis Total Sales Amount vs Total Cost by Country", key="country_analysis", on_change="rerun") as expander:
+        if not expander.open:
+            return
         # Analisis tambahan
         total_sales = chart1['SalesAmount'].sum()
         total_cost = chart1['TotalProductCost'].sum()
@@ -432,10 +532,125 @@ def show_db():
         - Rentang nilai menunjukkan variasi penjualan dan biaya produk di berbagai negara.
         - Simetri histogram menunjukkan distribusi penjualan dan biaya produk yang seimbang atau tidak di berbagai negara.
         """)
+
+@st.fragment
+def gender_section(chart4, fig_chart4):
+    with stage("render chart4"):
+        st.plotly_chart(fig_chart4, use_container_width=True)
+    with st.expander("Analysis", key="gender_analysis", on_change="rerun") as expander:
+        if not expander.open:
+            return
+        total_orders = chart4["OrderQuantity"].sum()
+        male_orders = chart4.loc["M", "OrderQuantity"]
+        female_orders = chart4.loc["F", "OrderQuantity"]
+        male_percentage = (male_orders / total_orders) * 100
+        female_percentage = (female_orders / total_orders) * 100
+
+        st.markdown('**Interpretasi Sales by Gender**')
+        st.write(f"Total penjualan yang dianalisis adalah {total_orders} pesanan.")
+        st.write(f"Jumlah pesanan dari pelanggan pria adalah {male_orders} ({male_percentage:.2f}%).")
+        st.write(f"Jumlah pesanan dari pelanggan wanita adalah {female_orders} ({female_percentage:.2f}%).")
+        st.write("""
+        - Diagram pie menunjukkan distribusi pesanan berdasarkan jenis kelamin.
+        - Warna hijau tua mewakili pesanan dari pria, dan warna hijau muda mewakili pesanan dari wanita.
+        - Jika salah satu segmen jauh lebih besar daripada yang lain, itu menunjukkan bahwa satu jenis kelamin berkontribusi lebih banyak terhadap total pesanan.
+        - Proporsi pesanan antara pria dan wanita dapat memberikan wawasan tentang preferensi atau kebiasaan pembelian di antara kelompok pelanggan yang berbeda.
+        """)
+
+def show_db():
+    st.title('Adventure Works Data Visualization Dashboard')
+
+    if DB_MODE != 'pushdown':
+        if store.df is None:
+            try:
+                load_progressive()
+            except Exception as e:
+                # Database tidak bisa dihubungi dan belum ada snapshot lokal
+                print(f"Sales extract load failed: {e}")
+                st.error(f"Data Adventure Works tidak dapat dimuat: {e}")
+                st.stop()
+        if st.sidebar.button("Refresh data"):
+            try:
+                with stage("refresh"):
+                    new_rows = store.refresh()
+                st.sidebar.caption(f"{new_rows} baris baru dimuat")
+            except Exception as e:
+                st.sidebar.error(f"Refresh gagal: {e}")
+        else:
+            with stage("refresh"):
+                store.maybe_refresh()
+        if store.offline:
+            st.warning("Database tidak dapat dihubungi, data ditampilkan dari snapshot lokal.")
+    df, cube, index = store.snapshot()
+    # Extract dibagi semua sesi lewat registry; sesi ini hanya memegang view zero-copy
+    df = view(df)
+    if df is not None:
+        registry.track("adventure_works", df)
+
+    if DB_MODE == 'pushdown':
+        try:
+            with stage("distinct_values"):
+                years, countries = pushdown_options()
+        except Exception as e:
+            print(f"Distinct values query failed: {e}")
+            st.error(f"Database Adventure Works tidak dapat dihubungi: {e}")
+            st.stop()
+
+    home(df)
+
+    if DB_MODE != 'pushdown':
+        years = df["Year"].unique().tolist()
+        countries = df["SalesTerritoryCountry"].unique().tolist()
+
+    # ---- SIDEBAR ----
+    st.sidebar.header("Filtering")
+
+    year = st.sidebar.multiselect(
+        "Select the year",
+        options=years,
+        default=years
+    )
+
+    country = st.sidebar.multiselect(
+        "Select the country",
+        options=countries,
+        default=countries
+    )
+
+    # Menentukan nilai default jika tidak ada pilihan
+    if year:
+        year_list = year
+    else:
+        year_list = years
+
+    if country:
+        country_list = country
+    else:
+        country_list = countries
+
+    key = cache_key(year_list, country_list)
+    with stage("figure_cache"):
+        data, figures = figure_cache.get_or_build(key, lambda: build_charts(df, cube, index, year_list, country_list))
+    show_cache_stats()
+    show_memory_stats()
+
+    # TOP KPI's
+    total_sales, total_sales_amount, average_sales, top_category = data["kpis"]
+
+    kpi_boxes(total_sales, total_sales_amount, average_sales, top_category)
+
+    chart1, chart4 = data["country"], data["gender"]
+    fig_chart1, fig_chart2, fig_chart3, fig_chart4, fig_chart5 = (figures[name] for name in ["chart1", "chart2", "chart3", "chart4", "chart5"])
+
+    # ---- PLACING CHARTS ON MAIN PAGE ----
+    # Bagian dengan analisis dijalankan sebagai fragment: membuka expander hanya
+    # menjalankan ulang bagian tersebut dengan input (data, figure) dari run terakhir
+    country_section(chart1, fig_chart1)
     left_column, right_column = st.columns(2)
 
     with left_column:
-        st.plotly_chart(fig_chart3, use_container_width=True)
+        with stage("render chart3"):
+            st.plotly_chart(fig_chart3, use_container_width=True)
         with st.expander("Analysis", expanded=False):
             # Interpretasi
                 st.markdown('**Interpretasi Sales by Category**')
@@ -449,28 +664,11 @@ def show_db():
 
                 Grafik ini membantu dalam memahami bagaimana penjualan didistribusikan di antara berbagai kategori produk, dan memungkinkan untuk mengidentifikasi kategori yang berkinerja baik dan yang mungkin memerlukan perhatian lebih.
                 """)
-        st.plotly_chart(fig_chart4, use_container_width=True)
-        with st.expander("Analysis", expanded=False):
-            # Interpretasi
-            total_orders = chart4["OrderQuantity"].sum()
-            male_orders = chart4.loc["M", "OrderQuantity"]
-            female_orders = chart4.loc["F", "OrderQuantity"]
-            male_percentage = (male_orders / total_orders) * 100
-            female_percentage = (female_orders / total_orders) * 100
-
-            st.markdown('**Interpretasi Sales by Gender**')
-            st.write(f"Total penjualan yang dianalisis adalah {total_orders} pesanan.")
-            st.write(f"Jumlah pesanan dari pelanggan pria adalah {male_orders} ({male_percentage:.2f}%).")
-            st.write(f"Jumlah pesanan dari pelanggan wanita adalah {female_orders} ({female_percentage:.2f}%).")
-            st.write("""
-            - Diagram pie menunjukkan distribusi pesanan berdasarkan jenis kelamin.
-            - Warna hijau tua mewakili pesanan dari pria, dan warna hijau muda mewakili pesanan dari wanita.
-            - Jika salah satu segmen jauh lebih besar daripada yang lain, itu menunjukkan bahwa satu jenis kelamin berkontribusi lebih banyak terhadap total pesanan.
-            - Proporsi pesanan antara pria dan wanita dapat memberikan wawasan tentang preferensi atau kebiasaan pembelian di antara kelompok pelanggan yang berbeda.
-            """)
+        gender_section(chart4, fig_chart4)
 
     with right_column:
-        st.plotly_chart(fig_chart2, use_container_width=True)
+        with stage("render chart2"):
+            st.plotly_chart(fig_chart2, use_container_width=True)
         with st.expander("Analysis", expanded=False):
             # Analisis dan interpretasi
             st.markdown('**Interpretasi dari Grafik Total Sales by Month**')
@@ -490,7 +688,8 @@ def show_db():
             - **Efektivitas Promosi:** Bulan dengan lonjakan penjualan dapat menunjukkan efektivitas kampanye promosi atau peluncuran produk baru.
             - **Ketersediaan Produk:** Bulan dengan penjualan rendah mungkin membutuhkan analisis lebih lanjut untuk memastikan ketersediaan produk atau menangani faktor-faktor lain yang mempengaruhi penjualan.
             """)
-    st.plotly_chart(fig_chart5, use_container_width=True)
+    with stage("render chart5"):
+        st.plotly_chart(fig_chart5, use_container_width=True)
     with st.expander("Analysis", expanded=False):
         st.markdown('**Interpretasi Yearly Income vs Sales Amount**')
         st.write("""
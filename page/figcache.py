@@ -0,0 +1,188 @@
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Cache figure per kombinasi filter, dibagi oleh semua sesi dalam satu proses.
+# Figure disimpan sebagai spec Plotly (dict hasil JSON) bersama data kecil yang
+# dibutuhkan KPI/expander, dan spec itu langsung diberikan ke st.plotly_chart, sehingga
+# kombinasi filter yang berulang tidak perlu agregasi, px.* maupun go.Figure lagi.
+# Entri lama dibuang secara LRU.
+# Dengan directory (opt-in), entri juga disimpan di disk sebagai JSON, satu file per
+# key, sehingga proses lain, restart, dan prewarm.py berbagi hasil yang sama; key harus
+# memuat versi data. Isi file hanya di-decode sebagai data (spec figure, skalar, frame
+# agregat), tidak pernah dieksekusi seperti pickle.
+
+
+def _canonical(value):
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _encode(value):
+    # Nilai di `data` yang bukan tipe JSON: frame agregat dan skalar/array numpy
+    if isinstance(value, pd.DataFrame):
+        return {"__frame__": value.to_json(orient="table")}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _decode(value):
+    if "__frame__" in value:
+        return pd.read_json(io.StringIO(value["__frame__"]), orient="table")
+    return value
+
+
+def file_version(path):
+    # Versi dataset berbasis file untuk key cache: berubah saat file ditulis ulang
+    stat = os.stat(path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def make_key(namespace, **filters):
+    # Urutan pilihan multiselect tidak memengaruhi hasil, jadi list filter diurutkan
+    filters = {name: sorted(_canonical(v), key=repr) if isinstance(v, (list, tuple, set)) else _canonical(v)
+               for name, v in filters.items()}
+    payload = json.dumps({"namespace": namespace, "filters": filters}, sort_keys=True, default=str)
+    return f"{namespace}:{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+
+class FigureCache:
+    def __init__(self, max_entries=64, directory=None, max_files=1024):
+        self.max_entries = max_entries
+        self.directory = directory or None
+        self.max_files = max_files
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key.replace(":", "-") + ".json")
+
+    def _read(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f, object_hook=_decode)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Failed to read cached figures {key}: {e}")
+            return None
+
+    def _write(self, key, entry):
+        # Tulis ke file sementara lalu rename, pembaca di proses lain tidak melihat file setengah jadi
+        try:
+            payload = json.dumps(entry, default=_encode)
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self._trim()
+        except Exception as e:
+            print(f"Failed to write cached figures {key}: {e}")
+
+    def _trim(self):
+        # File tertua (mtime) dibuang jika folder melebihi max_files
+        files = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+
+    def contains(self, key):
+        with self._lock:
+            if key in self._entries:
+                return True
+        return bool(self.directory) and os.path.exists(self._path(key))
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        entry = self._read(key) if self.directory else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def put(self, key, data, figures):
+        entry = {"data": data, "figures": {name: json.loads(fig.to_json()) for name, fig in figures.items()}}
+        with self._lock:
+            self._remember(key, entry)
+        if self.directory:
+            self._write(key, entry)
+        return entry
+
+    def get_or_build(self, key, build):
+        # build() -> (data, {nama: go.Figure}). Mengembalikan (data, {nama: spec dict}) untuk
+        # hit maupun miss; spec bersama dan tidak boleh diubah, cukup dirender
+        entry = self.get(key)
+        if entry is None:
+            data, figures = build()
+            entry = self.put(key, data, figures)
+        return entry["data"], entry["figures"]
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "max_entries": self.max_entries}
+
+    def clear(self, disk=False):
+        with self._lock:
+            self._entries.clear()
+        if disk and self.directory and os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".json"):
+                    os.remove(entry.path)
+
+
+# Dipakai bersama oleh halaman Adventure Works dan IMDB; ukurannya lewat env FIGURE_CACHE_SIZE.
+# FIGURE_CACHE_DIR mengaktifkan cache di disk (mis. data/figcache, diisi juga oleh prewarm.py);
+# default kosong = hanya memori
+figure_cache = FigureCache(
+    int(os.getenv('FIGURE_CACHE_SIZE', 64)),
+    os.getenv('FIGURE_CACHE_DIR', ''),
+    int(os.getenv('FIGURE_CACHE_FILES', 1024)),
+)
+
+
+def show_cache_stats(cache=figure_cache):
+    stats = cache.stats()
+    st.sidebar.caption(
+        f"Figure cache: {stats['hits']} hit / {stats['misses']} miss "
+        f"({stats['entries']}/{stats['max_entries']} entri)"
+    )
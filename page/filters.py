@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+# Kolom yang bisa difilter dari sidebar
+FILTER_COLUMNS = ["Year", "SalesTerritoryCountry", "Gender", "EnglishProductCategoryName"]
+
+# Kolom yang kodenya difaktorisasi sekali per load untuk agregasi (page.aggregate)
+CODE_COLUMNS = ["CustomerKey"]
+
+
+def build_index(df, columns=FILTER_COLUMNS, code_columns=CODE_COLUMNS):
+    # Bitmap per nilai (1 bit per baris, hasil np.packbits) untuk setiap kolom filter.
+    # Dibangun sekali per load sehingga seleksi tidak perlu memindai ulang kolomnya.
+    bitmaps = {}
+    for column in columns:
+        codes, uniques = pd.factorize(df[column])
+        bitmaps[column] = {value: np.packbits(codes == code) for code, value in enumerate(uniques)}
+    codes = {column: pd.factorize(df[column], sort=True) for column in code_columns if column in df.columns}
+    return {"rows": len(df), "bitmaps": bitmaps, "codes": codes}
+
+
+def _append_bits(bitmap, rows, bits):
+    # bitmap: hasil np.packbits untuk `rows` baris lama; bits: nilai boolean baris baru.
+    # Hanya baris baru yang di-pack; byte terakhir yang belum penuh digabung dengan OR.
+    shift = rows % 8
+    if shift == 0:
+        return np.concatenate([bitmap, np.packbits(bits)])
+    packed = np.packbits(np.concatenate([np.zeros(shift, dtype=bool), bits]))
+    return np.concatenate([bitmap[:-1], bitmap[-1:] | packed[:1], packed[1:]])
+
+
+def extend_index(index, delta):
+    # Index untuk df lama + delta (baris ditambahkan di akhir) tanpa memindai baris lama.
+    # Index lama tidak diubah, jadi pembaca yang masih memegangnya tetap konsisten.
+    rows = index["rows"]
+    empty = np.zeros((rows + 7) // 8, dtype=np.uint8)
+    bitmaps = {}
+    for column, old in index["bitmaps"].items():
+        codes, uniques = pd.factorize(delta[column])
+        added = {value: codes == code for code, value in enumerate(uniques)}
+        absent = np.zeros(len(delta), dtype=bool)
+        bitmaps[column] = {value: _append_bits(old.get(value, empty), rows, added.get(value, absent))
+                           for value in list(old) + [value for value in added if value not in old]}
+
+    codes = {}
+    for column, (old_codes, labels) in index["codes"].items():
+        keys = delta[column]
+        positions = labels.get_indexer(keys)
+        # Key baru ditambahkan di akhir label (tidak terurut) supaya kode lama tetap berlaku
+        new_keys = pd.unique(keys[(positions < 0) & keys.notna().to_numpy()])
+        if len(new_keys):
+            labels = labels.append(pd.Index(new_keys))
+            positions = labels.get_indexer(keys)
+        codes[column] = (np.concatenate([old_codes, positions.astype(old_codes.dtype)]), labels)
+    return {"rows": rows + len(delta), "bitmaps": bitmaps, "codes": codes}
+
+
+def select_positions(index, selections):
+    # selections: {kolom: daftar nilai atau None}. OR di dalam satu kolom, AND antar kolom.
+    # Mengembalikan posisi baris terpilih, atau None jika tidak ada filter aktif.
+    rows = index["rows"]
+    nbytes = (rows + 7) // 8
+    mask = None
+    for column, values in selections.items():
+        if values is None:
+            continue
+        bitmaps = index["bitmaps"][column]
+        column_mask = np.zeros(nbytes, dtype=np.uint8)
+        for value in values:
+            bitmap = bitmaps.get(value)
+            if bitmap is not None:
+                np.bitwise_or(column_mask, bitmap, out=column_mask)
+        if mask is None:
+            mask = column_mask
+        else:
+            np.bitwise_and(mask, column_mask, out=mask)
+    if mask is None:
+        return None
+    return np.flatnonzero(np.unpackbits(mask, count=rows))
+
+
+def take_rows(df, index, selections):
+    positions = select_positions(index, selections)
+    if positions is None:
+        return df
+    return df.take(positions)
@@ -1,72 +1,166 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 
-df = pd.read_csv("./data/imdb_combined.csv")
-df["Year"] = df["Year"].astype(int)
+from page.figcache import figure_cache, make_key, file_version, show_cache_stats
+from page.table import paged_table, frame_pager
+from page.profiling import stage
+from page.movies import MARK_LIMIT, load_movies, build_movie_index, select_movies, top_movies
+from page.lod import density_trace
+from page.binning import histogram_figure
+from page.registry import registry, show_memory_stats
+from scraper.dataset import DATASET_FILE
+
+DENSITY_BINS = 60
+
+# Satu salinan per proses di registry dataset bersama; sesi hanya memakai view-nya.
+# Versi file masuk ke key figure cache supaya entri di disk tidak dipakai setelah scrape ulang
+DATA_VERSION = file_version(DATASET_FILE)
+df = registry.get("imdb", load_movies)
+movie_index = registry.get("imdb_index", lambda: build_movie_index(df))
 
 df_selection = df[['Name','Year','Durasi(Menit)','Rating','Budget','Gross_US','Opening_Week','Open_Week_Date','Gross_World','Color','Sound_Mix','Aspect_Ratio']]
 # Fungsi Home untuk menampilkan data
+@stage("table")
 def home():
-    with st.expander("Table Data IMDB"):
-        showData = st.multiselect('Filter Kolom: ', df_selection.columns, default=df_selection.columns.tolist())
-        st.write(df_selection[showData])
+    paged_table("Table Data IMDB", "imdb_table", lambda: frame_pager(df_selection))
 
 def filter_data():
     st.sidebar.header('Filter Data')
-    min_year = st.sidebar.selectbox('Min Year', options=[None] + list(df['Year'].sort_values(ascending=True).unique()), index=0)
-    max_year = st.sidebar.selectbox('Max Year', options=[None] + list(df['Year'].sort_values(ascending=False).unique()), index=0)
+    years = list(pd.unique(movie_index['years']))
+    min_year = st.sidebar.selectbox('Min Year', options=[None] + years, index=0)
+    max_year = st.sidebar.selectbox('Max Year', options=[None] + years[::-1], index=0)
     rating_data = st.sidebar.multiselect("Pilih Rating:", options = df["Rating"].unique(),default = df["Rating"].unique())
 
-    global filtered
-    filtered = df.copy()
-    if min_year is not None:
-        filtered = filtered[filtered['Year'] >= min_year]
-    if max_year is not None:
-        filtered = filtered[filtered['Year'] <= max_year]
-    filtered = filtered[filtered['Rating'].isin(rating_data)]
+    selection = {'min_year': min_year, 'max_year': max_year, 'ratings': list(rating_data)}
+    with stage("filter", rows_in=len(df)) as timing:
+        filtered = select(selection)
+        timing.rows_out = len(filtered)
+    registry.track("imdb filtered", filtered)
     st.divider()
-    return filtered
+    return filtered, selection
+
+def select(selection):
+    # Dipakai juga oleh prewarm.py untuk membangun figure tanpa widget
+    return select_movies(registry.view("imdb"), movie_index, selection['min_year'], selection['max_year'],
+                         selection['ratings'])
+
+@stage("aggregate")
+def aggregate_movies(filtered):
+    budget = filtered.groupby('Year')['Budget'].sum().reset_index()
+
+    rating = filtered.groupby('Rating').agg({
+        'Rating': 'count'
+    })
+    rating = rating.rename(columns={'Rating': 'Total'}).reset_index()
+
+    # Statistik expander analisis baru dihitung saat expander dibuka; di sini
+    # hanya agregat per tahun (kecil) yang ikut disimpan di figure cache
+    data = {'budget_year': budget}
+    return budget, rating, data
+
+def summary(values):
+    return values.sum(), values.mean(), values.max(), values.min()
+
+@stage("build_figures")
+def build_figures(filtered):
+    # Semua agregasi dan figure halaman IMDB untuk satu kombinasi filter.
+    # Hasilnya disimpan di figure cache sehingga filter yang sama tidak dibangun ulang.
+    figures = {}
+    budget, rating, data = aggregate_movies(filtered)
+
+    figures['budget_year'] = px.line(budget, x='Year', y='Budget', title='Budget per Year')
+
+    # Chart per film: di atas MARK_LIMIT film hanya TOP_N film dengan Gross World tertinggi
+    films, truncated = top_movies(filtered, 'Gross_World')
+    suffix = f' (Top {len(films)} Gross World)' if truncated else ''
+
+    fig = px.bar(films, x='Short_Name', y=['Gross_US', 'Gross_World'], barmode='group',
+         title='Perbandingan Pendapatan AS & Kanada dengan Pendapatan Global' + suffix,
+         labels={'value': 'Pendapatan', 'variable': 'Kategori', 'Short_Name': 'Film'})
+
+    # Update layout for better visualization
+    fig.update_layout(xaxis_tickangle=-45)
+    figures['gross_comparison'] = fig
 
-def comparison():
+    for name, column, title in [('gross', 'Gross_World', 'Gross World'), ('budget', 'Budget', 'Budget')]:
+        # Bin dihitung di server dengan edges global dari movie_index
+        figures[f'{name}_distribution'] = histogram_figure(filtered[column], movie_index['edges'][column],
+                                                           f'{title} Distribution', title)
+
+    fig = px.area(films, 
+              x='Short_Name', 
+              y=['Gross_World', 'Gross_US'], 
+              title='Composition of Gross Data' + suffix,
+              labels={'Gross_World', 'Gross_US'},
+              template='plotly_dark')
+
+    fig.update_layout(
+        xaxis_title='Film',
+        yaxis_title='Pendapatan',
+        legend_title=None,
+        showlegend=True,
+    )
+    figures['gross_composition'] = fig
+
+    figures['rating_composition'] = px.pie(rating, values='Total', names='Rating', title='Rating Composition')
+
+    if len(filtered) <= MARK_LIMIT:
+        figures['relationship'] = px.scatter(
+            filtered, 
+            x='Budget', 
+            y='Gross_World', 
+            color='Durasi(Menit)', 
+            size='Durasi(Menit)', 
+            hover_data=['Name', 'Year'],
+            labels={'Budget': 'Anggaran (Budget)', 'Gross_World': 'Pendapatan Global (Gross World)', 'Durasi(Menit)': 'Durasi Film (Menit)'},
+            title='Budget vs Gross World vs Durasi Film')
+    else:
+        # Grid kepadatan 2D dari server menggantikan satu titik per film
+        fig = go.Figure(density_trace(filtered['Budget'], filtered['Gross_World'], DENSITY_BINS, name='Film'))
+        fig.update_layout(
+            title='Budget vs Gross World (kepadatan film)',
+            xaxis_title='Anggaran (Budget)',
+            yaxis_title='Pendapatan Global (Gross World)',
+        )
+        figures['relationship'] = fig
+
+    return data, figures
+
+@st.fragment
+@stage("render comparison")
+def comparison(data, figures):
     st.header('Comparison Data IMDB')
     tab1, tab2 = st.tabs(['Budget', 'Durasi(Menit)'])
     with tab1:
-        budget = filtered.groupby('Year')['Budget'].sum().reset_index()
-        fig = px.line(budget, x='Year', y='Budget', title='Budget per Year')
-        st.plotly_chart(fig)
-        with st.expander("Analysis", expanded=False):
-            total_budget = budget['Budget'].sum()
-            avg_budget = budget['Budget'].mean()
-            max_budget_year = budget.loc[budget['Budget'].idxmax(), 'Year']
-            min_budget_year = budget.loc[budget['Budget'].idxmin(), 'Year']
-            
-            st.markdown('**Analisis Budget**')
-            st.write(f"Total budget dari semua tahun adalah {total_budget}.")
-            st.write(f"Rata-rata budget per tahun adalah {avg_budget}.")
-            st.write(f"Tahun dengan budget tertinggi adalah **{max_budget_year}**.")
-            st.write(f"Tahun dengan budget terendah adalah **{min_budget_year}**.")
-
-            # Interpretasi
-            st.markdown('**Interpretasi Budget per Year**')
-            st.write("""
-            Grafik garis menunjukkan total budget per tahun dari dataset yang diberikan.
-            - Jika garis bergerak naik, ini menunjukkan total budget film meningkat dari tahun ke tahun.
-            - Jika garis bergerak turun, ini menunjukkan total budget film menurun dari tahun ke tahun.
-            - Jika garis bergerak datar, ini menunjukkan total budget film stabil dari tahun ke tahun.
-            - Puncak garis menunjukkan tahun dengan total budget tertinggi.
-            - Ujung garis menunjukkan tahun dengan total budget terendah.
-            """)
+        st.plotly_chart(figures['budget_year'])
+        with st.expander("Analysis", key="imdb_budget_year_analysis", on_change="rerun") as expander:
+            if expander.open:
+                budget = data['budget_year']
+                total_budget, avg_budget = budget['Budget'].sum(), budget['Budget'].mean()
+                max_budget_year = budget.loc[budget['Budget'].idxmax(), 'Year']
+                min_budget_year = budget.loc[budget['Budget'].idxmin(), 'Year']
+
+                st.markdown('**Analisis Budget**')
+                st.write(f"Total budget dari semua tahun adalah {total_budget}.")
+                st.write(f"Rata-rata budget per tahun adalah {avg_budget}.")
+                st.write(f"Tahun dengan budget tertinggi adalah **{max_budget_year}**.")
+                st.write(f"Tahun dengan budget terendah adalah **{min_budget_year}**.")
+
+                # Interpretasi
+                st.markdown('**Interpretasi Budget per Year**')
+                st.write("""
+                Grafik garis menunjukkan total budget per tahun dari dataset yang diberikan.
+                - Jika garis bergerak naik, ini menunjukkan total budget film meningkat dari tahun ke tahun.
+                - Jika garis bergerak turun, ini menunjukkan total budget film menurun dari tahun ke tahun.
+                - Jika garis bergerak datar, ini menunjukkan total budget film stabil dari tahun ke tahun.
+                - Puncak garis menunjukkan tahun dengan total budget tertinggi.
+                - Ujung garis menunjukkan tahun dengan total budget terendah.
+                """)
 
     with tab2:
-        filtered['Short_Name'] = filtered['Name'].apply(lambda x: x if len(x) <= 15 else x[:12] + '...')
-        fig = px.bar(filtered, x='Short_Name', y=['Gross_US', 'Gross_World'], barmode='group',
-             title='Perbandingan Pendapatan AS & Kanada dengan Pendapatan Global',
-             labels={'value': 'Pendapatan', 'variable': 'Kategori', 'Short_Name': 'Film'})
-
-        # Update layout for better visualization
-        fig.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig)
+        st.plotly_chart(figures['gross_comparison'])
         with st.expander("Analysis", expanded=False):
             st.markdown('**Interpretasi Perbandingan Pendapatan AS & Kanada dengan Pendapatan Global**')
             st.write("""
@@ -78,92 +172,63 @@ def comparison():
             - Grafik ini membantu dalam memahami perbandingan pendapatan AS & Kanada dan pendapatan global dari film-film yang dianalisis.
             """)
 
-def distribution():
+@st.fragment
+@stage("render distribution")
+def distribution(data, figures, filtered):
     st.header('Distribution Data IMDB')
     tab1, tab2 = st.tabs(['Gross_World', 'Budget'])
     with tab1:
-        fig = px.histogram(filtered, x='Gross_World', title='Gross World Distribution', nbins=20, histnorm='percent')
-        fig.update_layout(
-            xaxis_title='Gross World',
-            yaxis_title='Percentage',
-            showlegend=False
-        )
-        fig.update_traces(marker_color='#1f77b4')
-        st.plotly_chart(fig)
-        with st.expander("Analysis", expanded=False):
-            total_gross = filtered['Gross_World'].sum()
-            avg_gross = filtered['Gross_World'].mean()
-            max_gross = filtered['Gross_World'].max()
-            min_gross = filtered['Gross_World'].min()
-            gross_range = max_gross - min_gross
-            
-            st.markdown('**Analisis Gross World**')
-            st.write(f"Total gross world adalah {total_gross}.")
-            st.write(f"Rata-rata gross world adalah {avg_gross}.")
-            st.write(f"Gross world tertinggi adalah {max_gross}.")
-            st.write(f"Gross world terendah adalah {min_gross}.")
-            st.write(f"Rentang gross world adalah {gross_range}.")
+        st.plotly_chart(figures['gross_distribution'])
+        with st.expander("Analysis", key="imdb_gross_world_analysis", on_change="rerun") as expander:
+            if expander.open:
+                total_gross, avg_gross, max_gross, min_gross = summary(filtered['Gross_World'])
+                gross_range = max_gross - min_gross
+
+                st.markdown('**Analisis Gross World**')
+                st.write(f"Total gross world adalah {total_gross}.")
+                st.write(f"Rata-rata gross world adalah {avg_gross}.")
+                st.write(f"Gross world tertinggi adalah {max_gross}.")
+                st.write(f"Gross world terendah adalah {min_gross}.")
+                st.write(f"Rentang gross world adalah {gross_range}.")
             
-            # Interpretasi
-            st.markdown('**Interpretasi Gross World Distribution**')
-            st.write("""
-            Grafik histogram menunjukkan distribusi total pendapatan global dari dataset yang diberikan. 
-            - Puncak histogram menunjukkan jumlah film dengan pendapatan global tertentu yang paling sering muncul dalam dataset.
-            - Jika sebagian besar nilai Gross World berada di ujung kanan histogram, ini menunjukkan beberapa film memiliki pendapatan global yang sangat tinggi, sementara sebagian besar lainnya memiliki pendapatan yang lebih rendah.
-            - Rentang yang luas dengan beberapa outliers di ujung kanan menunjukkan variasi yang tinggi dalam pendapatan global.
-            - Simetri histogram menunjukkan distribusi pendapatan global yang seimbang atau tidak.
-            """)
+                # Interpretasi
+                st.markdown('**Interpretasi Gross World Distribution**')
+                st.write("""
+                Grafik histogram menunjukkan distribusi total pendapatan global dari dataset yang diberikan. 
+                - Puncak histogram menunjukkan jumlah film dengan pendapatan global tertentu yang paling sering muncul dalam dataset.
+                - Jika sebagian besar nilai Gross World berada di ujung kanan histogram, ini menunjukkan beberapa film memiliki pendapatan global yang sangat tinggi, sementara sebagian besar lainnya memiliki pendapatan yang lebih rendah.
+                - Rentang yang luas dengan beberapa outliers di ujung kanan menunjukkan variasi yang tinggi dalam pendapatan global.
+                - Simetri histogram menunjukkan distribusi pendapatan global yang seimbang atau tidak.
+                """)
     with tab2:
-        fig = px.histogram(filtered, x='Budget', title='Budget Distribution', nbins=20, histnorm='percent')
-        fig.update_layout(
-            xaxis_title='Budget',
-            yaxis_title='Percentage',
-            showlegend=False
-        )
-        fig.update_traces(marker_color='#1f77b4')
-        st.plotly_chart(fig)
-        with st.expander("Analysis", expanded=False):
-            total_budget = filtered['Budget'].sum()
-            avg_budget = filtered['Budget'].mean()
-            max_budget = filtered['Budget'].max()
-            min_budget = filtered['Budget'].min()
-
-            st.markdown('**Analisis Budget**')
-            st.write(f"Total budget adalah {total_budget}.")
-            st.write(f"Rata-rata budget adalah {avg_budget}.")
-            st.write(f"Budget tertinggi adalah {max_budget}.")
-            st.write(f"Budget terendah adalah {min_budget}.")
-
-            # Interpretasi
-            st.markdown('**Interpretasi Budget Distribution**')
-            st.write("""
-            Grafik histogram menunjukkan distribusi total budget dari dataset yang diberikan.
-            - Puncak histogram menunjukkan jumlah film dengan budget tertentu yang paling sering muncul dalam dataset.
-            - Jika sebagian besar nilai Budget berada di ujung kanan histogram, ini menunjukkan beberapa film memiliki budget yang sangat tinggi, sementara sebagian besar lainnya memiliki budget yang lebih rendah.
-            - Rentang yang luas dengan beberapa outliers di ujung kanan menunjukkan variasi yang tinggi dalam budget.
-            - Simetri histogram menunjukkan distribusi budget yang seimbang atau tidak.
-            """)
+        st.plotly_chart(figures['budget_distribution'])
+        with st.expander("Analysis", key="imdb_budget_analysis", on_change="rerun") as expander:
+            if expander.open:
+                total_budget, avg_budget, max_budget, min_budget = summary(filtered['Budget'])
 
-def composition():
+                st.markdown('**Analisis Budget**')
+                st.write(f"Total budget adalah {total_budget}.")
+                st.write(f"Rata-rata budget adalah {avg_budget}.")
+                st.write(f"Budget tertinggi adalah {max_budget}.")
+                st.write(f"Budget terendah adalah {min_budget}.")
+
+                # Interpretasi
+                st.markdown('**Interpretasi Budget Distribution**')
+                st.write("""
+                Grafik histogram menunjukkan distribusi total budget dari dataset yang diberikan.
+                - Puncak histogram menunjukkan jumlah film dengan budget tertentu yang paling sering muncul dalam dataset.
+                - Jika sebagian besar nilai Budget berada di ujung kanan histogram, ini menunjukkan beberapa film memiliki budget yang sangat tinggi, sementara sebagian besar lainnya memiliki budget yang lebih rendah.
+                - Rentang yang luas dengan beberapa outliers di ujung kanan menunjukkan variasi yang tinggi dalam budget.
+                - Simetri histogram menunjukkan distribusi budget yang seimbang atau tidak.
+                """)
+
+@st.fragment
+@stage("render composition")
+def composition(data, figures):
     st.header('Composition Data IMDB')
     tab1, tab2 = st.tabs(['Gross', 'Rating'])
     with tab1:
-        filtered['Short_Name'] = filtered['Name'].apply(lambda x: x if len(x) <= 15 else x[:12] + '...')
-        fig = px.area(filtered, 
-                  x='Short_Name', 
-                  y=['Gross_World', 'Gross_US'], 
-                  title='Composition of Gross Data',
-                  labels={'Gross_World', 'Gross_US'},
-                  template='plotly_dark')
-    
-        fig.update_layout(
-            xaxis_title='Film',
-            yaxis_title='Pendapatan',
-            legend_title=None,
-            showlegend=True,
-        )
-
-        st.plotly_chart(fig)
+        st.plotly_chart(figures['gross_composition'])
         with st.expander("Analysis", expanded=False):
             st.markdown('**Interpretasi Komposisi Gross Data**')
             st.write("""
@@ -172,12 +237,7 @@ def composition():
             - Grafik ini membantu dalam memahami bagaimana pendapatan global dan pendapatan AS & Kanada berubah sepanjang waktu.
             """)
     with tab2:
-        rating = filtered.groupby('Rating').agg({
-            'Rating': 'count'
-        })
-        rating = rating.rename(columns={'Rating': 'Total'}).reset_index()
-        fig = px.pie(rating, values='Total', names='Rating', title='Rating Composition')
-        st.plotly_chart(fig)
+        st.plotly_chart(figures['rating_composition'])
         with st.expander("Analysis", expanded=False):
             st.markdown('**Interpretasi Rating Composition**')
             st.write("""
@@ -186,24 +246,30 @@ def composition():
             - Grafik ini membantu dalam memahami distribusi dan dominasi rating tertentu di antara film-film yang dianalisis.
             """)
 
-def relationship():
+@st.fragment
+@stage("render relationship")
+def relationship(data, figures):
     st.header('Relationship Data IMDB')
-    fig = px.scatter(
-        filtered, 
-        x='Budget', 
-        y='Gross_World', 
-        color='Durasi(Menit)', 
-        size='Durasi(Menit)', 
-        hover_data=['Name', 'Year'],
-        labels={'Budget': 'Anggaran (Budget)', 'Gross_World': 'Pendapatan Global (Gross World)', 'Durasi(Menit)': 'Durasi Film (Menit)'},
-        title='Budget vs Gross World vs Durasi Film')
-    st.plotly_chart(fig)
+    st.plotly_chart(figures['relationship'])
+
+def cache_key(selection):
+    # Figure di-cache per kombinasi filter (tahun min/max dan rating) dan versi dataset
+    return make_key("imdb", version=DATA_VERSION, **selection)
 
 def show_imdb():
     st.title('IMDB Data Visualization Dashboard')
-    filter_data()
+    filtered, selection = filter_data()
     home()
-    composition()
-    relationship()
-    comparison()
-    distribution()
\ No newline at end of file
+
+    key = cache_key(selection)
+    with stage("figure_cache"):
+        data, figures = figure_cache.get_or_build(key, lambda: build_figures(filtered))
+    show_cache_stats()
+    show_memory_stats()
+
+    # Setiap bagian adalah fragment dengan input eksplisit: interaksi di dalamnya
+    # (mis. membuka expander analisis) hanya menjalankan ulang bagian tersebut
+    composition(data, figures)
+    relationship(data, figures)
+    comparison(data, figures)
+    distribution(data, figures, filtered)
\ No newline at end of file
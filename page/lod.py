@@ -0,0 +1,30 @@
+import numpy as np
+import plotly.graph_objects as go
+
+# Level-of-detail untuk scatter besar: titik diganti grid kepadatan 2D yang dihitung
+# di server, sehingga ukuran payload hanya bergantung pada jumlah bin.
+
+
+def density_grid(x, y, bins):
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.isfinite(x) & np.isfinite(y)
+    counts, x_edges, y_edges = np.histogram2d(x[finite], y[finite], bins=bins)
+    x_centers = (x_edges[:-1] + x_edges[1:]) / 2
+    y_centers = (y_edges[:-1] + y_edges[1:]) / 2
+    # Sel kosong dibuat transparan; sumbu y heatmap ada di dimensi pertama
+    z = np.where(counts > 0, counts, np.nan).T
+    return x_centers, y_centers, z
+
+
+def density_trace(x, y, bins, name="Density", colorscale="Oranges"):
+    x_centers, y_centers, z = density_grid(x, y, bins)
+    return go.Heatmap(
+        x=x_centers,
+        y=y_centers,
+        z=z,
+        name=name,
+        colorscale=colorscale,
+        colorbar=dict(title=name),
+        hovertemplate='x: %{x}<br>y: %{y}<br>' + name + ': %{z}<extra></extra>',
+    )
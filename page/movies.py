@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+
+from page.binning import bin_edges
+from page.filters import build_index, select_positions
+from scraper.dataset import DATASET_FILE, read_dataset
+
+# Data layer halaman IMDB. Dataset dibaca dan kolom turunannya dihitung sekali per
+# proses; index (urutan Year + bitmap per Rating) dipakai bersama oleh semua sesi dan
+# tidak pernah diubah. Seleksi mengembalikan frame baru tanpa menyentuh data bersama.
+
+SHORT_NAME_LENGTH = 15
+
+# Kolom yang ditampilkan sebagai histogram; bin edges-nya dihitung dari seluruh dataset
+HISTOGRAM_COLUMNS = ["Gross_World", "Budget"]
+
+# Di atas MARK_LIMIT baris, chart satu-mark-per-film diganti agregat atau TOP_N film
+MARK_LIMIT = int(os.getenv("IMDB_MARK_LIMIT", 1000))
+TOP_N = int(os.getenv("IMDB_TOP_N", 30))
+
+
+def short_names(names):
+    # "Judul yang sangat panjang" -> "Judul yang s..." untuk label sumbu x
+    return names.where(names.str.len() <= SHORT_NAME_LENGTH, names.str.slice(0, SHORT_NAME_LENGTH - 3) + "...")
+
+
+def load_movies(path=DATASET_FILE):
+    # Dataset Arrow bertipe hasil scrape_imdb.py (lihat scraper/dataset.py)
+    movies = read_dataset(path)
+    movies["Short_Name"] = short_names(movies["Name"])
+    return movies
+
+
+def build_movie_index(movies, histogram_columns=HISTOGRAM_COLUMNS, upper_quantile=1.0):
+    # Posisi baris diurutkan per Year (stable) untuk seleksi rentang tahun dengan
+    # searchsorted, bitmap per Rating dari page.filters, dan bin edges histogram
+    order = np.argsort(movies["Year"].to_numpy(), kind="stable")
+    return {
+        "rows": len(movies),
+        "order": order,
+        "years": movies["Year"].to_numpy()[order],
+        "ratings": build_index(movies, columns=["Rating"], code_columns=[]),
+        "edges": {column: bin_edges(movies[column], upper_quantile=upper_quantile) for column in histogram_columns},
+    }
+
+
+def movie_positions(index, min_year=None, max_year=None, ratings=None):
+    # Posisi baris terpilih (urut seperti dataset), atau None jika tidak ada filter aktif
+    years = index["years"]
+    start = np.searchsorted(years, min_year, side="left") if min_year is not None else 0
+    stop = np.searchsorted(years, max_year, side="right") if max_year is not None else len(years)
+    positions = None
+    if start > 0 or stop < len(years):
+        positions = np.sort(index["order"][start:stop])
+    if ratings is not None:
+        rating_positions = select_positions(index["ratings"], {"Rating": ratings})
+        positions = rating_positions if positions is None else np.intersect1d(positions, rating_positions, assume_unique=True)
+    return positions
+
+
+def select_movies(movies, index, min_year=None, max_year=None, ratings=None):
+    positions = movie_positions(index, min_year, max_year, ratings)
+    if positions is None:
+        return movies
+    return movies.take(positions)
+
+
+def top_movies(filtered, column, n=TOP_N):
+    # Film sebanyak-banyaknya MARK_LIMIT dikembalikan utuh, di atas itu hanya n teratas
+    if len(filtered) <= MARK_LIMIT:
+        return filtered, False
+    return filtered.nlargest(n, column), True
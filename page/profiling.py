@@ -0,0 +1,162 @@
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import threading
+import time
+from contextlib import ContextDecorator
+
+import pandas as pd
+import streamlit as st
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Instrumentasi opsional per rerun: waktu, jumlah baris masuk/keluar dan selisih memori
+# (RSS) per tahap. Aktif lewat env DASHBOARD_PROFILE=1 atau query parameter ?debug=1.
+# Hasilnya tampil di panel debug sidebar dan bisa diunduh sebagai trace Chrome
+# (chrome://tracing / Perfetto). Saat nonaktif, stage() hanya satu pengecekan atribut.
+
+HISTORY_SIZE = 20
+
+_active = threading.local()
+
+
+def enabled():
+    return os.getenv('DASHBOARD_PROFILE', '') not in ('', '0') or st.query_params.get('debug') == '1'
+
+
+def _rss_bytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class stage(ContextDecorator):
+    # Dipakai sebagai context manager (with stage("filter", rows_in=n) as s: ... s.rows_out = m)
+    # atau decorator (@stage("build_charts")). Tanpa rerun aktif tidak mencatat apa pun.
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+
+    def _recreate_cm(self):
+        # Decorator: instance baru per panggilan supaya aman antar sesi (thread)
+        return stage(self.name, self.rows_in)
+
+    def __enter__(self):
+        self._profile = getattr(_active, 'profile', None)
+        if self._profile is not None:
+            self._depth = self._profile['depth']
+            self._profile['depth'] += 1
+            self._memory = _rss_bytes()
+            self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        profile = self._profile
+        if profile is None:
+            return False
+        end = time.perf_counter_ns()
+        memory = _rss_bytes()
+        profile['depth'] -= 1
+        profile['stages'].append({
+            'name': self.name,
+            'depth': self._depth,
+            'start_us': self._start // 1000,
+            'duration_ms': (end - self._start) / 1e6,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            'memory_delta': memory - self._memory if memory is not None and self._memory is not None else None,
+        })
+        return False
+
+
+def begin_rerun(page):
+    _active.profile = {'page': page, 'depth': 0, 'stages': [], 'started_at': time.time()}
+    return _active.profile
+
+
+def end_rerun():
+    profile = getattr(_active, 'profile', None)
+    _active.profile = None
+    if profile is not None:
+        history = st.session_state.setdefault('profile_history', [])
+        history.append(profile)
+        del history[:-HISTORY_SIZE]
+    return profile
+
+
+def run_with_cprofile(func):
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(func)
+    finally:
+        profiler.create_stats()
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(40)
+        # Format file .prof sama dengan pstats.dump_stats, bisa dibuka dengan snakeviz
+        st.session_state['profile_cprofile'] = (text.getvalue(), marshal.dumps(profiler.stats))
+
+
+def chrome_trace(history):
+    # Format Trace Event: satu event "X" (complete) per tahap, satu baris (tid) per halaman
+    pid = os.getpid()
+    threads = {}
+    events = []
+    for number, profile in enumerate(history):
+        tid = threads.setdefault(profile['page'], len(threads) + 1)
+        for item in profile['stages']:
+            events.append({
+                'name': item['name'],
+                'cat': profile['page'],
+                'ph': 'X',
+                'ts': item['start_us'],
+                'dur': item['duration_ms'] * 1000,
+                'pid': pid,
+                'tid': tid,
+                'args': {
+                    'rerun': number,
+                    'rows_in': item['rows_in'],
+                    'rows_out': item['rows_out'],
+                    'memory_delta': item['memory_delta'],
+                },
+            })
+    events += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': page}}
+               for page, tid in threads.items()]
+    return json.dumps({'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+
+def show_profile_panel(profile):
+    with st.sidebar.expander('Debug: profil rerun', expanded=True):
+        stages = sorted(profile['stages'], key=lambda item: item['start_us'])
+        table = pd.DataFrame({
+            'Tahap': ['  ' * item['depth'] + item['name'] for item in stages],
+            'ms': [round(item['duration_ms'], 1) for item in stages],
+            'Baris masuk': [item['rows_in'] for item in stages],
+            'Baris keluar': [item['rows_out'] for item in stages],
+            'Memori (MB)': [None if item['memory_delta'] is None else round(item['memory_delta'] / 2**20, 2) for item in stages],
+        })
+        st.dataframe(table, hide_index=True)
+        total = sum(item['duration_ms'] for item in stages if item['depth'] == 0)
+        st.caption(f"{profile['page']}: {total:,.1f} ms")
+
+        history = st.session_state.get('profile_history', [])
+        st.download_button('Unduh trace (Chrome)', chrome_trace(history), file_name='dashboard-trace.json',
+                           mime='application/json', key='profile_trace')
+        st.button('Jalankan ulang dengan cProfile', key='profile_capture')
+
+        captured = st.session_state.get('profile_cprofile')
+        if captured is not None:
+            text, stats = captured
+            st.code(text, language=None)
+            st.download_button('Unduh cProfile (.prof)', stats, file_name='dashboard.prof',
+                               mime='application/octet-stream', key='profile_stats')
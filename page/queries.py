@@ -0,0 +1,172 @@
+import pandas as pd
+from sqlalchemy import bindparam, text
+
+# Mode query-builder: setiap agregat chart dijalankan sebagai GROUP BY di database,
+# filter sidebar dikirim sebagai parameter WHERE ... IN, dan hanya hasil kecilnya
+# yang ditarik ke pandas.
+
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November", "December"]
+
+# Ekspresi yang berbeda per dialek. SQLite dipakai sebagai stand-in lokal.
+_EXPRESSIONS = {
+    "mysql": {
+        "Year": "YEAR(fis.OrderDate)",
+        "Month": "MONTHNAME(fis.OrderDate)",
+        "Customer": "CONCAT(dc.FirstName, ' ', dc.LastName)",
+    },
+    "sqlite": {
+        "Year": "CAST(strftime('%Y', fis.OrderDate) AS INTEGER)",
+        "Month": "CASE strftime('%m', fis.OrderDate) "
+                 + " ".join(f"WHEN '{i:02d}' THEN '{name}'" for i, name in enumerate(MONTH_NAMES, start=1))
+                 + " END",
+        "Customer": "dc.FirstName || ' ' || dc.LastName",
+    },
+}
+
+_COLUMNS = {
+    "SalesTerritoryCountry": "dst.SalesTerritoryCountry",
+    "EnglishProductCategoryName": "dpc.EnglishProductCategoryName",
+    "Gender": "dc.Gender",
+    "CustomerKey": "fis.CustomerKey",
+    "YearlyIncome": "dc.YearlyIncome",
+}
+
+# JOIN yang dibutuhkan per alias, urut sesuai rantai join di query extract
+_JOINS = [
+    ("dst", "LEFT JOIN dimsalesterritory dst ON fis.SalesTerritoryKey = dst.SalesTerritoryKey"),
+    ("dc", "LEFT JOIN dimcustomer dc ON fis.CustomerKey = dc.CustomerKey"),
+    ("dp", "LEFT JOIN dimproduct dp ON fis.ProductKey = dp.ProductKey"),
+    ("dps", "LEFT JOIN dimproductsubcategory dps ON dp.ProductSubcategoryKey = dps.ProductSubcategoryKey"),
+    ("dpc", "LEFT JOIN dimproductcategory dpc ON dps.ProductCategoryKey = dpc.ProductCategoryKey"),
+]
+_JOIN_DEPENDS = {"dpc": {"dp", "dps", "dpc"}, "dps": {"dp", "dps"}}
+
+
+def _expressions(engine):
+    name = engine.dialect.name
+    if name not in _EXPRESSIONS:
+        raise ValueError(f"Dialect '{name}' belum didukung oleh query builder")
+    return {**_EXPRESSIONS[name], **_COLUMNS}
+
+
+def _joins_for(sql_parts):
+    aliases = set()
+    for alias, _ in _JOINS:
+        if any(f"{alias}." in part for part in sql_parts):
+            aliases |= _JOIN_DEPENDS.get(alias, {alias})
+    return [join for alias, join in _JOINS if alias in aliases]
+
+
+def extract_query(engine):
+    # Query extract halaman Adventure Works (mode extract) untuk dialek engine
+    exprs = _expressions(engine)
+    return f"""
+SELECT
+    fis.SalesOrderNumber,
+    fis.SalesOrderLineNumber,
+    fis.OrderDate,
+    {exprs['Year']} AS Year,
+    {exprs['Month']} AS Month,
+    fis.SalesAmount,
+    fis.OrderQuantity,
+    fis.TotalProductCost,
+    fis.CustomerKey,
+    dc.Gender,
+    dc.YearlyIncome,
+    dst.SalesTerritoryCountry,
+    dpc.EnglishProductCategoryName
+FROM factinternetsales fis
+""" + "\n".join(join for _, join in _JOINS) + "\n"
+
+
+def customer_names_query(engine):
+    # Nama customer disimpan terpisah sebagai kamus CustomerKey -> nama
+    return f"SELECT dc.CustomerKey, {_expressions(engine)['Customer']} AS Customer FROM dimcustomer dc"
+
+
+def build_aggregate(engine, group_by, measures, year_list=None, country_list=None):
+    # group_by: daftar nama dimensi; measures: {alias: "SUM(fis.SalesAmount)", ...}
+    exprs = _expressions(engine)
+    select = [f"{exprs[dim]} AS {dim}" for dim in group_by]
+    select += [f"{expr} AS {alias}" for alias, expr in measures.items()]
+
+    where, params = [], {}
+    if year_list is not None:
+        where.append(f"{exprs['Year']} IN :years")
+        params["years"] = [int(year) for year in year_list]
+    if country_list is not None:
+        where.append(f"{exprs['SalesTerritoryCountry']} IN :countries")
+        params["countries"] = list(country_list)
+
+    group_exprs = [exprs[dim] for dim in group_by]
+    # Kunci grup NULL dibuang seperti groupby pandas dan cube_charts (mis. produk tanpa kategori)
+    where += [f"{expr} IS NOT NULL" for expr in group_exprs]
+    sql ="SELECT " + ", ".join(select) + "\nFROM factinternetsales fis\n"
+    sql += "\n".join(_joins_for(select + where))
+    if where:
+        sql += "\nWHERE " + " AND ".join(where)
+    if group_exprs:
+        sql += "\nGROUP BY " + ", ".join(group_exprs)
+
+    stmt = text(sql)
+    if "years" in params:
+        stmt = stmt.bindparams(bindparam("years", expanding=True))
+    if "countries" in params:
+        stmt = stmt.bindparams(bindparam("countries", expanding=True))
+    return stmt, params
+
+
+def run_aggregate(engine, group_by, measures, year_list=None, country_list=None):
+    stmt, params = build_aggregate(engine, group_by, measures, year_list, country_list)
+    with engine.connect() as connection:
+        return pd.read_sql(stmt, connection, params=params)
+
+
+def distinct_values(engine):
+    exprs = _expressions(engine)
+    with engine.connect() as connection:
+        years = pd.read_sql(text(f"SELECT DISTINCT {exprs['Year']} AS Year FROM factinternetsales fis"), connection)
+        countries = pd.read_sql(text("SELECT DISTINCT SalesTerritoryCountry FROM dimsalesterritory"), connection)
+    return years["Year"].dropna().astype(int).tolist(), countries["SalesTerritoryCountry"].dropna().tolist()
+
+
+def source_version(engine):
+    # Versi data mode pushdown: order terakhir plus jumlah baris fact, sama di semua proses
+    # (seperti watermark extract); berubah begitu warehouse mendapat baris baru
+    with engine.connect() as connection:
+        last_date, rows = connection.execute(text("SELECT MAX(OrderDate), COUNT(*) FROM factinternetsales")).one()
+    last_date = pd.Timestamp(last_date).isoformat() if last_date is not None else None
+    return f"{last_date}/{rows}"
+
+
+def query_charts(engine, year_list=None, country_list=None):
+    def run(group_by, measures):
+        return run_aggregate(engine, group_by, measures, year_list, country_list)
+
+    kpi = run([], {"OrderCount": "COUNT(fis.SalesAmount)", "SalesAmount": "SUM(fis.SalesAmount)"}).iloc[0]
+    total_sales = int(kpi["OrderCount"])
+    total_sales_amount = kpi["SalesAmount"] or 0
+    average_sales = total_sales_amount / total_sales if total_sales else float("nan")
+
+    category = run(["EnglishProductCategoryName"], {"OrderQuantity": "SUM(fis.OrderQuantity)", "OrderCount": "COUNT(fis.SalesAmount)"})
+    category = category.set_index("EnglishProductCategoryName").sort_index()
+    top_category = category["OrderCount"].idxmax() if not category.empty else None
+
+    country = run(["SalesTerritoryCountry"], {"SalesAmount": "SUM(fis.SalesAmount)", "TotalProductCost": "SUM(fis.TotalProductCost)"})
+    month = run(["Month"], {"OrderQuantity": "SUM(fis.OrderQuantity)"})
+    gender = run(["Gender"], {"OrderQuantity": "SUM(fis.OrderQuantity)"})
+    customer = run(["CustomerKey"], {
+        "Customer": f"MIN({_expressions(engine)['Customer']})",
+        "SalesAmount": "SUM(fis.SalesAmount)",
+        "YearlyIncome": "AVG(dc.YearlyIncome)",
+    })
+
+    return {
+        "kpis": (total_sales, total_sales_amount, average_sales, top_category),
+        "country": country.set_index("SalesTerritoryCountry").sort_index(),
+        "month": month,
+        "category": category[["OrderQuantity"]],
+        "gender": gender.set_index("Gender").sort_index(),
+        "customer": customer[["Customer", "SalesAmount", "YearlyIncome"]],
+    }
+
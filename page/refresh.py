@@ -0,0 +1,201 @@
+import threading
+import time
+
+import pandas as pd
+from sqlalchemy import text
+
+from page.cube import build_cube, merge_cube
+from page.filters import build_index, extend_index
+from page.registry import registry
+from page.schema import compact_sales, append_rows, concat_compact, customer_names, bytes_per_row, report_bytes
+from page.snapshot import has_snapshot, read_snapshot, write_snapshot, source_stats
+
+
+class SalesStore:
+    # Menyimpan extract penjualan beserta watermark (OrderDate, SalesOrderNumber,
+    # SalesOrderLineNumber) tertinggi yang sudah dimuat, sehingga refresh hanya mengambil
+    # baris yang lebih baru, termasuk baris tambahan dari order terakhir yang sudah dimuat.
+    # Semua objek diganti utuh saat refresh, jadi pembaca cukup mengambil referensinya.
+
+    def __init__(self, engine, query, interval=0, customer_query=None, snapshot_dir=None, chunksize=50000):
+        self.engine = engine
+        self.chunksize = chunksize
+        self.snapshot_dir = snapshot_dir
+        self.offline = False
+        self.query = query.strip().rstrip(";")
+        self.customer_query = customer_query
+        self.customers = None
+        self.interval = interval
+        self.df = None
+        self.cube = None
+        self.index = None
+        self._state = (None, None, None)
+        self.version = 0
+        self.watermark = None
+        self.loaded_at = None
+        self._lock = threading.Lock()
+
+    def _watermark(self, df):
+        if df.empty:
+            return self.watermark
+        last_date = df["OrderDate"].max()
+        last_order = df["OrderDate"] == last_date
+        last_number = df.loc[last_order, "SalesOrderNumber"].max()
+        last_line = df.loc[last_order & (df["SalesOrderNumber"] == last_number), "SalesOrderLineNumber"].max()
+        return last_date, last_number, int(last_line)
+
+    def _set(self, df, cube, index=None):
+        # index diberikan saat refresh (sudah diperluas untuk baris delta saja)
+        registry.put("adventure_works", df)
+        self.df = df
+        self.cube = cube
+        self.index = build_index(df) if index is None else index
+        self._state = (self.df, self.cube, self.index)
+        # Naik setiap kali data berubah di proses ini
+        self.version += 1
+        self.watermark = self._watermark(df)
+        self.loaded_at = time.monotonic()
+
+    def data_version(self):
+        # Extract hanya bertambah, jadi watermark menandai isinya dan (berbeda dengan
+        # version) sama di semua proses; dipakai untuk key cache figure di disk
+        if self.watermark is None:
+            return None
+        last_date, last_number, last_line = self.watermark
+        return f"{pd.Timestamp(last_date).isoformat()}/{last_number}/{last_line}"
+
+    def snapshot(self):
+        # df, cube dan index diganti sebagai satu tuple sehingga pembaca selalu
+        # mendapat ketiganya dari load yang sama tanpa menunggu refresh selesai
+        return self._state
+
+    def load(self, on_chunk=None):
+        with self._lock:
+            if self.df is not None:
+                # Sudah dimuat oleh sesi lain selagi menunggu lock
+                return self.df
+            if self.snapshot_dir and has_snapshot(self.snapshot_dir):
+                self._restore()
+            else:
+                self._full_load(on_chunk)
+        return self.df
+
+    def _full_load(self, on_chunk=None):
+        # Extract dibaca per chunk lewat server-side cursor. Setiap chunk langsung
+        # di-compact dan dilipat ke cube berjalan, lalu on_chunk(cube, rows) dipanggil
+        # supaya halaman bisa menampilkan KPI/chart selagi load berlanjut.
+        self._load_customers()
+        chunks, cube, rows, raw_bytes = [], None, 0, 0
+        with self.engine.connect().execution_options(stream_results=True) as connection:
+            for chunk in pd.read_sql(text(self.query), connection, chunksize=self.chunksize):
+                raw_bytes += chunk.memory_usage(deep=True, index=True).sum()
+                chunk = compact_sales(chunk, report=False)
+                chunk_cube = build_cube(chunk)
+                cube = chunk_cube if cube is None else merge_cube(cube, chunk_cube)
+                chunks.append(chunk)
+                rows += len(chunk)
+                if on_chunk is not None:
+                    on_chunk(cube, rows)
+        if not chunks:
+            chunks = [compact_sales(pd.read_sql(text(self.query), self.engine), report=False)]
+            cube = build_cube(chunks[0])
+        df = concat_compact(chunks)
+        del chunks
+        report_bytes(raw_bytes / rows if rows else 0.0, bytes_per_row(df), len(df))
+        self._set(df, cube)
+        self._write_snapshot()
+
+    def _restore(self):
+        # Cek staleness snapshot terhadap sumber. Jika MySQL tidak bisa dihubungi,
+        # snapshot dipakai apa adanya (mode offline).
+        try:
+            stats = source_stats(self.engine)
+        except Exception as e:
+            print(f"Database unreachable, using snapshot in offline mode: {e}")
+            stats = None
+
+        df, cube, customers, metadata = read_snapshot(self.snapshot_dir)
+        snapshot_stats = metadata.get("stats")
+        if "SalesOrderLineNumber" not in df.columns:
+            # Snapshot lama tanpa nomor baris order tidak bisa memberi watermark lengkap
+            print("Snapshot predates SalesOrderLineNumber, reloading the full extract")
+            self._full_load()
+            return
+        if stats is not None and snapshot_stats is not None and stats["rows"] < snapshot_stats["rows"]:
+            # Sumber menyusut (bukan sekadar append), snapshot tidak bisa dipakai
+            print("Snapshot no longer matches the source, reloading the full extract")
+            self._full_load()
+            return
+
+        self.customers = customers
+        self._set(df, cube)
+        self.offline = stats is None
+        print(f"Sales extract restored from snapshot: {len(df):,} rows")
+        if stats is not None and stats != snapshot_stats:
+            self._apply_delta()
+
+    def _write_snapshot(self):
+        if not self.snapshot_dir:
+            return
+        try:
+            stats = source_stats(self.engine)
+            write_snapshot(self.snapshot_dir, self.df, self.cube, self.customers, self.watermark, stats)
+        except Exception as e:
+            print(f"Failed to write sales snapshot: {e}")
+
+    def _load_customers(self):
+        if self.customer_query is not None:
+            self.customers = customer_names(pd.read_sql(self.customer_query, self.engine))
+
+    def fetch_delta(self):
+        # SalesOrderNumber dibandingkan sebagai string; nomor AdventureWorks memiliki
+        # panjang tetap ("SO43697") sehingga urutan leksikal sama dengan urutan angka.
+        # SalesOrderLineNumber menangkap baris baru pada order terakhir yang sudah dimuat.
+        last_date, last_number, last_line = self.watermark
+        delta_query = text(
+            f"SELECT * FROM ({self.query}) AS extract\n"
+            "WHERE OrderDate > :last_date\n"
+            "   OR (OrderDate = :last_date AND SalesOrderNumber > :last_number)\n"
+            "   OR (OrderDate = :last_date AND SalesOrderNumber = :last_number AND SalesOrderLineNumber > :last_line)"
+        )
+        params = {"last_date": pd.Timestamp(last_date).to_pydatetime(), "last_number": last_number,
+                  "last_line": int(last_line)}
+        with self.engine.connect() as connection:
+            return pd.read_sql(delta_query, connection, params=params)
+
+    def _apply_delta(self):
+        delta = self.fetch_delta()
+        self.offline = False
+        if delta.empty:
+            self.loaded_at = time.monotonic()
+            return 0
+        if self.customers is not None and not delta["CustomerKey"].isin(self.customers.index).all():
+            self._load_customers()
+        df = append_rows(self.df, delta)
+        delta = df.iloc[len(self.df):]
+        # Cube dan index hanya diperluas dengan baris delta, tidak dibangun ulang dari seluruh histori
+        self._set(df, merge_cube(self.cube, build_cube(delta)), extend_index(self.index, delta))
+        self._write_snapshot()
+        print(f"Sales extract refreshed: {len(delta)} new rows")
+        return len(delta)
+
+    def refresh(self):
+        if self.df is None or self.watermark is None:
+            self.load()
+            return len(self.df)
+        with self._lock:
+            return self._apply_delta()
+
+    def is_due(self):
+        return bool(self.interval) and self.loaded_at is not None and time.monotonic() - self.loaded_at >= self.interval
+
+    def maybe_refresh(self):
+        if not self.is_due():
+            return 0
+        try:
+            return self.refresh()
+        except Exception as e:
+            # Tetap melayani data yang ada (mis. dari snapshot) saat database tidak bisa dihubungi
+            print(f"Sales extract refresh failed: {e}")
+            self.loaded_at = time.monotonic()
+            return 0
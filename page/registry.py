@@ -0,0 +1,162 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Registry dataset bersama per proses. Setiap dataset dimuat sekali dan hanya ada satu
+# salinan di memori; sesi mendapat view (shallow copy) yang berbagi buffer kolom
+# dengan salinan tersebut. pandas copy-on-write menjamin kolom turunan atau penulisan
+# nilai di view hanya membuat salinan kolom yang diubah, dan tidak pernah terlihat oleh
+# sesi lain. Memori tambahan per sesi (kolom yang tidak lagi berbagi buffer dengan
+# dataset bersama) dicatat untuk memperkirakan ukuran replika.
+# Perilaku ini butuh pandas >= 3 (copy-on-write selalu aktif, lihat requirements.txt);
+# buffer numpy dataset bersama juga ditandai read-only sehingga penulisan langsung ke
+# salinan bersama gagal dengan ValueError alih-alih diam-diam terlihat oleh sesi lain.
+
+MAX_SESSIONS = 256
+
+
+def _buffers(series):
+    values = series.array
+    if isinstance(values, pd.Categorical):
+        return [values.codes]
+    if isinstance(values, (pd.arrays.NumpyExtensionArray, pd.arrays.DatetimeArray)):
+        return [series.to_numpy()]
+    try:
+        # Kolom berbasis Arrow (mis. string): buffer setiap chunk, tanpa salinan
+        arrow = pa.array(values)
+        chunks = arrow.chunks if isinstance(arrow, pa.ChunkedArray) else [arrow]
+        return [buffer for chunk in chunks for buffer in chunk.buffers() if buffer is not None]
+    except (TypeError, pa.ArrowException):
+        return [series.to_numpy()]
+
+
+def _overlaps(left, right):
+    if isinstance(left, np.ndarray) and isinstance(right, np.ndarray):
+        return np.shares_memory(left, right)
+    if isinstance(left, pa.Buffer) and isinstance(right, pa.Buffer):
+        return left.address < right.address + right.size and right.address < left.address + left.size
+    return False
+
+
+def shares_memory(series, base):
+    return any(_overlaps(left, right) for left in _buffers(series) for right in _buffers(base))
+
+
+def _freeze(frame):
+    # Kolom berbasis Arrow sudah immutable; array numpy (termasuk kode Categorical dan
+    # datetime) ditandai read-only sampai ke array pemilik buffernya
+    for column in frame.columns:
+        series = frame[column]
+        values = series.array
+        array = values.codes if isinstance(values, pd.Categorical) else series.to_numpy()
+        while isinstance(array, np.ndarray):
+            array.setflags(write=False)
+            array = array.base
+    return frame
+
+
+def view(dataset):
+    # View zero-copy untuk satu sesi: objek DataFrame baru, buffer kolom tetap milik dataset bersama
+    return dataset.copy(deep=False) if isinstance(dataset, pd.DataFrame) else dataset
+
+
+def frame_bytes(frame):
+    return int(frame.memory_usage(deep=True, index=False).sum())
+
+
+def incremental_bytes(frame, shared):
+    # Byte kolom frame yang tidak berbagi buffer dengan kolom bernama sama di dataset bersama
+    total = 0
+    for column in frame.columns:
+        series = frame[column]
+        if not any(column in base.columns and shares_memory(series, base[column]) for base in shared):
+            total += int(series.memory_usage(deep=True, index=False))
+    return total
+
+
+class DatasetRegistry:
+    def __init__(self, max_sessions=MAX_SESSIONS):
+        self._datasets = {}
+        self._sizes = {}
+        self._sessions = OrderedDict()
+        self.max_sessions = max_sessions
+        self._lock = threading.Lock()
+
+    def get(self, name, loader):
+        # Dimuat sekali per proses; sesi lain menunggu load yang sedang berjalan
+        dataset = self._datasets.get(name)
+        if dataset is None:
+            with self._lock:
+                dataset = self._datasets.get(name)
+                if dataset is None:
+                    dataset = loader()
+                    self._store(name, dataset)
+        return dataset
+
+    def _store(self, name, dataset):
+        if isinstance(dataset, pd.DataFrame):
+            _freeze(dataset)
+        self._datasets[name] = dataset
+        self._sizes[name] = frame_bytes(dataset) if isinstance(dataset, pd.DataFrame) else 0
+
+    def put(self, name, dataset):
+        # Mengganti dataset utuh (mis. setelah refresh); view lama tetap valid
+        with self._lock:
+            self._store(name, dataset)
+
+    def view(self, name):
+        return view(self._datasets[name])
+
+    def shared_frames(self):
+        return [dataset for dataset in self._datasets.values() if isinstance(dataset, pd.DataFrame)]
+
+    def shared_bytes(self):
+        return sum(self._sizes.values())
+
+    def track(self, label, frame):
+        # Dicatat per sesi: byte frame turunan yang tidak berbagi memori dengan dataset bersama
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return 0
+        added = incremental_bytes(frame, self.shared_frames())
+        with self._lock:
+            session = self._sessions.pop(ctx.session_id, {})
+            session[label] = added
+            self._sessions[ctx.session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return added
+
+    def session_bytes(self, session_id=None):
+        if session_id is None:
+            ctx = get_script_run_ctx()
+            session_id = ctx.session_id if ctx is not None else None
+        return sum(self._sessions.get(session_id, {}).values())
+
+    def stats(self):
+        with self._lock:
+            per_session = [sum(session.values()) for session in self._sessions.values()]
+        return {
+            "datasets": len(self.shared_frames()),
+            "shared_bytes": self.shared_bytes(),
+            "session_bytes": self.session_bytes(),
+            "sessions": len(per_session),
+            "max_session_bytes": max(per_session, default=0),
+        }
+
+
+registry = DatasetRegistry()
+
+
+def show_memory_stats(registry=registry):
+    stats = registry.stats()
+    st.sidebar.caption(
+        f"Dataset bersama: {stats['shared_bytes'] / 1e6:.1f} MB ({stats['datasets']} dataset) · "
+        f"sesi ini +{stats['session_bytes'] / 1e6:.2f} MB · "
+        f"maks +{stats['max_session_bytes'] / 1e6:.2f} MB per sesi ({stats['sessions']} sesi)"
+    )
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from page.cube import MONTHS
+
+# Kolom berkardinalitas rendah disimpan sebagai categorical (kode integer + kamus nilai)
+CATEGORICAL_COLUMNS = ["Month", "Gender", "SalesTerritoryCountry", "EnglishProductCategoryName"]
+ORDERED_CATEGORIES = {"Month": MONTHS}
+INTEGER_COLUMNS = ["Year", "SalesOrderLineNumber", "OrderQuantity", "CustomerKey"]
+FLOAT_COLUMNS = ["SalesAmount", "TotalProductCost", "YearlyIncome"]
+
+
+def bytes_per_row(df):
+    if len(df) == 0:
+        return 0.0
+    return df.memory_usage(deep=True, index=True).sum() / len(df)
+
+
+def report_bytes(before, after, rows):
+    print(f"Sales extract: {before:,.1f} -> {after:,.1f} bytes/row ({rows:,} rows)")
+
+
+def _downcast_float(series):
+    # float32 hanya dipakai jika nilainya tetap sama persis (mis. YearlyIncome bulat);
+    # nilai uang dengan 4 desimal tetap float64 agar total KPI tidak bergeser
+    if series.isna().any() or not np.isfinite(series.to_numpy()).all():
+        return series
+    downcast = series.astype(np.float32)
+    if np.array_equal(downcast.to_numpy(dtype=np.float64), series.to_numpy()):
+        return downcast
+    return series
+
+
+def compact_sales(df, report=True):
+    before = bytes_per_row(df)
+    df = df.copy()
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            categories = ORDERED_CATEGORIES.get(column)
+            if categories is not None:
+                extra = sorted(set(df[column].dropna()) - set(categories))
+                df[column] = pd.Categorical(df[column], categories=categories + extra)
+            else:
+                df[column] = df[column].astype("category")
+    for column in INTEGER_COLUMNS:
+        if column in df.columns and not df[column].isna().any():
+            df[column] = pd.to_numeric(df[column], downcast="integer")
+    for column in FLOAT_COLUMNS:
+        if column in df.columns and df[column].dtype == np.float64:
+            df[column] = _downcast_float(df[column])
+    if report:
+        report_bytes(before, bytes_per_row(df), len(df))
+    return df
+
+
+def concat_compact(frames):
+    # Menggabungkan beberapa frame compact (chunk extract atau delta refresh) dengan
+    # menyamakan kategori dan dtype numerik, supaya categorical tidak menjadi object
+    frames = [frame.copy(deep=False) for frame in frames]
+    if len(frames) == 1:
+        return frames[0]
+    for column in CATEGORICAL_COLUMNS:
+        if all(column in frame.columns and isinstance(frame[column].dtype, pd.CategoricalDtype) for frame in frames):
+            categories = frames[0][column].cat.categories
+            for frame in frames[1:]:
+                categories = categories.union(frame[column].cat.categories, sort=False)
+            for frame in frames:
+                frame[column] = frame[column].cat.set_categories(categories)
+    for column in INTEGER_COLUMNS + FLOAT_COLUMNS:
+        if all(column in frame.columns for frame in frames):
+            common = np.result_type(*[frame[column].dtype for frame in frames])
+            for frame in frames:
+                frame[column] = frame[column].astype(common)
+    return pd.concat(frames, ignore_index=True)
+
+
+def append_rows(df, delta):
+    return concat_compact([df, compact_sales(delta, report=False)])
+
+
+def customer_names(df):
+    # Kamus CustomerKey -> nama customer
+    return pd.Series(df["Customer"].to_numpy(), index=df["CustomerKey"].to_numpy(), name="Customer")
+
+
+def with_customer_names(df, names):
+    if "CustomerKey" not in df.columns or names is None:
+        return df
+    named = df.copy(deep=False)
+    named.insert(named.columns.get_loc("CustomerKey") + 1, "Customer", names.reindex(df["CustomerKey"]).to_numpy())
+    return named
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from sqlalchemy import text
+
+# Tabel berhalaman di sisi server: sort, proyeksi kolom dan ukuran halaman dihitung
+# di Python/SQL dan hanya jendela baris yang terlihat yang dikirim ke browser.
+# Tidak ada yang dihitung selama expander masih tertutup.
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def _sort_key(values):
+    # Kunci sort numerik (float64): kolom non-numerik difaktorisasi terurut, NaN di awal
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(dtype=np.float64)
+    if pd.api.types.is_numeric_dtype(values.dtype) and not pd.api.types.is_bool_dtype(values.dtype):
+        return values.to_numpy(dtype=np.float64, na_value=-np.inf)
+    codes, _ = pd.factorize(values, sort=True)
+    return codes.astype(np.float64)
+
+
+def frame_pager(df, decorate=None):
+    # Sumber data dari DataFrame. decorate(window) dipanggil hanya untuk baris yang
+    # tampil (mis. menambahkan nama customer dari kamus CustomerKey).
+    decorate = decorate or (lambda window: window)
+    columns = decorate(df.head(0)).columns.tolist()
+    # Kolom hasil decorate baru ada setelah paging, jadi tidak bisa dipakai untuk sort
+    sortable = [column for column in columns if column in df.columns]
+
+    def fetch(selected, sort_by, ascending, offset, limit):
+        stop = min(offset + limit, len(df))
+        if sort_by is not None and sort_by in df.columns:
+            order = _sort_key(df[sort_by])
+            if not ascending:
+                order = -order
+            if stop < len(df):
+                # Cukup partisi sebagian lalu urutkan potongan yang dibutuhkan saja. Nilai
+                # kembar di batas potongan diambil menurut posisi baris, sama seperti sort
+                # stabil penuh, supaya halaman berurutan tidak mengulang/melewati baris.
+                pivot = order[np.argpartition(order, stop - 1)[stop - 1]]
+                before = np.flatnonzero(order < pivot)
+                ties = np.flatnonzero(order == pivot)[:stop - len(before)]
+                head = np.concatenate([before, ties])
+                positions = head[np.lexsort((head, order[head]))][offset:stop]
+            else:
+                positions = np.lexsort((np.arange(len(df)), order))[offset:stop]
+        else:
+            positions = np.arange(offset, stop)
+        window = decorate(df.take(positions))
+        return window[[column for column in selected if column in window.columns]]
+
+    return columns, sortable, len(df), fetch
+
+
+def query_pager(engine, query):
+    # Sumber data dari query SQL: proyeksi, ORDER BY dan LIMIT/OFFSET dijalankan di database
+    base = query.strip().rstrip(";")
+    with engine.connect() as connection:
+        total = connection.execute(text(f"SELECT COUNT(*) FROM ({base}) AS extract")).scalar()
+        columns = pd.read_sql(text(f"SELECT * FROM ({base}) AS extract LIMIT 0"), connection).columns.tolist()
+
+    def fetch(selected, sort_by, ascending, offset, limit):
+        projection = ", ".join(f"extract.{column}" for column in selected if column in columns) or "*"
+        sql = f"SELECT {projection} FROM ({base}) AS extract"
+        if sort_by in columns:
+            sql += f" ORDER BY extract.{sort_by} {'ASC' if ascending else 'DESC'}"
+        sql += " LIMIT :limit OFFSET :offset"
+        with engine.connect() as connection:
+            return pd.read_sql(text(sql), connection, params={"limit": int(limit), "offset": int(offset)})
+
+    return columns, columns, int(total or 0), fetch
+
+
+@st.fragment
+def paged_table(label, key, pager):
+    # pager: fungsi tanpa argumen yang mengembalikan (kolom, kolom sortable, jumlah baris, fetch);
+    # baru dipanggil setelah expander dibuka. Sebagai fragment, ganti halaman/sort
+    # hanya menjalankan ulang tabel ini, bukan filter dan chart di halaman
+    with st.expander(label, key=f"{key}_expander", on_change="rerun") as expander:
+        if expander.open is False:
+            return
+        columns, sortable, total, fetch = pager()
+        selected = st.multiselect('Filter Kolom: ', columns, default=columns, key=f"{key}_columns")
+
+        sort_column, order_column, size_column, page_column = st.columns(4)
+        sort_by = sort_column.selectbox('Urutkan', [None] + sortable, key=f"{key}_sort")
+        ascending = order_column.radio('Urutan', ['Naik', 'Turun'], key=f"{key}_order", horizontal=True) == 'Naik'
+        page_size = size_column.selectbox('Baris per halaman', PAGE_SIZES, index=1, key=f"{key}_size")
+        pages = max(1, math.ceil(total / page_size))
+        page = page_column.number_input('Halaman', min_value=1, max_value=pages, value=1, step=1, key=f"{key}_page")
+
+        offset = (int(page) - 1) * page_size
+        st.dataframe(fetch(selected, sort_by, ascending, offset, page_size))
+        st.caption(f"Menampilkan baris {min(offset + 1, total):,}-{min(offset + page_size, total):,} dari {total:,}")
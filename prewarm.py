@@ -0,0 +1,196 @@
+# Prewarm figure cache dashboard tanpa Streamlit: agregasi dan figure halaman
+# Adventure Works, IMDB dan IMDB Catalogue dibangun untuk kombinasi filter umum
+# (semua, per tahun, per negara, per rating) di process pool, lalu ditulis ke folder
+# figure cache di disk (FIGURE_CACHE_DIR, opt-in; dashboard memakai env yang sama) yang
+# dibaca dashboard. Untuk deploy atau job malam; --report juga menulis laporan statis
+# JSON/Parquet per kombinasi.
+#
+#   FIGURE_CACHE_DIR=data/figcache python prewarm.py
+#   python prewarm.py --pages adventure_works --workers 4 --report reports
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+PAGES = ["adventure_works", "imdb", "catalogue"]
+
+_modules = {}
+
+
+def page_module(name):
+    # Modul halaman di-import dan datanya dimuat sekali per proses. Proses utama memuat
+    # lebih dulu, jadi extract Adventure Works sudah ada di snapshot (atau diwarisi
+    # lewat fork) saat worker memuatnya.
+    if name not in _modules:
+        if name == "adventure_works":
+            import page.db as module
+            if module.DB_MODE != 'pushdown':
+                module.store.load()
+        elif name == "imdb":
+            import page.imdb as module
+        else:
+            import page.catalogue as module
+            if module.titles is None:
+                module = None
+        _modules[name] = module
+    return _modules[name]
+
+
+def combinations(name, module):
+    if name == "adventure_works":
+        if module.DB_MODE == 'pushdown':
+            years, countries = module.distinct_values(module.engine)
+        else:
+            # Sama dengan opsi multiselect di show_db
+            df = module.store.df
+            years = df["Year"].unique().tolist()
+            countries = df["SalesTerritoryCountry"].unique().tolist()
+        return ([{"years": years, "countries": countries}]
+                + [{"years": [year], "countries": countries} for year in years]
+                + [{"years": years, "countries": [country]} for country in countries])
+
+    if name == "imdb":
+        ratings = module.df["Rating"].unique().tolist()
+    else:
+        ratings = list(module.RATING_BANDS)
+    return ([{"min_year": None, "max_year": None, "ratings": ratings}]
+            + [{"min_year": None, "max_year": None, "ratings": [rating]} for rating in ratings])
+
+
+def cache_key(name, module, selection):
+    if name == "adventure_works":
+        return module.cache_key(selection["years"], selection["countries"])
+    return module.cache_key(selection)
+
+
+def build(name, module, selection):
+    if name == "adventure_works":
+        df, cube, index = module.store.snapshot()
+        return module.build_charts(df, cube, index, selection["years"], selection["countries"])
+    return module.build_figures(module.select(selection))
+
+
+def init_worker(cache_dir):
+    from page.figcache import figure_cache
+    figure_cache.directory = cache_dir or None
+    # Koneksi pool SQLAlchemy yang diwarisi lewat fork tidak boleh dipakai bersama proses utama
+    if "adventure_works" in _modules and _modules["adventure_works"] is not None:
+        _modules["adventure_works"].engine.dispose(close=False)
+
+
+def _json_value(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def write_report(directory, name, key, selection, data, figures):
+    # Satu JSON per kombinasi (filter, nilai KPI, spec figure Plotly); frame agregat
+    # di data ditulis sebagai Parquet di sebelahnya
+    directory = os.path.join(directory, name)
+    os.makedirs(directory, exist_ok=True)
+    slug = key.split(":", 1)[1]
+    frames, values = {}, {}
+    for label, value in data.items():
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            frame = value.to_frame() if isinstance(value, pd.Series) else value
+            frames[label] = f"{slug}_{label}.parquet"
+            frame.to_parquet(os.path.join(directory, frames[label]))
+        else:
+            values[label] = value
+    report = {
+        "page": name,
+        "key": key,
+        "filters": selection,
+        "data": values,
+        "frames": frames,
+        "figures": {label: json.loads(fig.to_json()) for label, fig in figures.items()},
+    }
+    path = os.path.join(directory, f"{slug}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, default=_json_value)
+    return os.path.relpath(path, os.path.dirname(directory))
+
+
+def warm(name, selection, report_dir=None, force=False):
+    from page.figcache import figure_cache
+    module = page_module(name)
+    key = cache_key(name, module, selection)
+    if figure_cache.contains(key) and not force and not report_dir:
+        return {"key": key, "built": False, "seconds": 0.0, "report": None}
+    start = time.perf_counter()
+    data, figures = build(name, module, selection)
+    if figure_cache.directory:
+        figure_cache.put(key, data, figures)
+    report = write_report(report_dir, name, key, selection, data, figures) if report_dir else None
+    return {"key": key, "built": True, "seconds": time.perf_counter() - start, "report": report}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prewarm figure cache dashboard untuk kombinasi filter umum")
+    parser.add_argument("--pages", nargs="+", choices=PAGES, default=PAGES)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="jumlah proses worker")
+    parser.add_argument("--cache-dir", default=None, help="folder figure cache (default: FIGURE_CACHE_DIR)")
+    parser.add_argument("--report", default=None, help="folder laporan statis JSON/Parquet")
+    parser.add_argument("--force", action="store_true", help="bangun ulang kombinasi yang sudah ada di cache")
+    parser.add_argument("--clear", action="store_true", help="hapus isi folder figure cache lebih dulu")
+    args = parser.parse_args()
+
+    from page.figcache import figure_cache
+    if args.cache_dir is not None:
+        figure_cache.directory = args.cache_dir or None
+    if not figure_cache.directory and not args.report:
+        parser.error("figure cache di disk nonaktif (FIGURE_CACHE_DIR kosong); isi --cache-dir atau --report")
+    if args.clear:
+        figure_cache.clear(disk=True)
+
+    start = time.perf_counter()
+    tasks = []
+    for name in args.pages:
+        module = page_module(name)
+        if module is None:
+            print(f"{name}: dataset belum ada, dilewati")
+            continue
+        selections = combinations(name, module)
+        tasks += [(name, selection) for selection in selections]
+        print(f"{name}: {len(selections)} kombinasi filter")
+
+    built, skipped, failed, reports = 0, 0, 0, []
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                             initargs=(figure_cache.directory,)) as pool:
+        futures = {pool.submit(warm, name, selection, args.report, args.force): (name, selection)
+                   for name, selection in tasks}
+        for future in as_completed(futures):
+            name, selection = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"{name} {selection}: gagal: {e}")
+                continue
+            if not result["built"]:
+                skipped += 1
+                continue
+            built += 1
+            if result["report"] is not None:
+                reports.append({"page": name, "key": result["key"], "filters": selection, "report": result["report"]})
+            print(f"{name} {result['key']}: {result['seconds'] * 1000:.0f} ms")
+
+    if args.report:
+        os.makedirs(args.report, exist_ok=True)
+        with open(os.path.join(args.report, "index.json"), "w") as f:
+            json.dump(reports, f, indent=2, default=_json_value)
+    print(f"{built} dibangun, {skipped} sudah ada di cache, {failed} gagal "
+          f"dalam {time.perf_counter() - start:.1f} detik ({args.workers} worker)")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Scraping IMDb Top 250 langsung ke dataset dashboard data/imdb.arrow (lihat
+# scraper/dataset.py). Halaman detail diambil paralel (lihat scraper/). Tiga CSV
+# lama (halaman_movies_250.csv, box_office_250.csv, technical_specs_250.csv)
+# hanya ditulis dengan --csv.
+#
+#   python scrape_imdb.py --workers 8 --rate 4
+#   python scrape_imdb.py --base-url http://localhost:8000   # server lokal berisi fixture
+#   python scrape_imdb.py --replay                           # parse ulang dari cache, tanpa jaringan
+#   python scrape_imdb.py --incremental --max-age 30         # hanya film baru / data > 30 hari
+import argparse
+import time
+from urllib.parse import urljoin
+
+from scraper.cache import PageCache
+from scraper.dataset import DATASET_FILE, write_dataset
+from scraper.fetch import Fetcher, BrowserPool
+from scraper.incremental import STORE_FILE, refresh_top250
+from scraper.top250 import CHART_URL, CHART_PATH, scrape_top250, write_csvs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape IMDb Top 250")
+    parser.add_argument("--workers", type=int, default=8, help="jumlah worker halaman detail")
+    parser.add_argument("--rate", type=float, default=4.0, help="maksimal request per detik per host")
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--backoff", type=float, default=1.0, help="detik dasar exponential backoff")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--limit", type=int, help="hanya N film teratas")
+    parser.add_argument("--base-url", help="ganti https://www.imdb.com, mis. server lokal berisi fixture")
+    parser.add_argument("--render", type=int, default=0, metavar="N",
+                        help="pakai N Chrome headless sebagai fallback halaman yang butuh JavaScript")
+    parser.add_argument("--chromedriver", help="path chromedriver (default: dari PATH / Selenium Manager)")
+    parser.add_argument("--cache-dir", default="data/http_cache", help="cache halaman di disk")
+    parser.add_argument("--no-cache", action="store_true", help="selalu download ulang, tanpa cache")
+    parser.add_argument("--ttl", type=float, default=12.0,
+                        help="jam halaman cache dipakai tanpa request; setelahnya direvalidasi (ETag/Last-Modified)")
+    parser.add_argument("--replay", action="store_true", help="offline: parse ulang semua halaman dari cache")
+    parser.add_argument("--incremental", action="store_true",
+                        help="upsert ke store per ID title; detail hanya diambil untuk film baru atau kedaluwarsa")
+    parser.add_argument("--store", default=STORE_FILE, help="store film per ID title untuk --incremental")
+    parser.add_argument("--max-age", type=float, default=30, help="hari sebelum detail film diambil ulang (--incremental)")
+    parser.add_argument("--dataset", default=DATASET_FILE, help="dataset Arrow untuk dashboard")
+    parser.add_argument("--csv", action="store_true", help="tulis juga tiga CSV format notebook")
+    parser.add_argument("--out", default=".", help="folder keluaran CSV (--csv)")
+    args = parser.parse_args()
+
+    renderer = BrowserPool(args.render, args.chromedriver) if args.render else None
+    if args.replay and args.no_cache:
+        parser.error("--replay membutuhkan cache")
+    cache = None if args.no_cache else PageCache(args.cache_dir, args.ttl * 3600)
+    fetcher = Fetcher(args.rate, args.retries, args.backoff, args.timeout, renderer=renderer, cache=cache, replay=args.replay)
+    chart_url = urljoin(args.base_url, CHART_PATH) if args.base_url else CHART_URL
+
+    start = time.perf_counter()
+    try:
+        if args.incremental:
+            frame, counts = refresh_top250(fetcher, args.store, chart_url, args.workers, args.max_age, args.limit)
+            print(f"Store {args.store}: {counts['fetched']} film diperbarui, {counts['failed']} gagal")
+        else:
+            frame = scrape_top250(fetcher, chart_url, args.workers, args.limit)
+    finally:
+        if renderer is not None:
+            renderer.close()
+    rows = write_dataset(frame, args.dataset)
+    print(f"Ditulis: {args.dataset} ({rows} dari {len(frame)} film setelah filter outlier)")
+    if args.csv:
+        for path in write_csvs(frame, args.out):
+            print(f"Ditulis: {path}")
+    stats = fetcher.stats
+    print(f"Halaman: {stats['network']} download, {stats['not_modified']} tidak berubah (304), "
+          f"{stats['cached']} dari cache, {stats['rendered']} di-render browser")
+    print(f"Selesai dalam {time.perf_counter() - start:.1f} detik")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+# Scraper IMDb Top 250 (pengganti loop serial di scraping-imdb.ipynb), dijalankan lewat scrape_imdb.py
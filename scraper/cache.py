@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+import time
+
+# Cache halaman hasil fetch di disk. Isi halaman disimpan content-addressed
+# (objects/<sha256 isi>), sedangkan index per URL menyimpan ETag/Last-Modified dan
+# waktu fetch untuk revalidasi kondisional. Halaman yang isinya sama (mis. setelah
+# 304 atau refresh tanpa perubahan) tidak ditulis dua kali.
+
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class PageCache:
+    def __init__(self, directory, ttl=None):
+        # ttl dalam detik: selama umur entri < ttl halaman dipakai tanpa request sama sekali;
+        # None = selalu revalidasi ke server
+        self.directory = directory
+        self.ttl = ttl
+
+    def _index_path(self, url):
+        key = _sha256(url.encode())
+        return os.path.join(self.directory, "index", key[:2], f"{key}.json")
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, "objects", digest[:2], digest)
+
+    def lookup(self, url):
+        try:
+            with open(self._index_path(url)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(self._object_path(entry["sha256"])):
+            return None
+        return entry
+
+    def body(self, entry):
+        with open(self._object_path(entry["sha256"]), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def is_fresh(self, entry):
+        return self.ttl is not None and time.time() - entry["fetched_at"] < self.ttl
+
+    def validators(self, entry):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, html, etag=None, last_modified=None):
+        data = html.encode("utf-8")
+        digest = _sha256(data)
+        if not os.path.exists(self._object_path(digest)):
+            _write_atomic(self._object_path(digest), data)
+        entry = {"url": url, "sha256": digest, "etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+        _write_atomic(self._index_path(url), json.dumps(entry).encode())
+        return entry
+
+    def touch(self, entry):
+        # Respons 304: isi tetap, hanya waktu validasi yang diperbarui
+        entry = {**entry, "fetched_at": time.time()}
+        _write_atomic(self._index_path(entry["url"]), json.dumps(entry).encode())
+        return entry
+
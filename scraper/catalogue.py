@@ -0,0 +1,94 @@
+import csv
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Ingest dump non-komersial IMDb (https://datasets.imdbws.com/) ke satu file Arrow IPC
+# bertipe untuk halaman IMDB Catalogue. title.basics (jutaan baris) dibaca per chunk,
+# difilter per titleType, di-join dengan title.ratings lewat tconst lalu setiap chunk
+# langsung ditulis sebagai record batch, jadi memori hanya sebesar satu chunk + ratings.
+
+CATALOGUE_FILE = "data/imdb_catalogue.arrow"
+CHUNKSIZE = 250_000
+
+TITLE_TYPES = ["movie", "short", "tvEpisode", "tvMiniSeries", "tvMovie", "tvPilot", "tvSeries",
+               "tvShort", "tvSpecial", "video", "videoGame"]
+UNRATED = "Unrated"
+# Band rating IMDb (1.0-10.0): "7-8" berarti 7.0 sampai 7.9, rating 10 masuk "9-10"
+RATING_BANDS = [UNRATED] + [f"{band}-{band + 1}" for band in range(1, 10)]
+
+CATALOGUE_SCHEMA = pa.schema([
+    ("tconst", pa.string()),
+    ("Name", pa.string()),
+    ("Title_Type", pa.dictionary(pa.int8(), pa.string())),
+    ("Year", pa.int16()),
+    ("Durasi(Menit)", pa.int16()),
+    ("Genres", pa.string()),
+    ("Average_Rating", pa.float32()),
+    ("Num_Votes", pa.int32()),
+    ("Rating", pa.dictionary(pa.int8(), pa.string())),
+])
+
+
+def _read_tsv(path, usecols, dtype, chunksize=None):
+    # Format dump IMDb: tab, tanpa quoting, \N untuk nilai kosong, boleh .gz
+    return pd.read_csv(path, sep="\t", quoting=csv.QUOTE_NONE, usecols=usecols, dtype=dtype,
+                       na_values=["\\N"], keep_default_na=False, chunksize=chunksize)
+
+
+def read_ratings(path):
+    ratings = _read_tsv(path, ["tconst", "averageRating", "numVotes"],
+                        {"tconst": str, "averageRating": "float32", "numVotes": "int32"})
+    return ratings.set_index("tconst")
+
+
+def rating_bands(average_rating):
+    bands = np.clip(np.floor(average_rating.to_numpy(dtype=np.float64, na_value=np.nan)), 1, 9)
+    codes = np.where(np.isnan(bands), 0, np.nan_to_num(bands)).astype(np.int8)
+    return pd.Categorical.from_codes(codes, categories=RATING_BANDS)
+
+
+def clean_chunk(basics, ratings, title_types=None, min_votes=0):
+    if title_types is not None:
+        basics = basics[basics["titleType"].isin(title_types)]
+    chunk = basics.join(ratings, on="tconst")
+    years = pd.to_numeric(chunk["startYear"], errors="coerce")
+    votes = chunk["numVotes"].fillna(0)
+    # Judul tanpa tahun rilis (umumnya belum rilis) tidak bisa difilter di dashboard
+    keep = years.notna() & (votes >= min_votes)
+    chunk = chunk[keep]
+    return pd.DataFrame({
+        "tconst": chunk["tconst"],
+        "Name": chunk["primaryTitle"],
+        # Kategori tetap, supaya dictionary setiap record batch sama
+        "Title_Type": pd.Categorical(chunk["titleType"], categories=TITLE_TYPES),
+        "Year": years[keep],
+        "Durasi(Menit)": pd.to_numeric(chunk["runtimeMinutes"], errors="coerce"),
+        "Genres": chunk["genres"],
+        "Average_Rating": chunk["averageRating"],
+        "Num_Votes": votes[keep],
+        "Rating": rating_bands(chunk["averageRating"]),
+    })
+
+
+def ingest_catalogue(basics_path, ratings_path, path=CATALOGUE_FILE, title_types=("movie",), min_votes=0,
+                     chunksize=CHUNKSIZE, progress=None):
+    ratings = read_ratings(ratings_path)
+    chunks = _read_tsv(basics_path, ["tconst", "titleType", "primaryTitle", "startYear", "runtimeMinutes", "genres"],
+                       str, chunksize)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    read = written = 0
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, CATALOGUE_SCHEMA) as writer:
+            for basics in chunks:
+                chunk = clean_chunk(basics, ratings, title_types, min_votes)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=CATALOGUE_SCHEMA, preserve_index=False))
+                read += len(basics)
+                written += len(chunk)
+                if progress is not None:
+                    progress(read, written)
+    os.replace(tmp_path, path)
+    return read, written
@@ -0,0 +1,89 @@
+import os
+
+import pandas as pd
+import pyarrow as pa
+
+from scraper.parse import DEFAULT_OPEN_WEEK_DATE
+
+# Dataset dashboard IMDB: hasil scrape langsung dibersihkan dan ditulis ke satu file
+# Arrow IPC bertipe (schema di bawah), menggantikan alur notebook tiga CSV -> merge
+# per Name -> imdb_combined.csv -> remove_numbers -> filter outlier -> CSV lagi.
+# Dashboard membaca file ini lewat memory map tanpa parsing CSV.
+
+DATASET_FILE = "data/imdb.arrow"
+
+_CATEGORY = pa.dictionary(pa.int16(), pa.string())
+
+SCHEMA = pa.schema([
+    ("tconst", pa.string()),
+    ("Name", pa.string()),
+    ("Year", pa.int16()),
+    ("Durasi(Menit)", pa.int16()),
+    ("Rating", _CATEGORY),
+    ("Budget", pa.int64()),
+    ("Gross_US", pa.int64()),
+    ("Opening_Week", pa.int64()),
+    ("Open_Week_Date", pa.date32()),
+    ("Gross_World", pa.int64()),
+    ("Color", _CATEGORY),
+    ("Sound_Mix", _CATEGORY),
+    ("Aspect_Ratio", pa.string()),
+])
+
+# Batas outlier dari notebook (baris dibuang jika nilainya >= batas)
+OUTLIER_LIMITS = {
+    "Budget": 200_000_000,
+    "Gross_US": 50_000_000,
+    "Opening_Week": 30_000_000,
+    "Gross_World": 200_000_000,
+    "Durasi(Menit)": 300,
+}
+
+MONEY_COLUMNS = ["Budget", "Gross_US", "Opening_Week", "Gross_World"]
+CATEGORY_COLUMNS = ["Rating", "Color", "Sound_Mix"]
+
+
+def clean_movies(frame, limits=OUTLIER_LIMITS):
+    # Semua aturan dijalankan per kolom (vektor), bukan apply per baris
+    movies = pd.DataFrame(index=frame.index)
+    movies["tconst"] = frame["tconst"] if "tconst" in frame else None
+    # Hapus prefix rank "12. " dari judul
+    movies["Name"] = frame["Name"].astype(str).str.replace(r"^\d+\.\s*", "", regex=True)
+    movies["Year"] = pd.to_numeric(frame["Year"], errors="coerce")
+    movies["Durasi(Menit)"] = pd.to_numeric(frame["Durasi(Menit)"], errors="coerce").fillna(0)
+    for column in MONEY_COLUMNS:
+        movies[column] = pd.to_numeric(frame[column], errors="coerce").fillna(0)
+    dates = frame["Open_Week_Date"].where(frame["Open_Week_Date"] != DEFAULT_OPEN_WEEK_DATE)
+    movies["Open_Week_Date"] = pd.to_datetime(dates, errors="coerce", format="ISO8601").dt.date
+    for column in CATEGORY_COLUMNS + ["Aspect_Ratio"]:
+        values = frame[column].astype("string").str.strip()
+        movies[column] = values.where(values != "")
+    # Kategori terurut alfabet, sehingga urutan kode = urutan sort di tabel dashboard
+    movies[CATEGORY_COLUMNS] = movies[CATEGORY_COLUMNS].astype("category")
+
+    # Film tanpa tahun rilis tidak bisa difilter di dashboard
+    keep = movies["Year"].notna()
+    for column, limit in limits.items():
+        keep &= movies[column] < limit
+    return movies[keep].reset_index(drop=True)
+
+
+def to_table(movies):
+    return pa.Table.from_pandas(movies, schema=SCHEMA, preserve_index=False)
+
+
+def write_dataset(frame, path=DATASET_FILE, limits=OUTLIER_LIMITS):
+    table = to_table(clean_movies(frame, limits))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+    return table.num_rows
+
+
+def read_dataset(path=DATASET_FILE):
+    table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    # date32 -> datetime64, dictionary -> category
+    return table.to_pandas(date_as_object=False, split_blocks=True)
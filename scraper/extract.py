@@ -0,0 +1,251 @@
+import json
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+from scraper import parse
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# Ekstraksi data film dari halaman IMDb. Urutan sumber:
+#   1. data terstruktur yang disematkan halaman (__NEXT_DATA__ lalu JSON-LD), dibaca
+#      dengan regex yang sudah dikompilasi + json.loads, tanpa membangun DOM
+#   2. lxml dengan XPath terkompilasi yang hanya memakai atribut stabil
+#      (data-testid, ipc-*, href /title/tt...), bukan class hash seperti sc-b189961a-0
+#   3. parser BeautifulSoup lama (scraper.parse) jika lxml tidak terpasang
+# Hasilnya berbentuk sama dengan scraper.parse.
+
+_NEXT_DATA = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+_JSON_LD = re.compile(r'<script[^>]*\btype="application/ld\+json"[^>]*>(.*?)</script>', re.S)
+_ISO_DURATION = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?")
+_TITLE_ID = re.compile(r"/title/(tt\d+)")
+
+if lxml_html is not None:
+    _CHART_LINKS = etree.XPath('//a[contains(@href, "/title/tt")][.//h3[contains(@class, "ipc-title__text")]]')
+    _CHART_TITLE = etree.XPath('string(.//h3[contains(@class, "ipc-title__text")])')
+    _CHART_METADATA = etree.XPath(
+        'ancestor::*[.//span[contains(@class, "cli-title-metadata-item")]][1]'
+        '//span[contains(@class, "cli-title-metadata-item")]/text()')
+    _BOX_OFFICE = etree.XPath(
+        '//*[@data-testid="title-boxoffice-section"]'
+        '//span[contains(concat(" ", normalize-space(@class), " "), " ipc-metadata-list-item__list-content-item ")]/text()')
+    _TECH_SPECS = etree.XPath(
+        '//*[@data-testid="title-techspecs-section"]'
+        '//div[contains(@class, "ipc-metadata-list-item__content-container")]')
+    _SPEC_LINKS = etree.XPath('.//a[contains(@class, "ipc-metadata-list-item__list-content-item--link")]/text()')
+
+
+def _dig(data, *keys):
+    for key in keys:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and isinstance(key, int) and -len(data) <= key < len(data):
+            data = data[key]
+        else:
+            return None
+    return data
+
+
+def next_data(html):
+    match = _NEXT_DATA.search(html)
+    if match is None:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def json_ld(html):
+    for match in _JSON_LD.finditer(html):
+        try:
+            yield json.loads(match.group(1))
+        except ValueError:
+            continue
+
+
+def title_id(url):
+    match = _TITLE_ID.search(url or "")
+    return match.group(1) if match else None
+
+
+def _certificate(value):
+    return value if value else "Not Rated"
+
+
+def _chart_from_next_data(data, base_url):
+    edges = _dig(data, "props", "pageProps", "pageData", "chartTitles", "edges")
+    if not edges:
+        return None
+    movies = []
+    for position, edge in enumerate(edges, start=1):
+        node = edge.get("node") or {}
+        tconst = node.get("id")
+        seconds = _dig(node, "runtime", "seconds") or 0
+        movies.append({
+            "Name": f"{edge.get('currentRank') or position}. {_dig(node, 'titleText', 'text')}",
+            "Year": str(_dig(node, "releaseYear", "year") or ""),
+            "Durasi(Menit)": seconds // 60,
+            "Rating": _certificate(_dig(node, "certificate", "rating")),
+            "url": urljoin(base_url, f"/title/{tconst}/"),
+            "tconst": tconst,
+        })
+    return movies
+
+
+def _minutes(duration):
+    # Durasi ISO 8601 JSON-LD ("PT2H22M") -> menit
+    match = _ISO_DURATION.fullmatch(duration or "")
+    return int(match.group(1) or 0) * 60 + int(match.group(2) or 0) if match else 0
+
+
+def _chart_from_json_ld(html, base_url):
+    for data in json_ld(html):
+        if not isinstance(data, dict) or data.get("@type") != "ItemList":
+            continue
+        movies = []
+        for position, element in enumerate(data.get("itemListElement") or [], start=1):
+            item = element.get("item") or {}
+            url = urljoin(base_url, item.get("url") or "")
+            movies.append({
+                "Name": f"{element.get('position') or position}. {item.get('name')}",
+                # JSON-LD chart tidak memuat tahun rilis
+                "Year": "",
+                "Durasi(Menit)": _minutes(item.get("duration")),
+                "Rating": _certificate(item.get("contentRating")),
+                "url": url,
+                "tconst": title_id(url),
+            })
+        return movies or None
+    return None
+
+
+def chart_from_lxml(html, base_url):
+    movies = []
+    if not html.strip():
+        return movies
+    tree = lxml_html.fromstring(html)
+    for link in _CHART_LINKS(tree):
+        metadata = _CHART_METADATA(link)
+        url = urljoin(base_url, link.get("href"))
+        movies.append({
+            "Name": _CHART_TITLE(link),
+            "Year": metadata[0] if metadata else "",
+            "Durasi(Menit)": parse.parse_minutes(metadata[1]) if len(metadata) > 1 else 0,
+            "Rating": metadata[2] if len(metadata) > 2 else "Not Rated",
+            "url": url,
+            "tconst": title_id(url),
+        })
+    return movies
+
+
+def extract_chart(html, base_url):
+    data = next_data(html)
+    movies = _chart_from_next_data(data, base_url) if data is not None else None
+    if movies is None:
+        movies = _chart_from_json_ld(html, base_url)
+    if movies is None:
+        if lxml_html is not None:
+            movies = chart_from_lxml(html, base_url)
+        else:
+            movies = [{**movie, "tconst": title_id(movie["url"])} for movie in parse.parse_chart(html, base_url)]
+    return movies
+
+
+def _amount(value):
+    return int(value) if isinstance(value, (int, float)) else 0
+
+
+def _detail_from_next_data(data):
+    column = _dig(data, "props", "pageProps", "mainColumnData")
+    if not column:
+        return None
+    weekend_date = _dig(column, "openingWeekendGross", "weekendEndDate")
+    try:
+        open_week_date = str(datetime.strptime(weekend_date, "%Y-%m-%d")) if weekend_date else parse.DEFAULT_OPEN_WEEK_DATE
+    except ValueError:
+        open_week_date = parse.DEFAULT_OPEN_WEEK_DATE
+    specs = column.get("technicalSpecifications") or {}
+
+    def spec_items(name, field):
+        return [item.get(field) for item in _dig(specs, name, "items") or [] if item.get(field)]
+
+    aspect_ratios = spec_items("aspectRatios", "aspectRatio")
+    return {
+        "Budget": _amount(_dig(column, "productionBudget", "budget", "amount")),
+        "Gross_US": _amount(_dig(column, "lifetimeGross", "total", "amount")),
+        "Opening_Week": _amount(_dig(column, "openingWeekendGross", "gross", "total", "amount")),
+        "Open_Week_Date": open_week_date,
+        "Gross_World": _amount(_dig(column, "worldwideGross", "total", "amount")),
+        "Color": " ".join(spec_items("colorations", "text")),
+        "Sound_Mix": " ".join(spec_items("soundMixes", "text")),
+        "Aspect_Ratio": aspect_ratios[0] if aspect_ratios else "",
+    }
+
+
+def detail_from_lxml(html):
+    detail = parse.empty_detail()
+    if not html.strip():
+        return detail
+    tree = lxml_html.fromstring(html)
+    values = _BOX_OFFICE(tree)
+    if len(values) > 4:
+        detail["Budget"] = parse.parse_number(values[0])
+        detail["Gross_US"] = parse.parse_number(values[1])
+        detail["Opening_Week"] = parse.parse_number(values[2])
+        detail["Open_Week_Date"] = parse.parse_date(values[3])
+        detail["Gross_World"] = parse.parse_number(values[4])
+    specs = _TECH_SPECS(tree)
+    if len(specs) > 3:
+        detail["Color"] = " ".join(_SPEC_LINKS(specs[1]))
+        detail["Sound_Mix"] = " ".join(_SPEC_LINKS(specs[2]))
+        detail["Aspect_Ratio"] = specs[3].text_content()
+    return detail
+
+
+def extract_detail(html):
+    data = next_data(html)
+    detail = _detail_from_next_data(data) if data is not None else None
+    if detail is None:
+        detail = detail_from_lxml(html) if lxml_html is not None else parse.parse_detail(html)
+    return detail
+
+
+def _summary_from_next_data(data):
+    fold = _dig(data, "props", "pageProps", "aboveTheFoldData")
+    if not fold or not _dig(fold, "titleText", "text"):
+        return None
+    return {
+        "Name": _dig(fold, "titleText", "text"),
+        "Year": str(_dig(fold, "releaseYear", "year") or ""),
+        "Durasi(Menit)": (_dig(fold, "runtime", "seconds") or 0) // 60,
+        "Rating": _certificate(_dig(fold, "certificate", "rating")),
+    }
+
+
+def _summary_from_json_ld(html):
+    for data in json_ld(html):
+        if not isinstance(data, dict) or data.get("@type") not in ("Movie", "TVSeries", "TVMovie") or not data.get("name"):
+            continue
+        return {
+            "Name": data["name"],
+            "Year": (data.get("datePublished") or "")[:4],
+            "Durasi(Menit)": _minutes(data.get("duration")),
+            "Rating": _certificate(data.get("contentRating")),
+        }
+    return None
+
+
+def extract_summary(html):
+    # Judul, tahun, durasi dan rating dari halaman detail (format field chart);
+    # None jika halaman tidak punya data terstruktur
+    data = next_data(html)
+    summary = _summary_from_next_data(data) if data is not None else None
+    return summary if summary is not None else _summary_from_json_ld(html)
+
+
+def has_detail_data(html):
+    return '"mainColumnData"' in html or parse.has_detail_sections(html)
@@ -0,0 +1,175 @@
+import random
+import threading
+import time
+from queue import Queue
+from urllib.parse import urlsplit
+
+import requests
+
+# Pengambilan halaman untuk scraper: satu requests.Session per thread worker,
+# rate limit per host, retry dengan exponential backoff, dan fallback ke browser
+# headless (Selenium) jika HTML hasil HTTP biasa belum berisi data yang dibutuhkan.
+# Dengan PageCache, halaman yang masih segar tidak di-request ulang, sisanya
+# direvalidasi lewat ETag/Last-Modified; mode replay sepenuhnya offline dari cache.
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/126.0 Safari/537.36",
+    # IMDb melokalisasi label box office / technical specs mengikuti bahasa
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Status yang layak dicoba lagi; 202 dipakai IMDb untuk halaman challenge WAF
+RETRY_STATUS = {202, 429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    pass
+
+
+class HostRateLimiter:
+    # Maksimal `rate` request per detik per host, dibagi oleh semua worker
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url):
+        if not self.interval:
+            return
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(host, now))
+            self._next[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class BrowserPool:
+    # Pool Chrome headless untuk halaman yang butuh render JavaScript.
+    # Selenium hanya di-import saat browser pertama kali dibutuhkan.
+    def __init__(self, size=2, driver_path=None):
+        self.size = size
+        self.driver_path = driver_path
+        self._idle = Queue()
+        self._created = 0
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def _create(self):
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+        except ImportError as e:
+            raise FetchError("Render browser butuh paket selenium (pip install selenium)") from e
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--lang=en-US")
+        service = Service(self.driver_path) if self.driver_path else Service()
+        driver = webdriver.Chrome(options=options, service=service)
+        self._drivers.append(driver)
+        return driver
+
+    def _acquire(self):
+        with self._lock:
+            if self._idle.empty() and self._created < self.size:
+                self._created += 1
+                return self._create()
+        return self._idle.get()
+
+    def render(self, url):
+        driver = self._acquire()
+        try:
+            driver.get(url)
+            return driver.page_source
+        finally:
+            self._idle.put(driver)
+
+    def close(self):
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers.clear()
+
+
+class Fetcher:
+    def __init__(self, rate=2.0, retries=4, backoff=1.0, timeout=30, headers=None, renderer=None, cache=None, replay=False):
+        self.limiter = HostRateLimiter(rate)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = {**DEFAULT_HEADERS, **(headers or {})}
+        self.renderer = renderer
+        self.cache = cache
+        self.replay = replay
+        self.stats = {"network": 0, "not_modified": 0, "cached": 0, "rendered": 0}
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+    def _session(self):
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+
+    def _delay(self, attempt, response=None):
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff * 2 ** attempt + random.uniform(0, self.backoff)
+
+    def get(self, url, complete=None):
+        # complete(html) -> bool: jika False dan renderer tersedia, halaman diambil ulang lewat browser
+        entry = self.cache.lookup(url) if self.cache is not None else None
+        if self.replay:
+            if entry is None:
+                raise FetchError(f"{url} tidak ada di cache (mode replay)")
+            self._count("cached")
+            return self.cache.body(entry)
+        if entry is not None and self.cache.is_fresh(entry):
+            self._count("cached")
+            return self.cache.body(entry)
+
+        error = None
+        for attempt in range(self.retries + 1):
+            self.limiter.wait(url)
+            response = None
+            try:
+                headers = self.cache.validators(entry) if entry is not None else None
+                response = self._session().get(url, timeout=self.timeout, headers=headers)
+                if response.status_code == 304 and entry is not None:
+                    self._count("not_modified")
+                    self.cache.touch(entry)
+                    return self.cache.body(entry)
+                if response.status_code not in RETRY_STATUS:
+                    response.raise_for_status()
+                    self._count("network")
+                    html = response.text
+                    if complete is not None and self.renderer is not None and not complete(html):
+                        return self._render(url)
+                    if self.cache is not None:
+                        self.cache.store(url, html, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+                    return html
+                error = FetchError(f"HTTP {response.status_code} untuk {url}")
+            except requests.HTTPError as e:
+                raise FetchError(str(e)) from e
+            except requests.RequestException as e:
+                error = e
+            if attempt < self.retries:
+                time.sleep(self._delay(attempt, response))
+        if self.renderer is not None:
+            return self._render(url)
+        raise FetchError(f"Gagal mengambil {url} setelah {self.retries + 1} percobaan: {error}")
+
+    def _render(self, url):
+        html = self.renderer.render(url)
+        self._count("rendered")
+        if self.cache is not None:
+            self.cache.store(url, html)
+        return html
+
+    def _count(self, name):
+        with self._stats_lock:
+            self.stats[name] += 1
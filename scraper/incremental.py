@@ -0,0 +1,95 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from scraper.parse import empty_detail
+from scraper.top250 import CHART_DEFAULTS, CHART_URL, fetch_chart, scrape_details, print_progress
+
+# Refresh inkremental Top 250. Film disimpan per ID title IMDb (tt...) yang stabil,
+# bukan per string tampilan "1. The Shawshank Redemption" yang berubah saat rank
+# bergeser. Setiap refresh chart dibandingkan dengan data tersimpan dan halaman
+# detail hanya diambil untuk film baru atau yang data detailnya lebih tua dari
+# max_age; hasilnya di-upsert ke store.
+
+STORE_FILE = "titles_250.csv"
+CHART_FIELDS = ["Rank", "Name", "Year", "Durasi(Menit)", "Rating", "url"]
+DETAIL_FIELDS = list(empty_detail())
+STORE_COLUMNS = ["tconst"] + CHART_FIELDS + DETAIL_FIELDS + ["Scraped_At"]
+INTEGER_FIELDS = ["Durasi(Menit)", "Budget", "Gross_US", "Opening_Week", "Gross_World"]
+
+
+def load_store(path):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=STORE_COLUMNS).set_index("tconst")
+    store = pd.read_csv(path, dtype={"Year": str}, keep_default_na=False, na_values={"Rank": [""], "Scraped_At": [""]})
+    store["Scraped_At"] = pd.to_datetime(store["Scraped_At"], utc=True, format="ISO8601")
+    return store.set_index("tconst")
+
+
+def save_store(store, path):
+    # Ditulis ke file sementara lalu diganti, supaya refresh yang gagal tidak merusak store
+    frame = store.reset_index()[STORE_COLUMNS]
+    frame.to_csv(path + ".tmp", index=False)
+    os.replace(path + ".tmp", path)
+
+
+def due_titles(store, tconsts, max_age, now):
+    # Film baru, film yang belum pernah berhasil di-scrape, atau yang datanya kedaluwarsa
+    known = store.reindex(tconsts)["Scraped_At"]
+    return [tconst for tconst, scraped_at in known.items()
+            if pd.isna(scraped_at) or (max_age is not None and now - scraped_at > max_age)]
+
+
+def refresh_top250(fetcher, store_path=STORE_FILE, chart_url=CHART_URL, workers=8, max_age_days=30,
+                   limit=None, progress=print_progress):
+    now = datetime.now(timezone.utc)
+    max_age = timedelta(days=max_age_days) if max_age_days is not None else None
+    movies = [movie for movie in fetch_chart(fetcher, chart_url, limit) if movie.get("tconst")]
+    store = load_store(store_path)
+
+    chart = pd.DataFrame([{**movie, "Rank": rank} for rank, movie in enumerate(movies, start=1)]).set_index("tconst")
+    due = due_titles(store, chart.index, max_age, now)
+    print(f"{len(movies)} film di chart, {len(chart.index.difference(store.index))} baru, "
+          f"{len(due)} halaman detail perlu diambil")
+
+    due_movies = [chart.loc[tconst, CHART_FIELDS[1:]].to_dict() for tconst in due]
+    details = scrape_details(fetcher, due_movies, workers, progress)
+    for tconst, movie in zip(due, due_movies):
+        chart.loc[tconst, CHART_FIELDS[1:]] = pd.Series(movie)
+
+    # Upsert: field chart diperbarui untuk semua film di chart, field detail hanya untuk
+    # yang berhasil di-scrape. Film yang keluar dari chart tetap disimpan tanpa rank
+    # (detailnya dipakai lagi jika masuk kembali).
+    store = store.reindex(store.index.union(chart.index))
+    store.index.name = "tconst"
+    store["Rank"] = chart["Rank"].reindex(store.index)
+    for field in CHART_FIELDS[1:]:
+        values = chart[field]
+        if field in CHART_DEFAULTS:
+            # Nilai kosong di chart (mis. chart JSON-LD tanpa tahun) tidak menimpa nilai tersimpan
+            stored = store.loc[chart.index, field]
+            values = values.where((values != CHART_DEFAULTS[field]) | stored.isna(), stored)
+        store.loc[chart.index, field] = values
+    new = store["Scraped_At"].isna()
+    defaults = empty_detail()
+    for field in DETAIL_FIELDS:
+        store.loc[new, field] = store.loc[new, field].fillna(defaults[field])
+    for tconst, detail in zip(due, details):
+        if detail is None:
+            continue
+        for field, value in detail.items():
+            store.at[tconst, field] = value
+        store.at[tconst, "Scraped_At"] = now
+    store[INTEGER_FIELDS] = store[INTEGER_FIELDS].astype("int64")
+    store["Rank"] = store["Rank"].astype("Int64")
+
+    save_store(store, store_path)
+    failed = sum(detail is None for detail in details)
+    return current_chart(store), {"chart": len(movies), "fetched": len(due) - failed, "failed": failed}
+
+
+def current_chart(store):
+    # Baris film yang sedang ada di chart, urut rank, dengan kolom Name "rank. judul" seperti notebook
+    ranked = store[store["Rank"].notna()].sort_values("Rank")
+    return ranked.reset_index()
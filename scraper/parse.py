@@ -0,0 +1,103 @@
+import re
+from datetime import datetime
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+# Parser halaman chart Top 250 dan halaman detail film, dipindahkan dari
+# scraping-imdb.ipynb dengan aturan nilai default yang sama.
+
+CHART_ITEM_CLASS = "sc-b189961a-0 hBZnfJ cli-children"
+CHART_METADATA_CLASS = "sc-b189961a-8 kLaxqf cli-title-metadata-item"
+LINK_ITEM_CLASS = "ipc-metadata-list-item__list-content-item ipc-metadata-list-item__list-content-item--link"
+
+DEFAULT_OPEN_WEEK_DATE = "1900-01-01 00:00:00"
+
+_DIGITS = re.compile("[^0-9]")
+
+
+def parse_minutes(text):
+    # "2h 22m" -> 142, "2h" -> 120; format lain -> 0
+    parts = text.split(" ")
+    try:
+        if len(parts) > 1:
+            return int(parts[0].replace("h", "")) * 60 + int(parts[1].replace("m", ""))
+        return int(parts[0].replace("h", "")) * 60
+    except ValueError:
+        return 0
+
+
+def parse_number(text):
+    try:
+        return int(_DIGITS.sub("", text))
+    except ValueError:
+        return 0
+
+
+def parse_date(text):
+    try:
+        return str(datetime.strptime(text, "%b %d, %Y"))
+    except ValueError:
+        return DEFAULT_OPEN_WEEK_DATE
+
+
+def parse_chart(html, base_url):
+    # Mengembalikan daftar film dalam urutan chart beserta URL halaman detailnya
+    soup = BeautifulSoup(html, "html.parser")
+    movies = []
+    for item in soup.find_all("div", {"class": CHART_ITEM_CLASS}):
+        title = item.find("h3", {"class": "ipc-title__text"})
+        link = item.find("a")
+        if title is None or link is None or not link.get("href"):
+            continue
+        metadata = [span.text for span in item.find_all("span", {"class": CHART_METADATA_CLASS})]
+        movies.append({
+            "Name": title.text,
+            "Year": metadata[0] if metadata else "",
+            "Durasi(Menit)": parse_minutes(metadata[1]) if len(metadata) > 1 else 0,
+            "Rating": metadata[2] if len(metadata) > 2 else "Not Rated",
+            "url": urljoin(base_url, link["href"]),
+        })
+    return movies
+
+
+def has_detail_sections(html):
+    return 'data-testid="title-boxoffice-section"' in html or 'data-testid="title-techspecs-section"' in html
+
+
+def empty_detail():
+    # Nilai default film tanpa data box office / technical specs
+    return {
+        "Budget": 0,
+        "Gross_US": 0,
+        "Opening_Week": 0,
+        "Open_Week_Date": DEFAULT_OPEN_WEEK_DATE,
+        "Gross_World": 0,
+        "Color": "",
+        "Sound_Mix": "",
+        "Aspect_Ratio": "",
+    }
+
+
+def parse_detail(html):
+    soup = BeautifulSoup(html, "html.parser")
+    detail = empty_detail()
+
+    box_office = soup.find("div", {"data-testid": "title-boxoffice-section"})
+    if box_office is not None:
+        values = [span.text for span in box_office.find_all("span", {"class": "ipc-metadata-list-item__list-content-item"})]
+        if len(values) > 4:
+            detail["Budget"] = parse_number(values[0])
+            detail["Gross_US"] = parse_number(values[1])
+            detail["Opening_Week"] = parse_number(values[2])
+            detail["Open_Week_Date"] = parse_date(values[3])
+            detail["Gross_World"] = parse_number(values[4])
+
+    tech_specs = soup.find("div", {"data-testid": "title-techspecs-section"})
+    if tech_specs is not None:
+        specs = tech_specs.find_all("div", {"class": "ipc-metadata-list-item__content-container"})
+        if len(specs) > 3:
+            detail["Color"] = " ".join(item.text for item in specs[1].find_all("a", {"class": LINK_ITEM_CLASS}))
+            detail["Sound_Mix"] = " ".join(item.text for item in specs[2].find_all("a", {"class": LINK_ITEM_CLASS}))
+            detail["Aspect_Ratio"] = specs[3].text
+    return detail
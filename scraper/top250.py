@@ -0,0 +1,91 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+from scraper.extract import extract_chart, extract_detail, extract_summary, has_detail_data
+from scraper.parse import empty_detail
+
+CHART_URL = "https://www.imdb.com/chart/top/?ref_=nv_mv_250"
+CHART_PATH = "/chart/top/?ref_=nv_mv_250"
+
+# File keluaran dan kolomnya sama dengan versi notebook
+MOVIES_FILE = "halaman_movies_250.csv"
+BOX_OFFICE_FILE = "box_office_250.csv"
+TECH_SPECS_FILE = "technical_specs_250.csv"
+MOVIES_COLUMNS = ["Name", "Year", "Durasi(Menit)", "Rating"]
+BOX_OFFICE_COLUMNS = ["Name", "Budget", "Gross_US", "Opening_Week", "Open_Week_Date", "Gross_World"]
+TECH_SPECS_COLUMNS = ["Name", "Color", "Sound_Mix", "Aspect_Ratio"]
+# Nilai field chart yang dianggap kosong (mis. chart JSON-LD tidak memuat tahun)
+CHART_DEFAULTS = {"Year": "", "Durasi(Menit)": 0, "Rating": "Not Rated"}
+
+
+def print_progress(done, total, movie, error=None):
+    status = f"gagal: {error}" if error else "ok"
+    print(f"[{done}/{total}] {movie['Name']} ({status})")
+
+
+def scrape_details(fetcher, movies, workers=8, progress=print_progress):
+    # Halaman detail diambil dan di-parse paralel oleh worker pool berukuran tetap;
+    # hasil dikembalikan dalam urutan chart. Film yang gagal bernilai None.
+    # Field chart yang kosong di `movies` dilengkapi dari data terstruktur halaman detail.
+    details = [None] * len(movies)
+
+    def work(position):
+        movie = movies[position]
+        html = fetcher.get(movie["url"], complete=has_detail_data)
+        complete_movie(movie, extract_summary(html))
+        return position, extract_detail(html)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(work, position): position for position in range(len(movies))}
+        for done, future in enumerate(as_completed(futures), start=1):
+            position = futures[future]
+            error = None
+            try:
+                _, details[position] = future.result()
+            except Exception as e:
+                error = e
+            if progress is not None:
+                progress(done, len(movies), movies[position], error)
+    return details
+
+
+def complete_movie(movie, summary):
+    if summary is None:
+        return movie
+    for field, default in CHART_DEFAULTS.items():
+        if field in movie and movie[field] == default:
+            movie[field] = summary[field]
+    return movie
+
+
+def fetch_chart(fetcher, chart_url=CHART_URL, limit=None):
+    # Chart dianggap lengkap jika 250 film sudah ada di HTML; jika belum, Fetcher
+    # memakai browser (jika dikonfigurasi) untuk halaman yang di-render JavaScript
+    expected = limit or 250
+    html = fetcher.get(chart_url, complete=lambda page: len(extract_chart(page, chart_url)) >= expected)
+    return extract_chart(html, chart_url)[:limit]
+
+
+def scrape_top250(fetcher, chart_url=CHART_URL, workers=8, limit=None, progress=print_progress):
+    movies = fetch_chart(fetcher, chart_url, limit)
+    print(f"{len(movies)} film di chart, mengambil halaman detail dengan {workers} worker")
+    details = scrape_details(fetcher, movies, workers, progress)
+    # Film yang gagal tetap ditulis dengan nilai default, seperti di notebook
+    return to_frame(movies, [detail or empty_detail() for detail in details])
+
+
+def to_frame(movies, details):
+    return pd.DataFrame([{**movie, **detail} for movie, detail in zip(movies, details)])
+
+
+def write_csvs(frame, out_dir="."):
+    paths = []
+    for filename, columns in [(MOVIES_FILE, MOVIES_COLUMNS), (BOX_OFFICE_FILE, BOX_OFFICE_COLUMNS), (TECH_SPECS_FILE, TECH_SPECS_COLUMNS)]:
+        path = os.path.join(out_dir, filename)
+        # Ditulis ke file sementara lalu diganti, supaya run yang gagal tidak menghapus data lama
+        frame[columns].to_csv(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+        paths.append(path)
+    return paths
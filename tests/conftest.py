@@ -0,0 +1,75 @@
+import datetime
+import os
+import random
+import sqlite3
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Stand-in SQLite kecil dengan skema Adventure Works yang dipakai halaman db.
+# Produk 0 tidak punya subkategori (kategori NULL) seperti beberapa baris di AW asli.
+
+COUNTRIES = ["Australia", "Canada", "France", "Germany", "United Kingdom", "United States"]
+CATEGORIES = ["Bikes", "Accessories", "Clothing"]
+
+SCHEMA = """
+CREATE TABLE dimsalesterritory(SalesTerritoryKey INTEGER PRIMARY KEY, SalesTerritoryCountry TEXT);
+CREATE TABLE dimcustomer(CustomerKey INTEGER PRIMARY KEY, FirstName TEXT, LastName TEXT, Gender TEXT, YearlyIncome REAL);
+CREATE TABLE dimproductcategory(ProductCategoryKey INTEGER PRIMARY KEY, EnglishProductCategoryName TEXT);
+CREATE TABLE dimproductsubcategory(ProductSubcategoryKey INTEGER PRIMARY KEY, ProductCategoryKey INTEGER);
+CREATE TABLE dimproduct(ProductKey INTEGER PRIMARY KEY, ProductSubcategoryKey INTEGER);
+CREATE TABLE factinternetsales(
+    SalesOrderNumber TEXT, SalesOrderLineNumber INTEGER, OrderDate TEXT, ProductKey INTEGER, CustomerKey INTEGER,
+    SalesTerritoryKey INTEGER, SalesAmount REAL, OrderQuantity INTEGER, TotalProductCost REAL
+);
+"""
+
+
+def sales_rows(count, start=0, seed=0, start_date=datetime.date(2011, 1, 1)):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(start, start + count):
+        order_date = start_date + datetime.timedelta(days=i * 3)
+        rows.append((f"SO{43697 + i}", 1, f"{order_date.isoformat()} 00:00:00", rng.randint(0, 20),
+                     rng.randint(1, 50), rng.randint(1, len(COUNTRIES)), round(rng.uniform(2, 3500), 4),
+                     rng.randint(1, 3), round(rng.uniform(1, 2000), 4)))
+    return rows
+
+
+def insert_sales(path, rows):
+    with sqlite3.connect(path) as connection:
+        connection.executemany("INSERT INTO factinternetsales VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+
+def make_aw_db(path, rows=400, seed=0):
+    rng = random.Random(seed)
+    with sqlite3.connect(path) as connection:
+        connection.executescript(SCHEMA)
+        connection.executemany("INSERT INTO dimsalesterritory VALUES (?, ?)",
+                               [(i + 1, country) for i, country in enumerate(COUNTRIES)])
+        connection.executemany("INSERT INTO dimproductcategory VALUES (?, ?)",
+                               [(i + 1, name) for i, name in enumerate(CATEGORIES)])
+        connection.executemany("INSERT INTO dimproductsubcategory VALUES (?, ?)", [(i + 1, i % 3 + 1) for i in range(6)])
+        connection.executemany("INSERT INTO dimproduct VALUES (?, ?)",
+                               [(0, None)] + [(i, i % 6 + 1) for i in range(1, 21)])
+        connection.executemany("INSERT INTO dimcustomer VALUES (?, ?, ?, ?, ?)", [
+            (i, f"First{i}", f"Last{i}", rng.choice("MF"), rng.choice([10000.0, 30000.0, 60000.0, 150000.0]))
+            for i in range(1, 51)
+        ])
+    insert_sales(path, sales_rows(rows, seed=seed))
+    return path
+
+
+@pytest.fixture
+def aw_db(tmp_path):
+    return make_aw_db(str(tmp_path / "aw.db"))
+
+
+@pytest.fixture
+def aw_engine(aw_db):
+    engine = create_engine(f"sqlite:///{aw_db}")
+    yield engine
+    engine.dispose()
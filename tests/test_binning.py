@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from page.binning import bin_counts, bin_edges, histogram_figure, histogram_frame
+
+# Hitungan bin server-side harus sama dengan np.histogram pada edges yang sama,
+# termasuk nilai yang tepat di edge (runtime bulat, rating satu desimal)
+
+
+def datasets():
+    rng = np.random.default_rng(0)
+    return {
+        "runtime": rng.integers(1, 400, 2000).astype(float),
+        "rating": np.round(rng.uniform(1, 10, 2000), 1),
+        "gross": rng.lognormal(16, 2, 2000),
+    }
+
+
+@pytest.mark.parametrize("name", ["runtime", "rating", "gross"])
+@pytest.mark.parametrize("bins", [1, 7, 20, 33])
+@pytest.mark.parametrize("upper_quantile", [1.0, 0.995, 0.9])
+def test_bin_counts_match_numpy(name, bins, upper_quantile):
+    values = datasets()[name]
+    edges = bin_edges(values, bins=bins, upper_quantile=upper_quantile)
+    assert len(edges) == bins + 1 and edges[0] == values.min()
+    # Nilai tepat di setiap edge plus nilai kosong/tak hingga yang diabaikan
+    values = np.concatenate([values, edges, [np.nan, np.inf, -np.inf]])
+    expected, _ = np.histogram(values[np.isfinite(values)], edges)
+    np.testing.assert_array_equal(bin_counts(values, edges), expected)
+
+
+def test_constant_values_get_one_unit_range():
+    edges = bin_edges([120.0, 120.0, np.nan], bins=4)
+    assert (edges[0], edges[-1]) == (119.5, 120.5)
+    np.testing.assert_array_equal(bin_counts([120.0, 120.0], edges), [0, 0, 2, 0])
+    assert bin_edges([np.nan]).tolist() == np.linspace(0.0, 1.0, 21).tolist()
+
+
+def test_histogram_figure_percentages():
+    values = datasets()["runtime"]
+    edges = bin_edges(values, bins=20, upper_quantile=0.9)
+    counts, _ = np.histogram(values, edges)
+    frame = histogram_frame(values, edges)
+    np.testing.assert_array_equal(frame["Count"], counts)
+
+    (bar,) = histogram_figure(values, edges, "Runtime", "Minutes").data
+    np.testing.assert_allclose(bar.y, counts / counts.sum() * 100)
+    np.testing.assert_allclose(bar.x, (edges[:-1] + edges[1:]) / 2)
+    assert bar.width == pytest.approx(edges[1] - edges[0])
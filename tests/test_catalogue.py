@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from page import catalogue
+from page.movies import build_movie_index, select_movies
+from scraper.catalogue import CATALOGUE_SCHEMA, RATING_BANDS, UNRATED, ingest_catalogue
+from scraper.dataset import read_dataset
+
+# Dump IMDb sintetis kecil dengan layout title.basics / title.ratings asli:
+# tab, tanpa quoting, \N untuk nilai kosong.
+
+BASICS = [
+    ("tt0000001", "movie", "Alpha", "1994", "142", "Drama"),
+    ("tt0000002", "movie", '"Beta" Returns', "1972", "175", "Crime,Drama"),
+    ("tt0000003", "short", "Gamma", "2001", "5", "Short"),
+    ("tt0000004", "movie", "Delta", "\\N", "90", "Comedy"),
+    ("tt0000005", "tvMovie", "Epsilon", "2008", "\\N", "\\N"),
+    ("tt0000006", "movie", "Zeta", "2015", "90", "Horror"),
+    ("tt0000007", "movie", "Eta", "2020", "100", "Action"),
+    ("tt0000008", "tvSeries", "Theta", "2010", "45", "Drama"),
+]
+RATINGS = [
+    ("tt0000001", "9.3", "2900000"),
+    ("tt0000002", "10.0", "12"),
+    ("tt0000003", "6.1", "300"),
+    ("tt0000004", "5.0", "40"),
+    ("tt0000005", "1.0", "7"),
+    ("tt0000007", "7.95", "1500"),
+]
+
+
+def write_tsv(path, header, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\t".join(header) + "\n")
+        for row in rows:
+            f.write("\t".join(row) + "\n")
+    return str(path)
+
+
+@pytest.fixture
+def dumps(tmp_path):
+    basics = write_tsv(tmp_path / "title.basics.tsv", ["tconst", "titleType", "primaryTitle", "originalTitle", "isAdult",
+                                                      "startYear", "endYear", "runtimeMinutes", "genres"],
+                       [(tconst, kind, name, name, "0", year, "\\N", runtime, genres)
+                        for tconst, kind, name, year, runtime, genres in BASICS])
+    ratings = write_tsv(tmp_path / "title.ratings.tsv", ["tconst", "averageRating", "numVotes"], RATINGS)
+    return basics, ratings
+
+
+@pytest.fixture
+def titles(dumps, tmp_path):
+    path = str(tmp_path / "catalogue.arrow")
+    assert ingest_catalogue(*dumps, path=path, title_types=("movie", "tvMovie"), chunksize=3) == (8, 5)
+    return read_dataset(path).set_index("tconst", drop=False)
+
+
+def test_ingest_writes_typed_batches(dumps, tmp_path):
+    path = str(tmp_path / "catalogue.arrow")
+    ingest_catalogue(*dumps, path=path, title_types=("movie", "tvMovie"), chunksize=3)
+    with pa.OSFile(path, "rb") as source:
+        reader = pa.ipc.open_file(source)
+        assert reader.schema.equals(CATALOGUE_SCHEMA)
+        assert reader.num_record_batches == 3
+        table = reader.read_all()
+    assert table.column("Title_Type").type == pa.dictionary(pa.int8(), pa.string())
+    assert table.column("Year").null_count == 0
+
+
+def test_ingest_filters_types_years_and_votes(titles, dumps, tmp_path):
+    # short/tvSeries dibuang per titleType, Delta karena tanpa tahun
+    assert titles.index.tolist() == ["tt0000001", "tt0000002", "tt0000005", "tt0000006", "tt0000007"]
+    assert titles.loc["tt0000002", "Name"] == '"Beta" Returns'
+    assert titles.loc["tt0000005", "Title_Type"] == "tvMovie"
+    assert pd.isna(titles.loc["tt0000005", "Durasi(Menit)"]) and pd.isna(titles.loc["tt0000005", "Genres"])
+    assert titles.loc["tt0000006", "Num_Votes"] == 0 and pd.isna(titles.loc["tt0000006", "Average_Rating"])
+
+    path = str(tmp_path / "voted.arrow")
+    assert ingest_catalogue(*dumps, path=path, title_types=None, min_votes=100) == (8, 3)
+    assert read_dataset(path)["tconst"].tolist() == ["tt0000001", "tt0000003", "tt0000007"]
+
+
+def test_rating_bands(titles):
+    assert list(titles["Rating"].cat.categories) == RATING_BANDS
+    # 10.0 masuk band teratas, 7.95 tetap 7-8, tanpa rating -> Unrated
+    assert titles["Rating"].astype(str).to_dict() == {
+        "tt0000001": "9-10", "tt0000002": "9-10", "tt0000005": "1-2", "tt0000006": UNRATED, "tt0000007": "7-8",
+    }
+
+
+def test_year_and_rating_selection(titles):
+    titles = titles.reset_index(drop=True)
+    index = build_movie_index(titles, ["Durasi(Menit)"], upper_quantile=0.995)
+
+    def selected(**selection):
+        return select_movies(titles, index, **selection)["tconst"].tolist()
+
+    assert selected(min_year=2000, max_year=2015) == ["tt0000005", "tt0000006"]
+    assert selected(max_year=1994, ratings=["9-10"]) == ["tt0000001", "tt0000002"]
+    assert selected(min_year=2010, ratings=[UNRATED, "7-8"]) == ["tt0000006", "tt0000007"]
+    assert selected(ratings=[]) == []
+    assert selected() == titles["tconst"].tolist()
+
+
+@pytest.mark.parametrize("over_limit, trace_type", [(False, "scatter"), (True, "heatmap")])
+def test_relationship_switches_to_density_above_mark_limit(titles, monkeypatch, over_limit, trace_type):
+    titles = titles.reset_index(drop=True)
+    rated = int((titles["Num_Votes"] > 0).sum())
+    monkeypatch.setattr(catalogue, "title_index", build_movie_index(titles, ["Durasi(Menit)"], upper_quantile=0.995))
+    monkeypatch.setattr(catalogue, "MARK_LIMIT", rated - 1 if over_limit else rated)
+
+    data, figures = catalogue.build_figures(titles)
+    assert (data["total"], data["rated"]) == (5, rated)
+    relationship = figures["relationship"]
+    assert [trace.type for trace in relationship.data] == [trace_type]
+    if over_limit:
+        # Grid kepadatan: total isi sel = jumlah judul berating, bukan satu mark per judul
+        assert np.nansum(np.asarray(relationship.data[0].z, dtype=float)) == rated
+    else:
+        assert len(relationship.data[0].x) == rated
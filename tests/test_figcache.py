@@ -0,0 +1,61 @@
+import json
+import math
+import os
+import runpy
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+
+from page import figcache
+from page.figcache import FigureCache, make_key
+
+
+def build():
+    country = pd.DataFrame({"SalesAmount": [10.5, 20.25], "TotalProductCost": [5.0, 7.5]},
+                           index=pd.Index(["Canada", "France"], name="SalesTerritoryCountry"))
+    budget = pd.DataFrame({"Year": np.array([1994, 1995], dtype=np.int16), "Budget": [1000, 2000]})
+    data = {
+        "kpis": (np.int64(2), np.float64(30.75), float("nan"), None),
+        "country": country,
+        "budget_year": budget,
+        "busiest_year": np.int16(1994),
+    }
+    return data, {"country": px.bar(country.reset_index(), x="SalesTerritoryCountry", y="SalesAmount")}
+
+
+def test_disk_entries_are_json_and_round_trip(tmp_path):
+    directory = str(tmp_path / "figcache")
+    key = make_key("adventure_works", years=[2012, 2011])
+    data, figures = FigureCache(directory=directory).get_or_build(key, build)
+
+    (path,) = [os.path.join(directory, name) for name in os.listdir(directory)]
+    assert path.endswith(".json")
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["figures"] == figures
+
+    # Proses lain: entri dibaca dari disk tanpa memanggil build
+    cached_data, cached_figures = FigureCache(directory=directory).get_or_build(key, lambda: 1 / 0)
+    assert cached_figures == figures
+    total_sales, total_sales_amount, average_sales, top_category = cached_data["kpis"]
+    assert (total_sales, total_sales_amount, top_category) == (2, 30.75, None) and math.isnan(average_sales)
+    assert cached_data["busiest_year"] == 1994
+    pd.testing.assert_frame_equal(cached_data["country"], data["country"])
+    pd.testing.assert_frame_equal(cached_data["budget_year"], data["budget_year"], check_dtype=False)
+
+
+def test_unencodable_entry_stays_in_memory_only(tmp_path):
+    directory = str(tmp_path / "figcache")
+    cache = FigureCache(directory=directory)
+    cache.put("imdb:1", {"value": object()}, {})
+    assert cache.contains("imdb:1")
+    assert not os.path.exists(directory) or os.listdir(directory) == []
+
+
+def test_disk_tier_is_opt_in(monkeypatch):
+    monkeypatch.delenv("FIGURE_CACHE_DIR", raising=False)
+    assert runpy.run_path(figcache.__file__)["figure_cache"].directory is None
+    cache = FigureCache()
+    assert cache.directory is None
+    cache.put("imdb:1", {}, {})
+    assert cache.contains("imdb:1") and not cache.contains("imdb:2")
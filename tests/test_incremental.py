@@ -0,0 +1,120 @@
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import pandas as pd
+import pytest
+
+from scraper.dataset import write_dataset
+from scraper.incremental import due_titles, load_store, refresh_top250
+from scraper.top250 import CHART_URL
+
+# refresh_top250 terhadap halaman tersimpan di tests/fixtures/imdb, lewat fetcher tiruan
+# yang mencatat path yang diminta. Chart JSON-LD dibuat di sini: tanpa tahun, seperti aslinya.
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "imdb")
+TCONSTS = ["tt0111161", "tt0068646", "tt0468569"]
+JSON_LD_MOVIES = {
+    "tt0111161": ("The Shawshank Redemption", "R", "PT2H22M"),
+    "tt0068646": ("The Godfather", "R", "PT2H55M"),
+    "tt0468569": ("The Dark Knight", "PG-13", "PT2H32M"),
+}
+
+
+def json_ld_chart(tconsts):
+    items = [{"@type": "ListItem", "position": position, "item": {
+        "@type": "Movie", "url": f"/title/{tconst}/", "name": JSON_LD_MOVIES[tconst][0],
+        "contentRating": JSON_LD_MOVIES[tconst][1], "duration": JSON_LD_MOVIES[tconst][2],
+    }} for position, tconst in enumerate(tconsts, start=1)]
+    data = {"@context": "https://schema.org", "@type": "ItemList", "itemListElement": items}
+    return f'<html><head><script type="application/ld+json">{json.dumps(data)}</script></head><body></body></html>'
+
+
+class FixtureFetcher:
+    def __init__(self, chart=None):
+        self.chart = chart
+        self.requested = []
+
+    def get(self, url, complete=None):
+        path = urlsplit(url).path
+        self.requested.append(path)
+        if path == urlsplit(CHART_URL).path and self.chart is not None:
+            return self.chart
+        with open(os.path.join(FIXTURES, path.strip("/"), "index.html"), encoding="utf-8") as f:
+            return f.read()
+
+    def details(self):
+        return [path.split("/")[2] for path in self.requested if path.startswith("/title/")]
+
+
+def refresh(store_path, chart=None, max_age_days=30):
+    fetcher = FixtureFetcher(chart)
+    frame, counts = refresh_top250(fetcher, store_path, CHART_URL, workers=2, max_age_days=max_age_days, progress=None)
+    return frame, counts, fetcher
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "titles_250.csv")
+
+
+def test_first_run_fetches_every_title(store_path):
+    frame, counts, fetcher = refresh(store_path)
+    assert counts == {"chart": 3, "fetched": 3, "failed": 0}
+    assert sorted(fetcher.details()) == sorted(TCONSTS)
+    assert frame["tconst"].tolist() == TCONSTS and frame["Rank"].tolist() == [1, 2, 3]
+    assert frame["Year"].tolist() == ["1994", "1972", "2008"] and frame["Budget"].tolist() == [25000000, 6000000, 185000000]
+    assert load_store(store_path)["Scraped_At"].notna().all()
+
+
+def test_unchanged_chart_fetches_nothing(store_path):
+    first, _, _ = refresh(store_path)
+    second, counts, fetcher = refresh(store_path)
+    assert counts == {"chart": 3, "fetched": 0, "failed": 0}
+    assert fetcher.details() == []
+    # Store pertama masih di memori (object), berikutnya dibaca dari CSV (string)
+    pd.testing.assert_frame_equal(second, first, check_dtype=False)
+
+
+def test_json_ld_chart_keeps_stored_chart_fields(store_path, tmp_path):
+    first, _, _ = refresh(store_path)
+    rows = write_dataset(first, str(tmp_path / "first.arrow"))
+
+    # Chart JSON-LD tanpa tahun: film yang tidak perlu diambil ulang tetap memakai tahun tersimpan
+    second, counts, _ = refresh(store_path, json_ld_chart(TCONSTS))
+    assert counts["fetched"] == 0
+    assert second["Year"].tolist() == ["1994", "1972", "2008"]
+    assert second["Durasi(Menit)"].tolist() == [142, 175, 152] and second["Rating"].tolist() == ["R", "R", "PG-13"]
+    assert write_dataset(second, str(tmp_path / "second.arrow")) == rows > 0
+
+
+def test_new_titles_are_upserted_and_dropped_titles_kept(store_path):
+    refresh(store_path, json_ld_chart(TCONSTS[:2]))
+    # Film baru lewat chart JSON-LD: tahun dilengkapi dari data terstruktur halaman detail
+    # (Dark Knight tidak punya, jadi tetap kosong sampai chart berikutnya memuatnya)
+    frame, counts, fetcher = refresh(store_path, json_ld_chart(["tt0468569", "tt0111161"]))
+    assert counts == {"chart": 2, "fetched": 1, "failed": 0} and fetcher.details() == ["tt0468569"]
+    assert frame["tconst"].tolist() == ["tt0468569", "tt0111161"] and frame["Rank"].tolist() == [1, 2]
+    assert frame["Year"].tolist() == ["", "1994"] and frame["Budget"].tolist() == [185000000, 25000000]
+
+    store = load_store(store_path)
+    assert pd.isna(store.loc["tt0068646", "Rank"]) and store.loc["tt0068646", "Year"] == "1972"
+
+    frame, counts, _ = refresh(store_path)
+    assert counts["fetched"] == 0 and frame["Year"].tolist() == ["1994", "1972", "2008"]
+
+
+def test_due_titles():
+    now = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    store = pd.DataFrame({"Scraped_At": [now - timedelta(days=40), now - timedelta(days=2), pd.NaT]},
+                         index=pd.Index(["stale", "fresh", "failed"], name="tconst"))
+    tconsts = ["new", "stale", "fresh", "failed"]
+    assert due_titles(store, tconsts, timedelta(days=30), now) == ["new", "stale", "failed"]
+    assert due_titles(store, tconsts, None, now) == ["new", "failed"]
+
+
+def test_stale_titles_are_refetched(store_path):
+    refresh(store_path)
+    _, counts, fetcher = refresh(store_path, max_age_days=0)
+    assert counts["fetched"] == 3 and sorted(fetcher.details()) == sorted(TCONSTS)
@@ -0,0 +1,78 @@
+import importlib
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import streamlit as st
+
+from page.lod import density_grid
+
+# Halaman db dibaca dengan secrets minimal (SQLite in-memory), tanpa runtime Streamlit
+
+
+@pytest.fixture(scope="module")
+def db():
+    secrets = {"DB_HOST": "localhost", "DB_DATABASE": "aw", "DB_USER": "user", "DB_PASS": "pass",
+               "DB_URL": "sqlite://", "SNAPSHOT_DIR": ""}
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(st, "secrets", secrets)
+        sys.modules.pop("page.db", None)
+        module = importlib.import_module("page.db")
+    yield module
+    sys.modules.pop("page.db", None)
+
+
+def customers(count, seed=0):
+    rng = np.random.default_rng(seed)
+    amounts = rng.uniform(10, 1000, count)
+    amounts[[3, 7]] = [1.0, 5000.0]
+    return pd.DataFrame({
+        "CustomerKey": np.arange(count),
+        "Customer": [f"Customer {i}" for i in range(count)],
+        "YearlyIncome": rng.choice([10000.0, 30000.0, 60000.0, 150000.0], count),
+        "SalesAmount": amounts,
+    })
+
+
+def extremes(fig):
+    return {trace.name: (list(trace.y), [row[0] for row in trace.customdata]) for trace in fig.data[1:]}
+
+
+@pytest.mark.parametrize("lod", ["density", "webgl"])
+def test_scatter_below_mark_limit(db, monkeypatch, lod):
+    monkeypatch.setattr(db, "SCATTER_MAX_POINTS", 200)
+    monkeypatch.setattr(db, "SCATTER_LOD", lod)
+    fig = db.customer_chart(customers(200))
+    assert {trace.type for trace in fig.data} == {"scatter"}
+    assert sum(len(trace.x) for trace in fig.data) == 200
+    assert sorted(trace.name for trace in fig.data) == ["max", "mid", "min"]
+
+
+def test_density_above_mark_limit_keeps_extremes(db, monkeypatch):
+    monkeypatch.setattr(db, "SCATTER_MAX_POINTS", 199)
+    monkeypatch.setattr(db, "SCATTER_LOD", "density")
+    monkeypatch.setattr(db, "SCATTER_BINS", 20)
+    fig = db.customer_chart(customers(200))
+    assert [trace.type for trace in fig.data] == ["heatmap", "scatter", "scatter"]
+    # Grid tetap 20x20 dan memuat semua customer, termasuk min/max
+    z = np.asarray(fig.data[0].z, dtype=float)
+    assert z.shape == (20, 20) and np.nansum(z) == 200
+    assert extremes(fig) == {"max": ([5000.0], ["Customer 7"]), "min": ([1.0], ["Customer 3"])}
+
+
+def test_webgl_above_mark_limit_keeps_extremes(db, monkeypatch):
+    monkeypatch.setattr(db, "SCATTER_MAX_POINTS", 199)
+    monkeypatch.setattr(db, "SCATTER_LOD", "webgl")
+    fig = db.customer_chart(customers(200))
+    assert [trace.type for trace in fig.data] == ["scattergl", "scatter", "scatter"]
+    assert len(fig.data[0].x) == 198
+    assert extremes(fig) == {"max": ([5000.0], ["Customer 7"]), "min": ([1.0], ["Customer 3"])}
+
+
+def test_density_grid_skips_missing_values():
+    x = np.array([0.0, 1.0, 1.0, np.nan, 2.0])
+    y = np.array([0.0, 1.0, 1.0, 5.0, np.inf])
+    x_centers, y_centers, z = density_grid(x, y, bins=2)
+    assert np.nansum(z) == 3 and np.isnan(z).sum() == 2
+    assert z.shape == (len(y_centers), len(x_centers)) == (2, 2)
@@ -0,0 +1,82 @@
+import json
+import threading
+
+import pytest
+
+from page import profiling
+from page.profiling import begin_rerun, chrome_trace, end_rerun, stage
+
+
+@stage("build_charts")
+def build_charts():
+    with stage("customers"):
+        return 42
+
+
+def rerun(page):
+    begin_rerun(page)
+    try:
+        with stage("show", rows_in=100):
+            with stage("filter", rows_in=100) as filtered:
+                filtered.rows_out = 40
+            build_charts()
+    finally:
+        profile = end_rerun()
+    return profile
+
+
+@pytest.fixture(autouse=True)
+def no_active_rerun():
+    yield
+    profiling._active.profile = None
+
+
+def test_stage_records_nothing_outside_a_rerun():
+    with stage("idle") as idle:
+        pass
+    assert idle._profile is None and build_charts() == 42
+
+
+def test_nested_stages():
+    profile = rerun("adventure_works")
+    stages = {item["name"]: item for item in profile["stages"]}
+    assert {name: item["depth"] for name, item in stages.items()} == \
+        {"filter": 1, "customers": 2, "build_charts": 1, "show": 0}
+    assert (stages["filter"]["rows_in"], stages["filter"]["rows_out"]) == (100, 40)
+    assert profile["depth"] == 0
+
+
+def test_stages_in_other_threads_are_not_recorded():
+    begin_rerun("imdb")
+    worker = threading.Thread(target=build_charts)
+    worker.start()
+    worker.join()
+    with stage("main"):
+        pass
+    assert [item["name"] for item in end_rerun()["stages"]] == ["main"]
+
+
+def test_chrome_trace_is_valid_trace_event_json():
+    history = [rerun("adventure_works"), rerun("imdb"), rerun("adventure_works")]
+    trace = json.loads(chrome_trace(history))
+    assert trace["displayTimeUnit"] == "ms"
+
+    complete = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    metadata = [event for event in trace["traceEvents"] if event["ph"] == "M"]
+    assert len(complete) == 3 * 4
+    for event in complete:
+        assert {"name", "cat", "ts", "dur", "pid", "tid"} <= event.keys()
+        assert isinstance(event["ts"], int) and event["dur"] >= 0
+    # Satu baris (tid) per halaman, dinamai lewat event metadata thread_name
+    assert {event["args"]["name"]: event["tid"] for event in metadata if event["name"] == "thread_name"} == \
+        {"adventure_works": 1, "imdb": 2}
+    assert {(event["cat"], event["tid"]) for event in complete} == {("adventure_works", 1), ("imdb", 2)}
+
+    # Tahap anak berada di dalam rentang induknya (ts dibulatkan ke mikrodetik)
+    for number in range(3):
+        events = {event["name"]: event for event in complete if event["args"]["rerun"] == number}
+        for child, parent in [("filter", "show"), ("build_charts", "show"), ("customers", "build_charts")]:
+            child, parent = events[child], events[parent]
+            assert parent["ts"] <= child["ts"]
+            assert child["ts"] + child["dur"] <= parent["ts"] + parent["dur"] + 1
+        assert events["filter"]["args"]["rows_out"] == 40
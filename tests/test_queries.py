@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from page.cube import build_cube, cube_charts
+from page.queries import extract_query, query_charts, source_version
+from page.schema import compact_sales
+from conftest import insert_sales, sales_rows
+
+FILTERS = [
+    (None, None),
+    ([2011], None),
+    (None, ["Canada", "France"]),
+    ([2012, 2013], ["United States", "Germany"]),
+]
+
+
+def normalized(frame, key):
+    # Label grup sebagai string, urut, measure sebagai float; dtype per jalur boleh berbeda
+    frame = frame.reset_index() if key not in frame.columns else frame
+    frame = frame.assign(**{key: frame[key].astype(str)}).sort_values(key).set_index(key)
+    return frame.astype(np.float64)
+
+
+def baseline_charts(df, year_list, country_list):
+    # Perhitungan halaman sebelum cube/pushdown: filter baris lalu groupby pandas
+    mask = pd.Series(True, index=df.index)
+    if year_list is not None:
+        mask &= df["Year"].isin(year_list)
+    if country_list is not None:
+        mask &= df["SalesTerritoryCountry"].isin(country_list)
+    selection = df[mask]
+    return {
+        "kpis": (selection["SalesAmount"].count(), selection["SalesAmount"].sum(), selection["SalesAmount"].mean(),
+                 selection["EnglishProductCategoryName"].mode()[0]),
+        "country": selection.groupby("SalesTerritoryCountry")[["SalesAmount", "TotalProductCost"]].sum(),
+        "month": selection.groupby("Month", as_index=False)["OrderQuantity"].sum(),
+        "category": selection.groupby("EnglishProductCategoryName")[["OrderQuantity"]].sum(),
+        "gender": selection.groupby("Gender")[["OrderQuantity"]].sum(),
+    }
+
+
+@pytest.fixture
+def extract(aw_engine):
+    return pd.read_sql(extract_query(aw_engine), aw_engine)
+
+
+def test_extract_has_rows_without_category(extract):
+    assert extract["EnglishProductCategoryName"].isna().any()
+
+
+@pytest.mark.parametrize("year_list, country_list", FILTERS)
+def test_query_charts_match_cube_and_baseline(aw_engine, extract, year_list, country_list):
+    pushdown = query_charts(aw_engine, year_list, country_list)
+    cube = cube_charts(build_cube(compact_sales(extract, report=False)), year_list, country_list)
+    baseline = baseline_charts(extract, year_list, country_list)
+
+    for name, key in [("country", "SalesTerritoryCountry"), ("category", "EnglishProductCategoryName"),
+                      ("gender", "Gender"), ("month", "Month")]:
+        expected = normalized(baseline[name], key)
+        pd.testing.assert_frame_equal(normalized(pushdown[name], key), expected, check_exact=False)
+        pd.testing.assert_frame_equal(normalized(cube[name], key), expected, check_exact=False)
+
+    assert "None" not in normalized(pushdown["category"], "EnglishProductCategoryName").index
+    for kpis in (pushdown["kpis"], cube["kpis"]):
+        total_sales, total_sales_amount, average_sales, top_category = kpis
+        assert total_sales == baseline["kpis"][0]
+        assert total_sales_amount == pytest.approx(baseline["kpis"][1])
+        assert average_sales == pytest.approx(baseline["kpis"][2])
+        assert top_category == baseline["kpis"][3]
+
+
+def test_source_version_follows_new_sales(aw_db, aw_engine):
+    version = source_version(aw_engine)
+    assert version == source_version(aw_engine) == "2014-04-12T00:00:00/400"
+    insert_sales(aw_db, sales_rows(1, start=400))
+    assert source_version(aw_engine) == "2014-04-15T00:00:00/401"
@@ -0,0 +1,104 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import insert_sales, sales_rows
+from page.aggregate import aggregate_customers
+from page.cube import build_cube, cube_charts
+from page.filters import build_index, extend_index, select_positions
+from page.queries import customer_names_query, extract_query
+from page.refresh import SalesStore
+
+SELECTIONS = [
+    {"Year": [2011]},
+    {"SalesTerritoryCountry": ["Canada", "France"]},
+    {"Year": [2012, 2013], "Gender": ["F"], "EnglishProductCategoryName": ["Bikes", None]},
+]
+
+
+def make_store(engine, snapshot_dir=None):
+    return SalesStore(engine, extract_query(engine), customer_query=customer_names_query(engine),
+                      snapshot_dir=snapshot_dir)
+
+
+def last_order(db_path):
+    with sqlite3.connect(db_path) as connection:
+        return connection.execute(
+            "SELECT SalesOrderNumber, OrderDate, ProductKey, CustomerKey, SalesTerritoryKey "
+            "FROM factinternetsales ORDER BY OrderDate DESC, SalesOrderNumber DESC LIMIT 1"
+        ).fetchone()
+
+
+def append_sales(db_path):
+    # Baris ke-2 untuk order terakhir yang sudah dimuat, order baru, dan customer baru
+    number, order_date, product, customer, territory = last_order(db_path)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute("INSERT INTO dimcustomer VALUES (51, 'First51', 'Last51', 'F', 45000.0)")
+    rows = [(number, 2, order_date, product, customer, territory, 120.5, 1, 60.25)]
+    rows += sales_rows(5, start=400, seed=1)
+    rows.append(("SO99999", 1, "2014-12-31 00:00:00", 3, 51, 2, 999.0, 2, 400.0))
+    insert_sales(db_path, rows)
+    return len(rows)
+
+
+def assert_index_matches(store):
+    rebuilt = build_index(store.df)
+    assert store.index["rows"] == rebuilt["rows"] == len(store.df)
+    for selections in SELECTIONS:
+        np.testing.assert_array_equal(select_positions(store.index, selections), select_positions(rebuilt, selections))
+    for column, bitmaps in rebuilt["bitmaps"].items():
+        assert set(store.index["bitmaps"][column]) == set(bitmaps)
+        for value, bitmap in bitmaps.items():
+            np.testing.assert_array_equal(store.index["bitmaps"][column][value], bitmap)
+
+    # Label CustomerKey boleh berbeda urutan, hasil agregasinya harus sama
+    def customers(index):
+        chart = aggregate_customers(store.df, index["codes"]["CustomerKey"], names=store.customers)
+        return chart.sort_values("CustomerKey").reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(customers(store.index), customers(rebuilt))
+
+
+def test_refresh_fetches_new_lines_of_loaded_order(aw_db, aw_engine):
+    store = make_store(aw_engine)
+    store.load()
+    loaded = len(store.df)
+    assert store.watermark[2] == 1
+
+    added = append_sales(aw_db)
+    assert store.refresh() == added
+    assert len(store.df) == loaded + added
+    last_date, last_number, last_line = store.watermark
+    assert (pd.Timestamp(last_date), last_number, last_line) == (pd.Timestamp("2014-12-31"), "SO99999", 1)
+    assert store.refresh() == 0
+
+    full = pd.read_sql(extract_query(aw_engine), aw_engine)
+    assert len(store.df) == len(full)
+    assert_index_matches(store)
+    expected = cube_charts(build_cube(store.df))
+    actual = cube_charts(store.cube)
+    for name in ["country", "category", "gender"]:
+        pd.testing.assert_frame_equal(actual[name], expected[name], check_exact=False)
+
+
+def test_snapshot_restore_applies_delta(aw_db, aw_engine, tmp_path):
+    snapshot_dir = str(tmp_path / "snapshot")
+    make_store(aw_engine, snapshot_dir).load()
+
+    added = append_sales(aw_db)
+    store = make_store(aw_engine, snapshot_dir)
+    store.load()
+    assert len(store.df) == 400 + added
+    assert_index_matches(store)
+
+
+@pytest.mark.parametrize("rows", [0, 3, 8, 13])
+def test_extend_index_across_byte_boundaries(rows):
+    df = pd.DataFrame({"Year": np.arange(rows + 11) % 3 + 2011, "CustomerKey": np.arange(rows + 11) % 5})
+    index = extend_index(build_index(df.iloc[:rows], ["Year"]), df.iloc[rows:])
+    rebuilt = build_index(df, ["Year"])
+    for year in [2011, 2012, 2013]:
+        np.testing.assert_array_equal(select_positions(index, {"Year": [year]}),
+                                      select_positions(rebuilt, {"Year": [year]}))
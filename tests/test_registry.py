@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from page.registry import DatasetRegistry, incremental_bytes
+
+
+@pytest.fixture
+def registry():
+    registry = DatasetRegistry()
+    registry.get("movies", lambda: pd.DataFrame({
+        "Year": np.arange(2000, 2010),
+        "Gross_World": np.linspace(1e6, 1e7, 10),
+        "Rating": pd.Categorical(list("GRGRGRPGRG")),
+        "Open_Week_Date": pd.date_range("2000-01-01", periods=10),
+        "Name": [f"Movie {i}" for i in range(10)],
+    }))
+    return registry
+
+
+def test_shared_dataset_is_read_only(registry):
+    shared = registry.get("movies", None)
+    with pytest.raises(ValueError, match="read-only"):
+        shared.loc[0, "Gross_World"] = 0.0
+    with pytest.raises(ValueError, match="read-only"):
+        shared["Year"].to_numpy().base[0] = 0
+    assert shared["Rating"].array.codes.flags.writeable is False
+
+
+def test_views_copy_on_write(registry):
+    shared = registry.get("movies", None)
+    first, second = registry.view("movies"), registry.view("movies")
+    assert incremental_bytes(first, registry.shared_frames()) == 0
+
+    first.loc[0, "Gross_World"] = 0.0
+    first["Budget"] = first["Gross_World"] / 2
+    second["Year"] += 1
+    assert shared.loc[0, "Gross_World"] == 1e6 and shared["Year"].iloc[0] == 2000
+    assert second.loc[0, "Gross_World"] == 1e6 and "Budget" not in second
+    # Hanya kolom yang diubah/ditambah yang dihitung sebagai memori sesi
+    assert incremental_bytes(first, registry.shared_frames()) == 2 * 10 * 8
+    assert incremental_bytes(second, registry.shared_frames()) == 10 * 8
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from page.schema import compact_sales, concat_compact
+
+
+def chunk(countries, months, quantities, incomes, customers):
+    return compact_sales(pd.DataFrame({
+        "SalesTerritoryCountry": countries,
+        "Month": months,
+        "OrderQuantity": quantities,
+        "CustomerKey": customers,
+        "YearlyIncome": incomes,
+        "SalesAmount": [10.1234, 20.5, 30.25],
+    }), report=False)
+
+
+def test_compact_dtypes():
+    frame = chunk(["Canada", "France", "Canada"], ["March", "January", "March"], [1, 2, 3],
+                  [30000.0, 60000.0, 10000.0], [11000, 11001, 11002])
+    assert isinstance(frame["SalesTerritoryCountry"].dtype, pd.CategoricalDtype)
+    assert frame["Month"].cat.ordered is False and frame["Month"].cat.categories[0] == "January"
+    assert frame["OrderQuantity"].dtype == np.int8 and frame["CustomerKey"].dtype == np.int16
+    # YearlyIncome bulat muat di float32, nilai uang 4 desimal tetap float64
+    assert frame["YearlyIncome"].dtype == np.float32 and frame["SalesAmount"].dtype == np.float64
+
+
+def test_concat_unions_categories_and_widens_integers():
+    first = chunk(["Canada", "France", "Canada"], ["March", "January", "March"], [1, 2, 3],
+                  [30000.0, 60000.0, 10000.0], [11000, 11001, 11002])
+    second = chunk(["Germany", "Canada", "Australia"], ["May", "May", "March"], [1, 400, 2],
+                   [30000.123, 1.0, 2.0], [11003, 70000, 11004])
+    assert second["OrderQuantity"].dtype == np.int16 and second["CustomerKey"].dtype == np.int32
+
+    combined = concat_compact([first, second])
+    countries = combined["SalesTerritoryCountry"]
+    assert isinstance(countries.dtype, pd.CategoricalDtype)
+    assert set(countries.cat.categories) == {"Australia", "Canada", "France", "Germany"}
+    assert countries.tolist() == ["Canada", "France", "Canada", "Germany", "Canada", "Australia"]
+    assert combined["Month"].tolist() == ["March", "January", "March", "May", "May", "March"]
+    assert list(combined["Month"].cat.categories[:5]) == ["January", "February", "March", "April", "May"]
+
+    assert combined["OrderQuantity"].dtype == np.int16 and combined["CustomerKey"].dtype == np.int32
+    assert combined["OrderQuantity"].tolist() == [1, 2, 3, 1, 400, 2]
+    assert combined["CustomerKey"].tolist()[-2:] == [70000, 11004]
+    assert combined["YearlyIncome"].dtype == np.float64 and combined["YearlyIncome"].iloc[3] == 30000.123
+    # Frame masukan tidak diubah
+    assert first["OrderQuantity"].dtype == np.int8 and len(first["SalesTerritoryCountry"].cat.categories) == 2
@@ -0,0 +1,170 @@
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urljoin, urlsplit
+
+import pandas as pd
+import pytest
+
+from scraper import fetch
+from scraper.cache import PageCache
+from scraper.extract import extract_summary
+from scraper.fetch import Fetcher
+from scraper.top250 import CHART_DEFAULTS, CHART_PATH, scrape_details, scrape_top250
+
+# Halaman IMDb tersimpan di tests/fixtures/imdb dengan tata letak path situs aslinya,
+# dilayani http.server seperti `scrape_imdb.py --base-url http://localhost:8000`.
+# Detail Shawshank memakai __NEXT_DATA__, Godfather section HTML + JSON-LD, Dark Knight
+# hanya section HTML.
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "imdb")
+
+EXPECTED = pd.DataFrame({
+    "Name": ["1. The Shawshank Redemption", "2. The Godfather", "3. The Dark Knight"],
+    "Year": ["1994", "1972", "2008"],
+    "Durasi(Menit)": [142, 175, 152],
+    "Rating": ["R", "R", "PG-13"],
+    "tconst": ["tt0111161", "tt0068646", "tt0468569"],
+    "Budget": [25000000, 6000000, 185000000],
+    "Gross_US": [28767189, 136381073, 534987076],
+    "Opening_Week": [727327, 302393, 158411483],
+    "Open_Week_Date": ["1994-09-25 00:00:00", "1972-03-19 00:00:00", "2008-07-20 00:00:00"],
+    "Gross_World": [29332133, 250341816, 1009057329],
+    "Color": ["Color", "Color", "Color"],
+    "Sound_Mix": ["Dolby Digital", "Mono", "Dolby Digital"],
+    "Aspect_Ratio": ["1.85 : 1", "1.37 : 1", "2.39 : 1"],
+})
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    # faults: path -> daftar (status, headers) yang dikirim dulu sebelum file aslinya
+    def __init__(self, *args, server_state, **kwargs):
+        self.state = server_state
+        super().__init__(*args, directory=FIXTURES, **kwargs)
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        with self.state["lock"]:
+            self.state["requests"].append((path, self.headers.get("If-Modified-Since") is not None))
+            faults = self.state["faults"].get(path)
+            fault = faults.pop(0) if faults else None
+        if fault is None:
+            return super().do_GET()
+        status, headers = fault
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def imdb_server():
+    state = {"faults": {}, "requests": [], "lock": threading.Lock()}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(FixtureHandler, server_state=state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["chart_url"] = urljoin(f"http://127.0.0.1:{server.server_address[1]}", CHART_PATH)
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    # Jeda retry dicatat, tidak benar-benar ditunggu
+    delays = []
+    monkeypatch.setattr(fetch.time, "sleep", delays.append)
+    return delays
+
+
+def scrape(fetcher, chart_url):
+    frame = scrape_top250(fetcher, chart_url, workers=3, progress=None)
+    return frame.drop(columns="url")
+
+
+def requests_for(state, path):
+    return [conditional for requested, conditional in state["requests"] if requested == path]
+
+
+def test_scrape_top250_retries_and_honours_retry_after(imdb_server, sleeps):
+    imdb_server["faults"] = {
+        "/title/tt0068646/": [(503, {}), (502, {})],
+        "/title/tt0468569/": [(429, {"Retry-After": "7"})],
+    }
+    fetcher = Fetcher(rate=0, retries=3, backoff=0.5)
+    frame = scrape(fetcher, imdb_server["chart_url"])
+
+    pd.testing.assert_frame_equal(frame, EXPECTED[frame.columns])
+    assert len(requests_for(imdb_server, "/title/tt0068646/")) == 3
+    assert len(requests_for(imdb_server, "/title/tt0468569/")) == 2
+    assert fetcher.stats == {"network": 4, "not_modified": 0, "cached": 0, "rendered": 0}
+    # Retry-After dipakai apa adanya; 5xx memakai exponential backoff + jitter
+    assert sorted(sleeps)[-1] == 7.0
+    backoffs = sorted(sleeps)[:-1]
+    assert 0.5 <= backoffs[0] <= 1.0 and 1.0 <= backoffs[1] <= 1.5
+
+
+def test_failed_detail_keeps_chart_row_with_defaults(imdb_server, sleeps):
+    imdb_server["faults"] = {"/title/tt0111161/": [(500, {})] * 3}
+    errors = []
+    frame = scrape_top250(Fetcher(rate=0, retries=2, backoff=0.1), imdb_server["chart_url"], workers=2,
+                          progress=lambda done, total, movie, error: errors.append(error))
+
+    assert len(sleeps) == 2 and sum(error is not None for error in errors) == 1
+    shawshank = frame.iloc[0]
+    assert (shawshank["Name"], shawshank["Budget"], shawshank["Open_Week_Date"]) == \
+        ("1. The Shawshank Redemption", 0, "1900-01-01 00:00:00")
+    assert frame.iloc[1:]["Budget"].tolist() == [6000000, 185000000]
+
+
+def test_cache_revalidates_with_304_and_replays_offline(imdb_server, tmp_path):
+    cache_dir = str(tmp_path / "http_cache")
+    first = Fetcher(rate=0, cache=PageCache(cache_dir, ttl=None))
+    expected = scrape(first, imdb_server["chart_url"])
+    assert first.stats["network"] == 4
+
+    # ttl None: setiap halaman direvalidasi (If-Modified-Since) dan server menjawab 304
+    revalidated = Fetcher(rate=0, cache=PageCache(cache_dir, ttl=None))
+    pd.testing.assert_frame_equal(scrape(revalidated, imdb_server["chart_url"]), expected)
+    assert revalidated.stats == {"network": 0, "not_modified": 4, "cached": 0, "rendered": 0}
+    assert all(requests_for(imdb_server, path)[-1] for path, _ in imdb_server["requests"])
+
+    # Dalam ttl halaman dipakai tanpa request sama sekali
+    requested = len(imdb_server["requests"])
+    fresh = Fetcher(rate=0, cache=PageCache(cache_dir, ttl=3600))
+    pd.testing.assert_frame_equal(scrape(fresh, imdb_server["chart_url"]), expected)
+    assert fresh.stats["cached"] == 4 and len(imdb_server["requests"]) == requested
+
+    # Replay tidak menyentuh jaringan; halaman yang tidak ada di cache gagal jelas
+    replay = Fetcher(rate=0, cache=PageCache(cache_dir), replay=True)
+    pd.testing.assert_frame_equal(scrape(replay, imdb_server["chart_url"]), expected)
+    assert replay.stats["cached"] == 4 and len(imdb_server["requests"]) == requested
+    with pytest.raises(fetch.FetchError):
+        replay.get(urljoin(imdb_server["chart_url"], "/title/tt9999999/"))
+
+
+@pytest.mark.parametrize("tconst, summary", [
+    ("tt0111161", {"Name": "The Shawshank Redemption", "Year": "1994", "Durasi(Menit)": 142, "Rating": "R"}),
+    ("tt0068646", {"Name": "The Godfather", "Year": "1972", "Durasi(Menit)": 175, "Rating": "R"}),
+    ("tt0468569", None),
+])
+def test_extract_summary_from_structured_data(tconst, summary):
+    with open(os.path.join(FIXTURES, "title", tconst, "index.html"), encoding="utf-8") as f:
+        assert extract_summary(f.read()) == summary
+
+
+def test_scrape_details_fills_empty_chart_fields(imdb_server):
+    # Seperti chart JSON-LD: tanpa tahun; durasi dan rating kosong
+    movies = [{"Name": f"{rank}. {tconst}", **CHART_DEFAULTS, "url": urljoin(imdb_server["chart_url"], f"/title/{tconst}/")}
+              for rank, tconst in enumerate(["tt0111161", "tt0068646", "tt0468569"], start=1)]
+    movies[0]["Rating"] = "PG"
+    scrape_details(Fetcher(rate=0), movies, workers=3, progress=None)
+
+    assert [(movie["Year"], movie["Durasi(Menit)"], movie["Rating"]) for movie in movies] == \
+        [("1994", 142, "PG"), ("1972", 175, "R"), ("", 0, "Not Rated")]
+    assert movies[0]["Name"] == "1. tt0111161"
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from page.table import frame_pager
+
+
+@pytest.fixture
+def sales():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Year": rng.choice([2011, 2012, 2013, 2014], 1000),
+        "Gender": pd.Categorical(rng.choice(["F", "M"], 1000)),
+        "SalesAmount": rng.choice([np.nan, 10.0, 20.0], 1000),
+        "Row": np.arange(1000),
+    })
+
+
+@pytest.mark.parametrize("sort_by", ["Year", "Gender", "SalesAmount"])
+@pytest.mark.parametrize("ascending", [True, False])
+@pytest.mark.parametrize("page_size", [50, 250, 333])
+def test_pages_of_low_cardinality_sort_are_a_stable_sort(sales, sort_by, ascending, page_size):
+    columns, sortable, total, fetch = frame_pager(sales)
+    pages = [fetch(columns, sort_by, ascending, offset, page_size) for offset in range(0, total, page_size)]
+    rows = pd.concat(pages)["Row"].tolist()
+
+    # Setiap baris tepat sekali, urutan sama dengan sort stabil penuh (NaN di awal saat naik)
+    expected = sales.sort_values(sort_by, ascending=ascending, kind="stable",
+                                 na_position="first" if ascending else "last")["Row"].tolist()
+    assert sorted(rows) == list(range(total))
+    assert rows == expected
+
+
+def test_decorated_columns_are_not_sortable(sales):
+    columns, sortable, total, fetch = frame_pager(sales, lambda window: window.assign(Customer="x"))
+    assert "Customer" in columns and "Customer" not in sortable
+    assert fetch(["Row", "Customer"], None, True, 990, 50).shape == (10, 2)